@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark event loop lag while a large storingen page is parsed.
+
+Every disruption article of the fixture is repeated to simulate a busy outage
+day. While the page is parsed in a thread of the default executor, as Home
+Assistant does, and then in the parse worker process, a ticker on the event
+loop records how late its 5 ms sleeps wake up. A pure Python parse in a thread
+holds the GIL and delays the loop; the worker process leaves it free.
+
+Run from the repository root:
+
+    python benchmarks/bench_loop_lag.py [article copies] [rounds]
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import re
+import statistics
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from custom_components.ennatuurlijk_disruptions.parser_backends import (  # noqa: E402
+    BACKEND_HTML_PARSER,
+    BACKEND_STREAM,
+    get_backend,
+)
+from custom_components.ennatuurlijk_disruptions.process_parser import (  # noqa: E402
+    ParseWorker,
+)
+
+FIXTURE = ROOT / "tests" / "fixtures" / "ennatuurlijk_storingen.html"
+TICK = 0.005
+
+_ARTICLE_RE = re.compile(r"<article\b.*?</article>", re.DOTALL)
+
+
+def large_page(copies: int) -> bytes:
+    """Return the fixture with every article repeated ``copies`` times."""
+    html = FIXTURE.read_text(encoding="utf-8")
+    return _ARTICLE_RE.sub(lambda match: match.group(0) * copies, html).encode()
+
+
+async def measure(parse, rounds: int) -> tuple[float, float, float]:
+    """Return (mean parse ms, p50 lag ms, max lag ms) of parsing in an executor."""
+    loop = asyncio.get_running_loop()
+    lags: list[float] = []
+    done = False
+
+    async def ticker() -> None:
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append((time.perf_counter() - start - TICK) * 1000)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK * 4)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await loop.run_in_executor(None, parse)
+    elapsed = (time.perf_counter() - start) / rounds * 1000
+    done = True
+    await task
+    return elapsed, statistics.median(lags), max(lags)
+
+
+async def main() -> None:
+    """Print the benchmark table."""
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    raw = large_page(copies)
+    worker = ParseWorker(timeout=120)
+
+    print(f"{FIXTURE.name} x{copies} articles: {len(raw)} bytes, {rounds} rounds")
+    print(f"{'backend':<14} {'mode':<8} {'parse ms':>10} {'lag p50 ms':>11} {'lag max ms':>11}")
+    try:
+        for name in (BACKEND_HTML_PARSER, BACKEND_STREAM):
+            backend = get_backend(name)
+            worker.start(name)
+            cases = (
+                ("thread", lambda: backend.parse_bytes(raw, "utf-8")),
+                ("process", lambda: worker.parse(raw, "utf-8", name)),
+            )
+            for mode, parse in cases:
+                elapsed, p50, worst = await measure(parse, rounds)
+                print(f"{name:<14} {mode:<8} {elapsed:>10.1f} {p50:>11.2f} {worst:>11.2f}")
+    finally:
+        worker.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark parsing the storingen page fixture.
+
+Reports the mean parse time and the peak Python heap of building the tree for
+every installed backend, with the html.parser tree built for the whole page
+and restricted to the disruption sections.
+
+Run from the repository root:
+
+    python benchmarks/bench_parser.py [rounds]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from custom_components.ennatuurlijk_disruptions.parser_backends import (  # noqa: E402
+    BACKENDS,
+    HtmlParserBackend,
+    ParserBackend,
+)
+
+FIXTURE = ROOT / "tests" / "fixtures" / "ennatuurlijk_storingen.html"
+
+
+def measure(backend: ParserBackend, html: str, rounds: int) -> tuple[float, float, int]:
+    """Return (mean ms, peak KiB, article count) for a backend."""
+    backend.parse_page(html)  # warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        articles = backend.parse_page(html)
+    elapsed = (time.perf_counter() - start) / rounds * 1000
+
+    tracemalloc.start()
+    tree = backend.build_tree(html)
+    peak = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    del tree
+    return elapsed, peak, len(articles)
+
+
+def main() -> None:
+    """Print the benchmark table."""
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    html = FIXTURE.read_text(encoding="utf-8")
+    cases: list[tuple[str, ParserBackend]] = [
+        ("html.parser (full page)", HtmlParserBackend(restrict_sections=False)),
+        ("html.parser (sections only)", HtmlParserBackend()),
+    ]
+    cases += [
+        (name, backend())
+        for name, backend in BACKENDS.items()
+        if backend is not HtmlParserBackend and backend.available()
+    ]
+
+    print(f"{FIXTURE.name}: {len(html)} characters, {rounds} rounds")
+    print(f"{'backend':<30} {'parse ms':>10} {'tree KiB':>10} {'articles':>9}")
+    for label, backend in cases:
+        elapsed, peak, count = measure(backend, html, rounds)
+        print(f"{label:<30} {elapsed:>10.2f} {peak:>10.1f} {count:>9}")
+    print("tree KiB is the traced Python heap; lxml and selectolax trees live in C")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Estimate the recorder database growth of one location's attributes.
+
+Builds the sensor and binary sensor attributes for a section with a growing
+number of disruptions and reports the bytes the recorder stores per state
+write, with every attribute recorded and uncapped (the old behaviour) and
+with the unrecorded ``dates`` list left out. The recorder deduplicates
+identical attribute rows, so a new row is only stored when the page changes;
+the per day figure assumes a change on every poll.
+
+Run from the repository root:
+
+    python benchmarks/bench_recorder.py [polls per day]
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from homeassistant.helpers.json import json_bytes  # noqa: E402
+
+from custom_components.ennatuurlijk_disruptions.binary_sensor_types import (  # noqa: E402
+    BINARY_SENSOR_TYPES,
+)
+from custom_components.ennatuurlijk_disruptions.const import (  # noqa: E402
+    ATTR_DATES,
+    DEFAULT_MAX_LISTED_DISRUPTIONS,
+)
+from custom_components.ennatuurlijk_disruptions.models import Disruption  # noqa: E402
+from custom_components.ennatuurlijk_disruptions.sensor_types import (  # noqa: E402
+    SENSOR_TYPES,
+)
+from custom_components.ennatuurlijk_disruptions.views import (  # noqa: E402
+    build_section_view,
+)
+
+TODAY = date(2025, 10, 30)
+
+
+def section(count: int) -> dict:
+    """Return a coordinator section with ``count`` disruptions."""
+    return {
+        "state": count > 0,
+        "dates": [
+            Disruption(
+                108000 + i,
+                "planned",
+                f"Storing {5000 + i} AB - Tilburg",
+                TODAY + timedelta(days=i),
+                f"https://ennatuurlijk.nl/storingen/{108000 + i}",
+            )
+            for i in range(count)
+        ],
+        "last_update_date": "2025-10-30 12:00",
+    }
+
+
+def recorded_bytes(count: int, max_listed: int, unrecorded: frozenset) -> int:
+    """Return the attribute bytes recorded for one write of every entity."""
+    total = 0
+    view = build_section_view(section(count), TODAY, max_listed)
+    for description in SENSOR_TYPES:
+        attrs = description.attributes_fn(view, description.name)
+        total += len(json_bytes({k: v for k, v in attrs.items() if k not in unrecorded}))
+    for description in BINARY_SENSOR_TYPES:
+        attrs = description.attributes_fn(view)
+        total += len(json_bytes({k: v for k, v in attrs.items() if k not in unrecorded}))
+    return total
+
+
+def main() -> None:
+    """Print the benchmark table."""
+    polls = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    print(f"6 entities per location, {polls} changed polls per day")
+    print(f"{'disruptions':>11} {'before B/day':>13} {'after B/day':>12} {'saved':>7}")
+    for count in (0, 1, 5, 10, 25, 50, 100):
+        before = recorded_bytes(count, max(count, 1), frozenset()) * polls
+        after = (
+            recorded_bytes(count, DEFAULT_MAX_LISTED_DISRUPTIONS, frozenset({ATTR_DATES}))
+            * polls
+        )
+        saved = 1 - after / before if before else 0
+        print(f"{count:>11} {before:>13} {after:>12} {saved:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry  # type: ignore
-from homeassistant.core import HomeAssistant  # type: ignore
+from homeassistant.core import HomeAssistant, callback  # type: ignore
 from homeassistant.helpers import config_validation as cv  # type: ignore
 from homeassistant.const import Platform
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
 
-from .const import DOMAIN
-from .coordinator import create_coordinator
+from .const import (
+    CONF_CREATE_ALERT_SENSORS,
+    CONF_MAX_PAGE_SIZE,
+    CONF_PARSE_IN_PROCESS,
+    CONF_PARSER_BACKEND,
+    DEFAULT_MAX_PAGE_SIZE,
+    DEFAULT_PARSE_IN_PROCESS,
+    DEFAULT_PARSER_BACKEND,
+    DOMAIN,
+    FIRST_REFRESH_CONCURRENCY,
+    FIRST_REFRESH_DEADLINE_SECONDS,
+    SIGNAL_LOCATION_ADDED,
+    SIGNAL_LOCATION_REMOVED,
+)
+from .coordinator import EnnatuurlijkCoordinator, create_coordinator
+from .event_log import EventLog
+from .hub import EnnatuurlijkPageHub
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,25 +111,152 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     coordinators: dict[str, object] = {}
 
+    # One page hub per config entry: all locations share a single fetch and parse
+    hub = EnnatuurlijkPageHub(
+        hass,
+        entry.entry_id,
+        entry.options.get(CONF_PARSER_BACKEND, DEFAULT_PARSER_BACKEND),
+        entry.options.get(CONF_PARSE_IN_PROCESS, DEFAULT_PARSE_IN_PROCESS),
+        entry.options.get(CONF_MAX_PAGE_SIZE, DEFAULT_MAX_PAGE_SIZE),
+    )
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = hub
+    entry.async_on_unload(hub.async_shutdown)
+    if entry.options.get(CONF_PARSE_IN_PROCESS, DEFAULT_PARSE_IN_PROCESS):
+        # Warm up the worker process while the cached page is loaded
+        entry.async_create_background_task(
+            hass, hub.async_start_worker(), f"{DOMAIN} parse worker start"
+        )
+    cached_page = await hub.async_load()
+
     # Set up coordinators for all existing location subentries
     for subentry_id, subentry in subentries.items():
         _LOGGER.debug("Processing subentry %s: type=%s, data=%s", subentry_id, subentry.subentry_type, subentry.data)
         if subentry.subentry_type == "location":
             # Create coordinator from subentry, passing main entry for global settings
-            coordinator = create_coordinator(hass, subentry, main_entry=entry)
+            coordinator = create_coordinator(hass, subentry, main_entry=entry, hub=hub)
             _LOGGER.info("Created coordinator for subentry %s (%s %s)", subentry_id, subentry.data.get("town"), subentry.data.get("postal_code"))
-            _LOGGER.debug("Initial data refresh for subentry %s", subentry_id)
-            await coordinator.async_config_entry_first_refresh()
-            _LOGGER.debug("Initial refresh successful for subentry %s", subentry_id)
+            if cached_page is not None:
+                # Warm start from the persisted page, refresh from the network in the background
+                _LOGGER.debug("Seeding subentry %s from cached page", subentry_id)
+                coordinator.async_set_updated_data(coordinator.build_data(cached_page))
+                entry.async_create_background_task(
+                    hass,
+                    coordinator.async_refresh(),
+                    f"{DOMAIN} initial refresh {subentry_id}",
+                )
             coordinators[subentry_id] = coordinator
 
+    if cached_page is None and coordinators:
+        await _async_first_refresh(hass, entry, coordinators)
+
     _LOGGER.info("Created %d coordinators for entry %s", len(coordinators), entry.entry_id)
 
     # Store coordinators in runtime_data
     entry.runtime_data = coordinators
 
-    # Add reload listener for when subentries are added/removed
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    @callback
+    def _async_day_rollover(now) -> None:
+        """Recompute day relative attributes at local midnight, without fetching."""
+        _LOGGER.debug("Day rollover for entry %s", entry.entry_id)
+        for coordinator in coordinators.values():
+            coordinator.async_day_rollover()
+        # A planned disruption may start today, which tightens polling
+        if coordinators:
+            coordinator = next(iter(coordinators.values()))
+            hub.async_schedule(coordinator, coordinator.data)
+
+    entry.async_on_unload(
+        async_track_time_change(hass, _async_day_rollover, hour=0, minute=0, second=0)
+    )
+
+    applied_options = dict(entry.options)
+
+    async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Apply location and option changes without reloading the entry.
+
+        Only the coordinators of added or removed locations are created or
+        disposed, and the parsed page is kept. Changes that alter the set of
+        entities of existing locations still reload the entry.
+        """
+        nonlocal applied_options
+        locations = {
+            subentry_id: subentry
+            for subentry_id, subentry in entry.subentries.items()
+            if subentry.subentry_type == "location"
+        }
+        if entry.options.get(CONF_CREATE_ALERT_SENSORS) != applied_options.get(
+            CONF_CREATE_ALERT_SENSORS
+        ) or any(
+            subentry_id in locations
+            and locations[subentry_id].data != coordinator.entry.data
+            for subentry_id, coordinator in coordinators.items()
+        ):
+            await async_reload_entry(hass, entry)
+            return
+
+        for subentry_id in [key for key in coordinators if key not in locations]:
+            coordinator = coordinators.pop(subentry_id)
+            hub.async_unregister(coordinator)
+            await coordinator.async_shutdown()
+            _LOGGER.info("Removed coordinator for subentry %s", subentry_id)
+            async_dispatcher_send(
+                hass, SIGNAL_LOCATION_REMOVED.format(entry.entry_id), subentry_id
+            )
+
+        added = {
+            subentry_id: create_coordinator(hass, subentry, main_entry=entry, hub=hub)
+            for subentry_id, subentry in locations.items()
+            if subentry_id not in coordinators
+        }
+        if added:
+            # The page was prefiltered for the other locations
+            await hub.async_reparse()
+            if hub.page is not None and not hub.needs_reparse:
+                # Served from the page the other locations already use
+                for coordinator in added.values():
+                    coordinator.async_set_updated_data(coordinator.build_data(hub.page))
+            else:
+                try:
+                    await _async_first_refresh(hass, entry, added)
+                except ConfigEntryNotReady as err:
+                    # The entry stays loaded; the new locations retry on their interval
+                    _LOGGER.warning(
+                        "Added locations are unavailable until the next refresh: %s", err
+                    )
+            coordinators.update(added)
+            for subentry_id, coordinator in added.items():
+                # Join the shared polling interval; the timer starts with the
+                # first entity listening, also for a location without data
+                hub.async_schedule(coordinator, coordinator.data)
+                _LOGGER.info("Added coordinator for subentry %s", subentry_id)
+                async_dispatcher_send(
+                    hass, SIGNAL_LOCATION_ADDED.format(entry.entry_id), subentry_id, coordinator
+                )
+
+        if dict(entry.options) != applied_options:
+            applied_options = dict(entry.options)
+            hub.async_set_backend(
+                entry.options.get(CONF_PARSER_BACKEND, DEFAULT_PARSER_BACKEND)
+            )
+            hub.async_set_parse_in_process(
+                entry.options.get(CONF_PARSE_IN_PROCESS, DEFAULT_PARSE_IN_PROCESS)
+            )
+            hub.async_set_max_page_size(
+                entry.options.get(CONF_MAX_PAGE_SIZE, DEFAULT_MAX_PAGE_SIZE)
+            )
+            for coordinator in coordinators.values():
+                coordinator.async_apply_options()
+            if coordinators:
+                coordinator = next(iter(coordinators.values()))
+                hub.async_schedule(coordinator, coordinator.data)
+                # A longer solved retention needs solved disruptions that
+                # the current page was parsed without
+                await hub.async_reparse()
+                if hub.needs_reparse:
+                    await coordinator.async_refresh()
+
+    # Apply subentry and option changes in place
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
 
     # Set up platforms for all subentries
     _LOGGER.info("Setting up platforms: %s", PLATFORMS)
@@ -119,12 +266,70 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_first_refresh(
+    hass: HomeAssistant, entry: ConfigEntry, coordinators: dict[str, EnnatuurlijkCoordinator]
+) -> None:
+    """Refresh all locations concurrently, bounded in parallelism and time.
+
+    The locations share one page fetch through the hub. A location that fails
+    is unavailable and retries on its own interval, and one still refreshing
+    at the deadline finishes in the background. Setup is only retried as a
+    whole when no location got data.
+    """
+    semaphore = asyncio.Semaphore(FIRST_REFRESH_CONCURRENCY)
+
+    async def _async_refresh(subentry_id: str, coordinator: EnnatuurlijkCoordinator) -> None:
+        async with semaphore:
+            start = time.monotonic()
+            await coordinator.async_refresh()
+        _LOGGER.debug(
+            "Initial refresh of subentry %s (%s %s) %s in %.2fs",
+            subentry_id,
+            coordinator.town,
+            coordinator.postal_code,
+            "succeeded" if coordinator.last_update_success else "failed",
+            time.monotonic() - start,
+        )
+
+    start = time.monotonic()
+    tasks = [
+        entry.async_create_background_task(
+            hass,
+            _async_refresh(subentry_id, coordinator),
+            f"{DOMAIN} initial refresh {subentry_id}",
+        )
+        for subentry_id, coordinator in coordinators.items()
+    ]
+    _, pending = await asyncio.wait(tasks, timeout=FIRST_REFRESH_DEADLINE_SECONDS)
+    _LOGGER.info(
+        "Initial refresh of %d locations took %.2fs",
+        len(coordinators),
+        time.monotonic() - start,
+    )
+    if pending:
+        _LOGGER.warning(
+            "%d of %d locations are still refreshing after %ss, continuing in the background",
+            len(pending),
+            len(coordinators),
+            FIRST_REFRESH_DEADLINE_SECONDS,
+        )
+        return
+    if not any(coordinator.last_update_success for coordinator in coordinators.values()):
+        raise ConfigEntryNotReady("Could not fetch disruptions for any location")
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload integration when subentries are added/removed."""
-    _LOGGER.info("Reloading Ennatuurlijk Disruptions entry due to subentry changes: %s", entry.entry_id)
+    """Reload integration when the entities of existing locations change."""
+    _LOGGER.info("Reloading Ennatuurlijk Disruptions entry: %s", entry.entry_id)
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted page cache and event log when the entry is deleted."""
+    await EnnatuurlijkPageHub(hass, entry.entry_id).async_remove_store()
+    await EventLog(hass, entry.entry_id).async_remove_store()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -133,5 +338,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Clear runtime_data to ensure clean reload
         _LOGGER.debug("Clearing runtime_data for entry %s during unload", entry.entry_id)
         entry.runtime_data = {}
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     
     return unload_ok
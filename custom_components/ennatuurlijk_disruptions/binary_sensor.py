@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     CONF_CREATE_ALERT_SENSORS,
     DEFAULT_CREATE_ALERT_SENSORS,
+    SIGNAL_LOCATION_ADDED,
 )
 from .entity import EnnatuurlijkBinarySensor
 from .binary_sensor_types import BINARY_SENSOR_TYPES
@@ -29,21 +31,9 @@ async def async_setup_entry(
         entry.entry_id,
     )
 
-    # Get coordinators from runtime_data
-    coordinators = entry.runtime_data
-    
-    _LOGGER.debug(
-        "Found %d coordinators for binary sensors, entry %s: %s", 
-        len(coordinators), 
-        entry.entry_id,
-        list(coordinators.keys())
-    )
-
-    if not coordinators:
-        _LOGGER.info("No location subentries found, no binary sensors to create for entry: %s", entry.entry_id)
-        return
-
-    for subentry_id, coordinator in coordinators.items():
+    @callback
+    def _async_add_location(subentry_id: str, coordinator) -> None:
+        """Create the binary sensors of one location."""
         # Get the subentry object
         subentry = entry.subentries[subentry_id]
 
@@ -55,7 +45,7 @@ async def async_setup_entry(
 
         if not create_alert_sensors:
             _LOGGER.info("Alert sensors disabled for subentry: %s", subentry_id)
-            continue
+            return
 
         _LOGGER.info("Creating binary sensors for subentry %s (%s)", subentry_id, subentry.data.get("town", "Unknown"))
 
@@ -70,4 +60,28 @@ async def async_setup_entry(
         # Add entities with proper subentry association (following NS pattern)
         async_add_entities(sensors, config_subentry_id=subentry_id)
 
+    # Locations added later get their binary sensors without reloading the entry
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_LOCATION_ADDED.format(entry.entry_id), _async_add_location
+        )
+    )
+
+    # Get coordinators from runtime_data
+    coordinators = entry.runtime_data
+    
+    _LOGGER.debug(
+        "Found %d coordinators for binary sensors, entry %s: %s", 
+        len(coordinators), 
+        entry.entry_id,
+        list(coordinators.keys())
+    )
+
+    if not coordinators:
+        _LOGGER.info("No location subentries found, no binary sensors to create for entry: %s", entry.entry_id)
+        return
+
+    for subentry_id, coordinator in coordinators.items():
+        _async_add_location(subentry_id, coordinator)
+
     _LOGGER.info("Binary sensor setup completed for entry: %s", entry.entry_id)
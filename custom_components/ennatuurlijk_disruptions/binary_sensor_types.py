@@ -7,22 +7,30 @@ from .const import (
     ATTR_ERROR,
     ATTR_FRIENDLY_NAME,
     ATTR_LAST_UPDATE,
+    ATTR_DATES,
+    ATTR_DATES_TRUNCATED,
+    ATTR_DISRUPTION_COUNT,
+    ATTR_SUMMARY,
 )
 from .entity import EnnatuurlijkBinarySensorEntityDescription
+from .views import SectionView
 
 
-def _alert_is_on_fn(data: dict) -> bool:
+def _alert_is_on_fn(view: SectionView) -> bool:
     """Return True if alert is on."""
-    return bool(data.get("state"))
+    return view.state
 
 
-def _alert_attributes_fn(data: dict) -> dict:
+def _alert_attributes_fn(view: SectionView) -> dict:
     """Return alert sensor attributes."""
     return {
         ATTR_ERROR: False,
-        ATTR_FRIENDLY_NAME: data.get("friendly_name", ""),
-        ATTR_LAST_UPDATE: data.get("last_update_date"),
-        "dates": data.get("dates", []),
+        ATTR_FRIENDLY_NAME: "",
+        ATTR_LAST_UPDATE: view.last_update_date,
+        ATTR_DATES: view.date_dicts,
+        ATTR_DATES_TRUNCATED: view.truncated,
+        ATTR_DISRUPTION_COUNT: view.count,
+        ATTR_SUMMARY: view.summary,
         "icon": "mdi:alert",
     }
 
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from homeassistant.components.calendar import CalendarEntity, CalendarEvent  # type: ignore
+from homeassistant.components.calendar import CalendarEntity  # type: ignore
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util  # type: ignore
-from datetime import datetime, timedelta
-import re
-from .const import DOMAIN, _LOGGER
+from datetime import timedelta
+from .calendar_index import CalendarIndex, merge_disruptions
+from .const import DOMAIN, SIGNAL_LOCATION_ADDED, SIGNAL_LOCATION_REMOVED, _LOGGER
+from .event_log import EventLog
 
 
 async def async_setup_entry(
@@ -21,9 +23,20 @@ async def async_setup_entry(
     # Only create calendar if this entry has subentries (coordinators)
     if not hasattr(entry, "runtime_data") or not entry.runtime_data:
         _LOGGER.debug(
-            "No subentries found, skipping calendar creation for entry: %s",
+            "No subentries found, deferring calendar creation for entry: %s",
             entry.entry_id,
         )
+
+        @callback
+        def _async_first_location_added(subentry_id: str, coordinator) -> None:
+            """Create the calendar once the first location is added."""
+            unsub()
+            async_add_entities([EnnatuurlijkDisruptionsCalendar(hass, entry)])
+
+        unsub = async_dispatcher_connect(
+            hass, SIGNAL_LOCATION_ADDED.format(entry.entry_id), _async_first_location_added
+        )
+        entry.async_on_unload(unsub)
         return
 
     _LOGGER.debug(
@@ -35,6 +48,9 @@ async def async_setup_entry(
 class EnnatuurlijkDisruptionsCalendar(CalendarEntity):
     _attr_icon = "mdi:calendar-alert"
     _attr_has_entity_name = False
+    # State follows coordinator updates and the start and end alarms that
+    # CalendarEntity sets for the next event
+    _attr_should_poll = False
 
     def __init__(self, hass, main_entry):
         super().__init__()
@@ -42,105 +58,126 @@ class EnnatuurlijkDisruptionsCalendar(CalendarEntity):
         self.main_entry = main_entry
         self._attr_unique_id = f"{DOMAIN}_calendar"
         self._attr_name = "Ennatuurlijk Disruptions Calendar"
-        self._event_logs = {}  # {disruption_id: [log entries]}
+        # Status transitions of the disruptions, persisted per main entry
+        self._event_log = EventLog(hass, getattr(main_entry, "entry_id", None))
+        self._index: CalendarIndex | None = None
+        self._index_sources: list[tuple] = []
+        # Next upcoming event, valid until _next_event_expires
+        self._next_event = None
+        self._next_event_expires = None
+        # Listeners on the coordinator of each location, by subentry id
+        self._coordinator_unsubs: dict[str, CALLBACK_TYPE] = {}
         # No device_info - this calendar is a standalone entity not linked to any device
 
     @property
     def event(self):
+        """Return the next upcoming event from the cached pointer."""
+        if self._next_event_expires is None or dt_util.now() >= self._next_event_expires:
+            self._update_next_event()
+        return self._next_event
+
+    def _update_next_event(self) -> None:
+        """Point at the first event starting in the coming year.
+
+        The pointer expires at the end of that event's start day, or at the
+        next midnight if there is no event.
+        """
         today = dt_util.now().date()
-        events = self._get_events(today, today + timedelta(days=365))
-        return events[0] if events else None
+        index = self._get_index()
+        window = index.window(today, today + timedelta(days=365))
+        if window:
+            self._next_event = index.event(window[0])
+            last_day = index.spans[window[0]].start
+        else:
+            self._next_event = None
+            last_day = today
+        self._next_event_expires = dt_util.start_of_local_day(last_day + timedelta(days=1))
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the coordinators of all locations."""
+        await super().async_added_to_hass()
+        await self._event_log.async_load()
+        self._event_log.async_record(self._get_index().spans)
+        for subentry_id, coordinator in self.main_entry.runtime_data.items():
+            self._async_follow(subentry_id, coordinator)
+        entry_id = self.main_entry.entry_id
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_LOCATION_ADDED.format(entry_id),
+                self._async_location_added,
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_LOCATION_REMOVED.format(entry_id),
+                self._async_location_removed,
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the coordinator listeners."""
+        await super().async_will_remove_from_hass()
+        for unsub in self._coordinator_unsubs.values():
+            unsub()
+        self._coordinator_unsubs.clear()
+
+    @callback
+    def _async_follow(self, subentry_id: str, coordinator) -> None:
+        """Listen for new data of a location's coordinator."""
+        if subentry_id not in self._coordinator_unsubs:
+            self._coordinator_unsubs[subentry_id] = coordinator.async_add_listener(
+                self._handle_coordinator_update
+            )
+
+    @callback
+    def _async_location_added(self, subentry_id: str, coordinator) -> None:
+        """Include a location added to the running entry."""
+        self._async_follow(subentry_id, coordinator)
+        self._handle_coordinator_update()
+
+    @callback
+    def _async_location_removed(self, subentry_id: str) -> None:
+        """Drop a location removed from the running entry."""
+        if unsub := self._coordinator_unsubs.pop(subentry_id, None):
+            unsub()
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Log transitions and recompute the next event for new coordinator data."""
+        self._event_log.async_record(self._get_index().spans)
+        self._next_event_expires = None
+        self.async_write_ha_state()
 
     async def async_get_events(self, hass, start_date, end_date):
         return self._get_events(start_date.date(), end_date.date())
 
-    def _get_events(self, start_date, end_date):
-        # Aggregate disruptions from all subentries coordinators
-        disruptions_by_id = {}
-
+    def _get_index(self) -> CalendarIndex:
+        """Return the span index, rebuilt only when a coordinator has new data."""
         # Get coordinators from main entry runtime data
         coordinators = self.main_entry.runtime_data
-        for subentry_id, coordinator in coordinators.items():
-            for status in ("planned", "current", "solved"):
-                status_data = getattr(coordinator, status, {})
-                for disruption in status_data.get("dates", []):
-                    link = disruption.get("link")
-                    disruption_id = self._extract_id_from_link(link)
-                    if not disruption_id:
-                        continue
-                    if disruption_id not in disruptions_by_id:
-                        disruptions_by_id[disruption_id] = {
-                            "id": disruption_id,
-                            "statuses": {},
-                            "link": link,
-                            "description": disruption.get("description", "Disruption"),
-                        }
-                    disruptions_by_id[disruption_id]["statuses"][status] = disruption
-        events = []
-        for disruption_id, info in disruptions_by_id.items():
-            statuses = info["statuses"]
-            link = info["link"]
-            description = info["description"]
-            summary = f"#{disruption_id} - {description}".strip()
-            log = self._event_logs.setdefault(disruption_id, [])
-            now_str = dt_util.now().strftime("%Y-%m-%d %H:%M")
-            # Set event timing and status
-            log_entry = None
-            if "current" in statuses:
-                # Current event, may become solved
-                start_date_str = statuses["current"].get("date")
-                start = self._parse_date(start_date_str)
-                if "solved" in statuses:
-                    end_date_str = statuses["solved"].get("date")
-                    end = self._parse_date(end_date_str)
-                    status = "solved"
-                    log_entry = f"Solved: {now_str} (end: {end})"
-                else:
-                    end = start + timedelta(days=1)
-                    status = "current"
-                    log_entry = f"Current: {now_str} (start: {start})"
-            elif "planned" in statuses:
-                # Planned only
-                start_date_str = statuses["planned"].get("date")
-                start = self._parse_date(start_date_str)
-                end = start + timedelta(days=1)
-                status = "planned"
-                log_entry = f"Planned: {now_str} (date: {start})"
-            elif "solved" in statuses:
-                # Solved only (integration installed after event)
-                start_date_str = statuses["solved"].get("date")
-                start = self._parse_date(start_date_str)
-                end = start + timedelta(days=1)
-                status = "solved"
-                log_entry = f"Solved: {now_str} (date: {start})"
-            else:
-                continue  # Should not happen
-            # Only show events in range
-            if not (start_date <= start <= end_date):
-                continue
-            # Only append log if new
-            if log_entry and (not log or log[-1] != log_entry):
-                log.append(log_entry)
-            # Format description
-            desc = f"Status: #{status}\nLink: {link or 'N/A'}"
-            event = CalendarEvent(
-                summary=summary,
-                start=dt_util.start_of_local_day(start),
-                end=dt_util.start_of_local_day(end),
-                description=desc,
+        sources = [(coordinator, coordinator.data) for coordinator in coordinators.values()]
+        if self._index is None or len(sources) != len(self._index_sources) or any(
+            coordinator is not old_coordinator or data is not old_data
+            for (coordinator, data), (old_coordinator, old_data) in zip(
+                sources, self._index_sources
+            )
+        ):
+            # Aggregate disruptions from all subentries coordinators
+            self._index = CalendarIndex(
+                merge_disruptions(
+                    disruption
+                    for coordinator in coordinators.values()
+                    for status in ("planned", "current", "solved")
+                    for disruption in coordinator.view(status).dates
+                )
             )
-            events.append(event)
-        events.sort(key=lambda e: e.start)
-        return events
-
-    def _extract_id_from_link(self, link):
-        if not link:
-            return None
-        m = re.search(r"/(\d+)$", link)
-        return m.group(1) if m else None
-
-    def _parse_date(self, date_str):
-        try:
-            return datetime.strptime(date_str, "%d-%m-%Y").date()
-        except Exception:
-            return dt_util.now().date()
+            self._index_sources = sources
+            _LOGGER.debug("Rebuilt calendar index with %d events", len(self._index))
+        return self._index
+
+    def _get_events(self, start_date, end_date):
+        index = self._get_index()
+        return [index.event(position) for position in index.window(start_date, end_date)]
@@ -0,0 +1,125 @@
+"""Sorted interval index of the disruptions shown in the calendar."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from homeassistant.components.calendar import CalendarEvent  # type: ignore
+from homeassistant.util import dt as dt_util  # type: ignore
+
+from .models import Disruption
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarSpan:
+    """One disruption merged over its statuses, as an all day interval."""
+
+    id: int
+    status: str
+    title: str
+    link: str | None
+    start: date
+    end: date
+    # Seen as current before it was solved, so end is the solved date
+    was_current: bool = False
+
+    @classmethod
+    def from_statuses(
+        cls, first: Disruption, statuses: dict[str, Disruption]
+    ) -> CalendarSpan:
+        """Merge the records of one disruption id.
+
+        A current disruption that is also solved spans from its current to its
+        solved date; anything else is a single day.
+        """
+        if "current" in statuses:
+            start = statuses["current"].date
+            if "solved" in statuses:
+                status, end = "solved", statuses["solved"].date
+            else:
+                status, end = "current", start + timedelta(days=1)
+        else:
+            # Planned only, or solved only (integration installed afterwards)
+            status = "planned" if "planned" in statuses else "solved"
+            start = statuses[status].date
+            end = start + timedelta(days=1)
+        return cls(
+            first.id,
+            status,
+            first.title,
+            first.link,
+            start,
+            end,
+            was_current="current" in statuses and status == "solved",
+        )
+
+    def log_entry(self, now_str: str) -> str:
+        """Return the event log line for the span at a time."""
+        if self.was_current:
+            return f"Solved: {now_str} (end: {self.end})"
+        if self.status == "current":
+            return f"Current: {now_str} (start: {self.start})"
+        if self.status == "planned":
+            return f"Planned: {now_str} (date: {self.start})"
+        return f"Solved: {now_str} (date: {self.start})"
+
+    def to_event(self) -> CalendarEvent:
+        """Return the calendar event of the span."""
+        return CalendarEvent(
+            summary=f"#{self.id} - {self.title}".strip(),
+            start=dt_util.start_of_local_day(self.start),
+            end=dt_util.start_of_local_day(self.end),
+            description=f"Status: #{self.status}\nLink: {self.link or 'N/A'}",
+        )
+
+
+def merge_disruptions(records: Iterable[Disruption]) -> list[CalendarSpan]:
+    """Merge records with the same id into spans, in first seen order.
+
+    Records without an id cannot be followed between statuses and are left
+    out. The title and link come from the first record of an id.
+    """
+    first: dict[int, Disruption] = {}
+    statuses: dict[int, dict[str, Disruption]] = {}
+    for record in records:
+        if record.id is None:
+            continue
+        first.setdefault(record.id, record)
+        statuses.setdefault(record.id, {})[record.status] = record
+    return [
+        CalendarSpan.from_statuses(first[key], statuses[key]) for key in first
+    ]
+
+
+class CalendarIndex:
+    """Spans sorted by start date, queried by bisection.
+
+    Built once per set of coordinator data. Calendar events are only created
+    for spans that fall in a requested window, and then reused.
+    """
+
+    def __init__(self, spans: Iterable[CalendarSpan]) -> None:
+        """Sort the spans; ties keep their first seen order."""
+        self.spans = sorted(spans, key=lambda span: span.start)
+        self._starts = [span.start for span in self.spans]
+        self._events: dict[int, CalendarEvent] = {}
+
+    def __len__(self) -> int:
+        """Return the number of spans."""
+        return len(self.spans)
+
+    def window(self, start: date, end: date) -> range:
+        """Return the positions of the spans starting in [start, end]."""
+        return range(
+            bisect_left(self._starts, start), bisect_right(self._starts, end)
+        )
+
+    def event(self, position: int) -> CalendarEvent:
+        """Return the calendar event of the span at a position."""
+        event = self._events.get(position)
+        if event is None:
+            event = self._events[position] = self.spans[position].to_event()
+        return event
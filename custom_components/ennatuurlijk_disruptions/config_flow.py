@@ -18,6 +18,16 @@ from .const import (
     DEFAULT_DAYS_TO_KEEP_SOLVED,
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
+    CONF_QUIET_HOURS,
+    DEFAULT_QUIET_HOURS,
+    CONF_PARSER_BACKEND,
+    DEFAULT_PARSER_BACKEND,
+    CONF_MAX_LISTED_DISRUPTIONS,
+    DEFAULT_MAX_LISTED_DISRUPTIONS,
+    CONF_PARSE_IN_PROCESS,
+    DEFAULT_PARSE_IN_PROCESS,
+    CONF_MAX_PAGE_SIZE,
+    DEFAULT_MAX_PAGE_SIZE,
 )
 from .utils import PostalCodeValidator, SchemaHelper
 import voluptuous as vol
@@ -37,7 +47,11 @@ class EnnatuurlijkOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         errors = {}
-        if user_input is not None:
+        if user_input is not None and not SchemaHelper.validate_quiet_hours(
+            user_input.get(CONF_QUIET_HOURS, DEFAULT_QUIET_HOURS)
+        ):
+            errors[CONF_QUIET_HOURS] = "invalid_quiet_hours"
+        elif user_input is not None:
             return self.async_create_entry(
                 title="",
                 data={
@@ -50,12 +64,27 @@ class EnnatuurlijkOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_UPDATE_INTERVAL: user_input.get(
                         CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
                     ),
+                    CONF_QUIET_HOURS: user_input.get(
+                        CONF_QUIET_HOURS, DEFAULT_QUIET_HOURS
+                    ),
+                    CONF_PARSER_BACKEND: user_input.get(
+                        CONF_PARSER_BACKEND, DEFAULT_PARSER_BACKEND
+                    ),
+                    CONF_MAX_LISTED_DISRUPTIONS: user_input.get(
+                        CONF_MAX_LISTED_DISRUPTIONS, DEFAULT_MAX_LISTED_DISRUPTIONS
+                    ),
+                    CONF_PARSE_IN_PROCESS: user_input.get(
+                        CONF_PARSE_IN_PROCESS, DEFAULT_PARSE_IN_PROCESS
+                    ),
+                    CONF_MAX_PAGE_SIZE: user_input.get(
+                        CONF_MAX_PAGE_SIZE, DEFAULT_MAX_PAGE_SIZE
+                    ),
                 },
             )
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
-                SchemaHelper.get_common_options(self._config_entry.options)
+                SchemaHelper.get_global_options(self._config_entry.options)
             ),
             errors=errors,
         )
@@ -87,7 +116,11 @@ class EnnatuurlijkConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_abort(reason="already_configured")
 
         errors = {}
-        if user_input is not None:
+        if user_input is not None and not SchemaHelper.validate_quiet_hours(
+            user_input.get(CONF_QUIET_HOURS, DEFAULT_QUIET_HOURS)
+        ):
+            errors[CONF_QUIET_HOURS] = "invalid_quiet_hours"
+        elif user_input is not None:
             # Create main integration entry with common options
             return self.async_create_entry(
                 title="Ennatuurlijk Disruptions",
@@ -102,13 +135,28 @@ class EnnatuurlijkConfigFlow(ConfigFlow, domain=DOMAIN):
                     CONF_UPDATE_INTERVAL: user_input.get(
                         CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
                     ),
+                    CONF_QUIET_HOURS: user_input.get(
+                        CONF_QUIET_HOURS, DEFAULT_QUIET_HOURS
+                    ),
+                    CONF_PARSER_BACKEND: user_input.get(
+                        CONF_PARSER_BACKEND, DEFAULT_PARSER_BACKEND
+                    ),
+                    CONF_MAX_LISTED_DISRUPTIONS: user_input.get(
+                        CONF_MAX_LISTED_DISRUPTIONS, DEFAULT_MAX_LISTED_DISRUPTIONS
+                    ),
+                    CONF_PARSE_IN_PROCESS: user_input.get(
+                        CONF_PARSE_IN_PROCESS, DEFAULT_PARSE_IN_PROCESS
+                    ),
+                    CONF_MAX_PAGE_SIZE: user_input.get(
+                        CONF_MAX_PAGE_SIZE, DEFAULT_MAX_PAGE_SIZE
+                    ),
                 },
             )
 
         # Show form for common options
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(SchemaHelper.get_common_options()),
+            data_schema=vol.Schema(SchemaHelper.get_global_options()),
             errors=errors,
         )
 
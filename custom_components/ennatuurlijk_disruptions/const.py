@@ -24,6 +24,10 @@ ATTR_DAYS_SINCE_CURRENT_DATE = "days_since_current_date"
 ATTR_YEAR_MONTH_DAY_DATE = "year_month_day_date"
 ATTR_FRIENDLY_NAME = "friendly_name"
 ATTR_LAST_DISRUPTION_DATE = "last_disruption_date"
+ATTR_DATES = "dates"
+ATTR_DATES_TRUNCATED = "dates_truncated"
+ATTR_DISRUPTION_COUNT = "disruption_count"
+ATTR_SUMMARY = "summary"
 
 DEFAULT_UPDATE_INTERVAL = 120  # minutes (2 hours)
 
@@ -62,3 +66,61 @@ ENNATUURLIJK_HEADERS = {
 
 # Update interval config
 CONF_UPDATE_INTERVAL = "update_interval"
+
+# Adaptive polling around the configured update interval
+CONF_QUIET_HOURS = "quiet_hours"
+DEFAULT_QUIET_HOURS = ""  # e.g. "23:00-07:00"; empty disables quiet hours
+MIN_UPDATE_INTERVAL = 5  # minutes, hard lower bound
+MAX_UPDATE_INTERVAL = 1440  # minutes, hard upper bound
+ACTIVE_INTERVAL_DIVISOR = 4  # current disruption or planned one today
+QUIET_INTERVAL_FACTOR = 2  # nothing current or planned today
+QUIET_HOURS_INTERVAL_FACTOR = 4  # quiet page during quiet hours
+
+# Disruptions listed in the dates attribute; the rest is only counted
+CONF_MAX_LISTED_DISRUPTIONS = "max_listed_disruptions"
+DEFAULT_MAX_LISTED_DISRUPTIONS = 10
+
+# HTML parser backend; "auto" picks the fastest installed one
+CONF_PARSER_BACKEND = "parser_backend"
+DEFAULT_PARSER_BACKEND = "auto"
+PARSER_BACKENDS = ["auto", "selectolax", "lxml", "stream", "html.parser"]
+STREAM_CHUNK_SIZE = 16384  # bytes read from the response at a time
+
+# Downloads larger than this (in KB) are aborted
+CONF_MAX_PAGE_SIZE = "max_page_size"
+DEFAULT_MAX_PAGE_SIZE = 4096
+
+# Parse in a separate worker process instead of a thread (opt-in)
+CONF_PARSE_IN_PROCESS = "parse_in_process"
+DEFAULT_PARSE_IN_PROCESS = False
+PARSE_WORKER_TIMEOUT_SECONDS = 60  # the worker is restarted after this
+
+# Locations refreshing within this many seconds of each other share one page fetch
+PAGE_REUSE_SECONDS = 60
+
+# Dispatcher signals, formatted with the entry id, for locations added to or
+# removed from a running entry; sent with (subentry_id, coordinator) and subentry_id
+SIGNAL_LOCATION_ADDED = f"{DOMAIN}_{{}}_location_added"
+SIGNAL_LOCATION_REMOVED = f"{DOMAIN}_{{}}_location_removed"
+
+# Initial refresh of the locations at setup
+FIRST_REFRESH_CONCURRENCY = 4
+FIRST_REFRESH_DEADLINE_SECONDS = 30  # the rest finishes in the background
+
+# Persisted warm-start cache of the last parsed page
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10  # seconds
+
+# Calendar event log bounds
+EVENT_LOG_MAX_DISRUPTIONS = 500
+EVENT_LOG_MAX_ENTRIES = 10  # per disruption
+EVENT_LOG_TTL_DAYS = 90  # since a disruption was last on the page
+
+# Fetch resilience
+REQUEST_TIMEOUT_SECONDS = 30  # per attempt
+FETCH_BUDGET_SECONDS = 90  # all attempts and backoff of one fetch together
+FETCH_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 2
+BACKOFF_MAX_SECONDS = 30
+BREAKER_FAILURE_THRESHOLD = 3  # consecutive failed fetches
+BREAKER_RESET_SECONDS = 900  # before a half-open probe is allowed
@@ -0,0 +1,35 @@
+"""Diagnostics support for Ennatuurlijk Disruptions."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    hub = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    coordinators = getattr(entry, "runtime_data", None) or {}
+
+    return {
+        "options": dict(entry.options),
+        "hub": hub.stats if hub else None,
+        "locations": {
+            subentry_id: {
+                "town": coordinator.town,
+                "postal_code": coordinator.postal_code,
+                "last_update_success": coordinator.last_update_success,
+                "planned": len(coordinator.planned.get("dates", [])),
+                "current": len(coordinator.current.get("dates", [])),
+                "solved": len(coordinator.solved.get("dates", [])),
+                "updates": coordinator.update_stats,
+            }
+            for subentry_id, coordinator in coordinators.items()
+        },
+    }
@@ -4,25 +4,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Callable
-from datetime import datetime, date
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import _LOGGER, DOMAIN
+from .const import _LOGGER, ATTR_DATES, DOMAIN
 from .coordinator import EnnatuurlijkCoordinator
+from .views import SectionView
 
 
 @dataclass(frozen=True)
 class EnnatuurlijkSensorEntityDescription(SensorEntityDescription):
     """Describes Ennatuurlijk sensor entity."""
 
-    value_fn: Callable[[dict, date], str | None] | None = None
-    attributes_fn: Callable[[dict, date, str], dict] | None = None
+    value_fn: Callable[[SectionView], str | None] | None = None
+    attributes_fn: Callable[[SectionView, str], dict] | None = None
     data_key: str | None = None  # Key for coordinator data
 
 
@@ -30,14 +31,17 @@ class EnnatuurlijkSensorEntityDescription(SensorEntityDescription):
 class EnnatuurlijkBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes Ennatuurlijk binary sensor entity."""
 
-    is_on_fn: Callable[[dict], bool] | None = None
-    attributes_fn: Callable[[dict], dict] | None = None
+    is_on_fn: Callable[[SectionView], bool] | None = None
+    attributes_fn: Callable[[SectionView], dict] | None = None
     data_key: str | None = None  # Key for coordinator data
 
 
 class EnnatuurlijkEntity(CoordinatorEntity):
     """Base class for Ennatuurlijk entities."""
 
+    # The dates list can be large; the recorder keeps the summary instead
+    _unrecorded_attributes = frozenset({ATTR_DATES})
+
     @property
     def has_entity_name(self) -> bool:
         return True
@@ -49,7 +53,8 @@ class EnnatuurlijkEntity(CoordinatorEntity):
         description: SensorEntityDescription | BinarySensorEntityDescription,
     ):
         """Initialize the entity."""
-        super().__init__(coordinator)
+        # The section is the listener context, so only its changes notify us
+        super().__init__(coordinator, context=description.data_key)
         self.entity_description = description
         self._subentry = subentry
         # Use subentry data for unique_id and device info
@@ -67,6 +72,33 @@ class EnnatuurlijkEntity(CoordinatorEntity):
         """Return if entity is available."""
         return self.coordinator.last_update_success
 
+    def _snapshot(self) -> tuple:
+        """Return the state and attributes last written for this entity."""
+        raise NotImplementedError
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for day rollovers as well as coordinator updates."""
+        await super().async_added_to_hass()
+        self._last_snapshot = self._snapshot()
+        self.async_on_remove(
+            self.coordinator.async_add_rollover_listener(self._handle_day_rollover)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state for new coordinator data."""
+        self._last_snapshot = self._snapshot()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_day_rollover(self) -> None:
+        """Write state after a day rollover only if the values changed."""
+        snapshot = self._snapshot()
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        self.async_write_ha_state()
+
 
 class EnnatuurlijkSensor(EnnatuurlijkEntity, SensorEntity):
     @property
@@ -86,17 +118,20 @@ class EnnatuurlijkSensor(EnnatuurlijkEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator, entry, description)
 
+    def _snapshot(self) -> tuple:
+        """Return the sensor value and attributes."""
+        return self.native_value, self.extra_state_attributes
+
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
         if not self.entity_description.data_key:
             return None
 
-        data = getattr(self.coordinator, self.entity_description.data_key)
-        today = datetime.now().date()
+        view = self.coordinator.view(self.entity_description.data_key)
 
         if self.entity_description.value_fn:
-            value = self.entity_description.value_fn(data, today)
+            value = self.entity_description.value_fn(view)
             _LOGGER.debug(f"[{self._attr_unique_id}] State computed: {value}")
             return value
 
@@ -108,13 +143,12 @@ class EnnatuurlijkSensor(EnnatuurlijkEntity, SensorEntity):
         if not self.entity_description.data_key:
             return {}
 
-        data = getattr(self.coordinator, self.entity_description.data_key)
-        today = datetime.now().date()
+        view = self.coordinator.view(self.entity_description.data_key)
         # Ensure name is string
         name = str(self.name) if self.name is not None else ""
 
         if self.entity_description.attributes_fn:
-            attrs = self.entity_description.attributes_fn(data, today, name)
+            attrs = self.entity_description.attributes_fn(view, name)
             _LOGGER.debug(f"[{self._attr_unique_id}] Attributes: {attrs}")
             return attrs
 
@@ -139,16 +173,20 @@ class EnnatuurlijkBinarySensor(EnnatuurlijkEntity, BinarySensorEntity):
         """Initialize the binary sensor."""
         super().__init__(coordinator, entry, description)
 
+    def _snapshot(self) -> tuple:
+        """Return the binary sensor state and attributes."""
+        return self.is_on, self.extra_state_attributes
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
         if not self.entity_description.data_key:
             return False
 
-        data = getattr(self.coordinator, self.entity_description.data_key)
+        view = self.coordinator.view(self.entity_description.data_key)
 
         if self.entity_description.is_on_fn:
-            value = self.entity_description.is_on_fn(data)
+            value = self.entity_description.is_on_fn(view)
             _LOGGER.debug(f"[{self._attr_unique_id}] State computed: {value}")
             return value
 
@@ -160,10 +198,10 @@ class EnnatuurlijkBinarySensor(EnnatuurlijkEntity, BinarySensorEntity):
         if not self.entity_description.data_key:
             return {}
 
-        data = getattr(self.coordinator, self.entity_description.data_key)
+        view = self.coordinator.view(self.entity_description.data_key)
 
         if self.entity_description.attributes_fn:
-            attrs = self.entity_description.attributes_fn(data)
+            attrs = self.entity_description.attributes_fn(view)
             _LOGGER.debug(f"[{self._attr_unique_id}] Attributes: {attrs}")
             return attrs
 
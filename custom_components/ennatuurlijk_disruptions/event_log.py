@@ -0,0 +1,159 @@
+"""Bounded, persisted lifecycle log of the disruptions shown in the calendar."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .calendar_index import CalendarSpan
+from .const import (
+    DOMAIN,
+    EVENT_LOG_MAX_DISRUPTIONS,
+    EVENT_LOG_MAX_ENTRIES,
+    EVENT_LOG_TTL_DAYS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def event_log_storage_key(entry_id: str) -> str:
+    """Return the storage key of a config entry's calendar event log."""
+    return f"{DOMAIN}.{entry_id}.event_log"
+
+
+@dataclass(slots=True)
+class _DisruptionLog:
+    """Log lines of one disruption and the state they were written for."""
+
+    state: tuple[str, str, str]
+    seen: datetime
+    entries: list[str] = field(default_factory=list)
+
+
+class EventLog:
+    """Status transitions per disruption id, bounded in size and age.
+
+    A line is only added when the status or dates of a disruption change.
+    Disruptions not seen on the page for ``ttl`` are dropped, as are the
+    least recently seen ones beyond ``max_disruptions``. Each disruption keeps
+    its last ``max_entries`` lines. Changes are saved with a delay, so a
+    burst of transitions is one write.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str | None = None,
+        max_disruptions: int = EVENT_LOG_MAX_DISRUPTIONS,
+        max_entries: int = EVENT_LOG_MAX_ENTRIES,
+        ttl: timedelta = timedelta(days=EVENT_LOG_TTL_DAYS),
+    ) -> None:
+        """Initialize the log, persisting it when bound to a config entry."""
+        self._store: Store | None = (
+            Store(hass, STORAGE_VERSION, event_log_storage_key(entry_id))
+            if entry_id
+            else None
+        )
+        self._max_disruptions = max_disruptions
+        self._max_entries = max_entries
+        self._ttl = ttl
+        # Least recently seen first
+        self._logs: OrderedDict[int, _DisruptionLog] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of logged disruptions."""
+        return len(self._logs)
+
+    def entries(self, disruption_id: int) -> list[str]:
+        """Return the log lines of a disruption."""
+        log = self._logs.get(disruption_id)
+        return list(log.entries) if log else []
+
+    async def async_load(self) -> None:
+        """Load the persisted log."""
+        if self._store is None:
+            return
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        try:
+            for key, value in stored["disruptions"].items():
+                self._logs[int(key)] = _DisruptionLog(
+                    state=tuple(value["state"]),
+                    seen=datetime.fromisoformat(value["seen"]),
+                    entries=list(value["entries"]),
+                )
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid calendar event log: %s", err)
+            self._logs.clear()
+            return
+        self._evict(dt_util.now())
+
+    async def async_remove_store(self) -> None:
+        """Remove the persisted log."""
+        if self._store is not None:
+            await self._store.async_remove()
+
+    @callback
+    def async_record(self, spans: Iterable[CalendarSpan]) -> int:
+        """Log the transitions of the spans of freshly published data.
+
+        Returns the number of lines added.
+        """
+        now = dt_util.now()
+        now_str = now.strftime("%Y-%m-%d %H:%M")
+        added = 0
+        for span in spans:
+            state = (span.status, span.start.isoformat(), span.end.isoformat())
+            log = self._logs.get(span.id)
+            if log is None:
+                log = self._logs[span.id] = _DisruptionLog(state=state, seen=now)
+            elif log.state == state:
+                log.seen = now
+                self._logs.move_to_end(span.id)
+                continue
+            log.state, log.seen = state, now
+            log.entries.append(span.log_entry(now_str))
+            del log.entries[: -self._max_entries]
+            self._logs.move_to_end(span.id)
+            added += 1
+        evicted = self._evict(now)
+        if (added or evicted) and self._store is not None:
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        return added
+
+    def _evict(self, now: datetime) -> int:
+        """Drop disruptions past the TTL or beyond the size bound."""
+        evicted = 0
+        cutoff = now - self._ttl
+        # Ordered by last seen, so expired logs are at the front
+        while self._logs and (
+            len(self._logs) > self._max_disruptions
+            or next(iter(self._logs.values())).seen < cutoff
+        ):
+            self._logs.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    @callback
+    def _data_to_store(self) -> dict:
+        """Return the JSON representation of the log."""
+        return {
+            "disruptions": {
+                str(key): {
+                    "state": list(log.state),
+                    "seen": log.seen.isoformat(),
+                    "entries": log.entries,
+                }
+                for key, log in self._logs.items()
+            }
+        }
@@ -0,0 +1,908 @@
+"""Shared page fetch hub for Ennatuurlijk Disruptions.
+
+All location coordinators of a config entry read the same storingen page. The
+hub downloads and parses it once per update tick and hands the parsed articles
+to every registered coordinator, which only filters them for its location.
+Downloads are conditional (ETag/Last-Modified, Cache-Control max-age) and an
+unchanged body is detected by hash, so an unchanged page is never re-parsed.
+The last parsed page is persisted so coordinators can warm start after a
+restart without waiting for the website. Failed downloads are retried with
+backoff and guarded by a circuit breaker. Bodies are read in chunks up to a
+size limit and the download stops once the last needed disruption section has
+been closed. Only the sections and solved dates the locations keep are parsed,
+and only the articles whose raw text mentions one of the locations; the raw
+body is kept in memory, so added locations or a longer retention are served by
+parsing it again without a download. Parsing runs in an executor job,
+optionally in a separate worker process to keep the GIL free; a streaming
+backend is fed the body in that job while it downloads, once it differs from
+the kept body.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
+import hashlib
+from http import HTTPStatus
+import logging
+import queue
+import re
+import time
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    ENNATUURLIJK_DISRUPTIONS_URL,
+    DEFAULT_MAX_PAGE_SIZE,
+    DEFAULT_UPDATE_INTERVAL,
+    ENNATUURLIJK_HEADERS,
+    FETCH_ATTEMPTS,
+    FETCH_BUDGET_SECONDS,
+    PAGE_REUSE_SECONDS,
+    PARSE_WORKER_TIMEOUT_SECONDS,
+    REQUEST_TIMEOUT_SECONDS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    STREAM_CHUNK_SIZE,
+)
+from .location_index import LocationIndex
+from .models import Disruption
+from .parser import FULL_PLAN, SECTION_MAP, ParsePlan
+from .parser_backends import (
+    BACKEND_AUTO,
+    META_SNIFF_BYTES,
+    ParserBackend,
+    detect_encoding,
+    get_backend,
+)
+from .prefilter import prefilter_body
+from .process_parser import ParseWorker, ParseWorkerError
+from .resilience import (
+    STATE_HALF_OPEN,
+    CircuitBreaker,
+    EnnatuurlijkFetchError,
+    backoff_delay,
+)
+from .scheduler import adaptive_interval, has_activity
+from .streaming import SectionEndScanner
+
+if TYPE_CHECKING:
+    from .coordinator import EnnatuurlijkCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Raw body and its charset with its ETag, Last-Modified and content hash, and
+# the parse already streaming it if any
+type _Download = tuple[
+    tuple[bytes, str | None],
+    str | None,
+    str | None,
+    str,
+    asyncio.Future[_ParseJob] | None,
+]
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def _is_retryable(err: Exception) -> bool:
+    """Return False for client errors that will not go away by retrying."""
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500 or err.status == HTTPStatus.TOO_MANY_REQUESTS
+    return True
+
+
+def parse_max_age(cache_control: str | None) -> int:
+    """Return the Cache-Control max-age in seconds, 0 if absent or not cacheable."""
+    if not cache_control:
+        return 0
+    lowered = cache_control.lower()
+    if "no-cache" in lowered or "no-store" in lowered:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+@dataclass(frozen=True)
+class ParsedPage:
+    """Location independent parse result of one page download."""
+
+    articles: tuple[tuple, ...]
+    fetched_at: datetime
+    # Built once per parsed page and carried over by dataclasses.replace
+    index: LocationIndex | None = field(default=None, compare=False, repr=False)
+    # Typed record per article, None where the date is invalid
+    disruptions: tuple[Disruption | None, ...] | None = field(
+        default=None, compare=False, repr=False
+    )
+    # Sections and solved dates the articles were parsed for
+    plan: ParsePlan = field(default=FULL_PLAN, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index the articles by location and build their records."""
+        if self.index is None:
+            object.__setattr__(self, "index", LocationIndex(self.articles))
+        if self.disruptions is None:
+            object.__setattr__(
+                self,
+                "disruptions",
+                tuple(Disruption.from_article(a) for a in self.articles),
+            )
+
+    def select(self, town: str, postal_code: str) -> list[Disruption]:
+        """Return the records of a location in page order."""
+        return [
+            disruption
+            for article_id in self.index.lookup(town, postal_code)
+            if (disruption := self.disruptions[article_id]) is not None
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class _ParseJob:
+    """Outcome of a parse executor job, applied to the hub on the event loop."""
+
+    page: ParsedPage
+    # Articles that did or did not pass the prefilter, None when unfiltered
+    prefilter_hits: int | None
+    prefilter_misses: int | None
+    worker_failed: bool
+    # Seconds the job waited for an executor thread and ran
+    wait: float
+    run: float
+
+
+def storage_key(entry_id: str) -> str:
+    """Return the storage key of a config entry's page cache."""
+    return f"{DOMAIN}.{entry_id}"
+
+
+class EnnatuurlijkPageHub:
+    """Fetch and parse the storingen page once for all location coordinators."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str | None = None,
+        parser_backend: str = BACKEND_AUTO,
+        parse_in_process: bool = False,
+        max_page_size: int = DEFAULT_MAX_PAGE_SIZE,
+    ) -> None:
+        """Initialize the hub, persisting pages when bound to a config entry."""
+        self.hass = hass
+        self._backend = get_backend(parser_backend)
+        self._max_body_bytes = max_page_size * 1024
+        self._worker: ParseWorker | None = (
+            ParseWorker(PARSE_WORKER_TIMEOUT_SECONDS) if parse_in_process else None
+        )
+        self._worker_fallbacks = 0
+        self._coordinators: set[EnnatuurlijkCoordinator] = set()
+        # Single-flight: the running fetch and the coordinators awaiting it
+        self._inflight: asyncio.Task[ParsedPage] | None = None
+        self._waiters: set[EnnatuurlijkCoordinator] = set()
+        self._store: Store | None = (
+            Store(hass, STORAGE_VERSION, storage_key(entry_id)) if entry_id else None
+        )
+        self._page: ParsedPage | None = None
+        self._page_monotonic: float | None = None
+        self._max_age = 0
+        # Validators of the response the current page was parsed from
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._body_hash: str | None = None
+        # Raw body and charset the current page was parsed from, not persisted
+        self._body: tuple[bytes, str | None] | None = None
+        self._deliveries = 0
+        self._issued = 0
+        self._coalesced = 0
+        self._cache_hits = 0
+        self._fetches = 0
+        self._parses = 0
+        self._not_modified = 0
+        self._hash_hits = 0
+        self._early_stops = 0
+        self._body_bytes: int | None = None
+        self._breaker = CircuitBreaker()
+        self._retries = 0
+        self._failed_fetches = 0
+        # Articles of the last parse that did or did not pass the prefilter
+        self._prefilter_hits: int | None = None
+        self._prefilter_misses: int | None = None
+        # Executor queueing and run time of the last parse
+        self._parse_wait_ms: float | None = None
+        self._parse_run_ms: float | None = None
+
+    @property
+    def page(self) -> ParsedPage | None:
+        """Return the last parsed page, if any."""
+        return self._page
+
+    @property
+    def backend(self) -> ParserBackend:
+        """Return the parser backend used for new pages."""
+        return self._backend
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker guarding the site."""
+        return self._breaker
+
+    @property
+    def needs_reparse(self) -> bool:
+        """Return True if the page lacks sections or dates the locations need."""
+        return self._page is not None and not self._page.plan.covers(
+            self._parse_plan()
+        )
+
+    @property
+    def stats(self) -> dict[str, int | float | str | None]:
+        """Return fetch/parse counters, including the work saved by sharing.
+
+        Before the hub every delivered location update cost one download and
+        one parse per section.
+        """
+        legacy = self._deliveries * len(SECTION_MAP)
+        return {
+            "locations": len(self._coordinators),
+            "deliveries": self._deliveries,
+            "issued": self._issued,
+            "coalesced": self._coalesced,
+            "cache_hits": self._cache_hits,
+            "fetches": self._fetches,
+            "parses": self._parses,
+            "fetches_saved": legacy - self._fetches,
+            "parses_saved": legacy - self._parses,
+            "not_modified": self._not_modified,
+            "hash_hits": self._hash_hits,
+            "body_bytes": self._body_bytes,
+            "early_stops": self._early_stops,
+            "retries": self._retries,
+            "failed_fetches": self._failed_fetches,
+            "breaker_state": self._breaker.state,
+            "breaker_failures": self._breaker.consecutive_failures,
+            "parser_backend": self._backend.name,
+            "parse_worker": "process" if self._worker else "thread",
+            "worker_restarts": self._worker.restarts if self._worker else 0,
+            "worker_fallbacks": self._worker_fallbacks,
+            "prefilter_hits": self._prefilter_hits,
+            "prefilter_misses": self._prefilter_misses,
+            "prefilter_hit_ratio": (
+                round(self._prefilter_hits / total, 3)
+                if self._prefilter_hits is not None
+                and (total := self._prefilter_hits + self._prefilter_misses)
+                else None
+            ),
+            "parse_wait_ms": self._parse_wait_ms,
+            "parse_run_ms": self._parse_run_ms,
+            "updates_notified": sum(
+                c.update_stats["notified"] for c in self._coordinators
+            ),
+            "updates_skipped": sum(
+                c.update_stats["skipped"] for c in self._coordinators
+            ),
+        }
+
+    @callback
+    def async_set_backend(self, parser_backend: str) -> None:
+        """Parse the next download with another backend."""
+        if parser_backend != self._backend.name:
+            self._backend = get_backend(parser_backend)
+
+    @callback
+    def async_set_max_page_size(self, max_page_size: int) -> None:
+        """Change the size limit (in KB) of the next downloads."""
+        self._max_body_bytes = max_page_size * 1024
+
+    @callback
+    def async_set_parse_in_process(self, parse_in_process: bool) -> None:
+        """Start or stop parsing in a worker process."""
+        if parse_in_process and self._worker is None:
+            self._worker = ParseWorker(PARSE_WORKER_TIMEOUT_SECONDS)
+            self.hass.async_create_background_task(
+                self.async_start_worker(), f"{DOMAIN} parse worker start"
+            )
+        elif not parse_in_process and self._worker is not None:
+            self.async_shutdown()
+
+    async def async_start_worker(self) -> None:
+        """Start the worker process ahead of the first parse."""
+        if self._worker is None:
+            return
+        try:
+            await self.hass.async_add_executor_job(
+                self._worker.start, self._backend.name
+            )
+        except ParseWorkerError as err:
+            _LOGGER.warning("%s, it is retried on the next parse", err)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the worker process, if any."""
+        if self._worker is not None:
+            self._worker.shutdown()
+            self._worker = None
+
+    @callback
+    def async_register(self, coordinator: EnnatuurlijkCoordinator) -> None:
+        """Register a location coordinator for page fan-out."""
+        self._coordinators.add(coordinator)
+
+    @callback
+    def async_unregister(self, coordinator: EnnatuurlijkCoordinator) -> None:
+        """Stop fanning out pages to a location coordinator."""
+        self._coordinators.discard(coordinator)
+
+    @callback
+    def async_schedule(
+        self, requester: EnnatuurlijkCoordinator, data: dict
+    ) -> timedelta:
+        """Adapt the shared polling interval to the disruption state of all locations."""
+        now = dt_util.now()
+        today = now.date()
+        active = has_activity(data, today) or any(
+            has_activity(coordinator.data, today)
+            for coordinator in self._coordinators
+            if coordinator is not requester
+        )
+        interval = adaptive_interval(
+            requester.baseline_interval, active, now, requester.quiet_hours
+        )
+        if interval != requester.update_interval:
+            _LOGGER.debug(
+                "Polling every %s (active disruptions: %s)", interval, active
+            )
+        requester.update_interval = interval
+        for coordinator in self._coordinators:
+            coordinator.update_interval = interval
+        return interval
+
+    async def async_load(self) -> ParsedPage | None:
+        """Load the persisted page, returning it if one was stored."""
+        if self._store is None:
+            return None
+        stored = await self._store.async_load()
+        if not stored:
+            return None
+        try:
+            stored_plan = stored.get("plan")
+            page = ParsedPage(
+                articles=tuple(tuple(article) for article in stored["articles"]),
+                fetched_at=datetime.fromisoformat(stored["fetched_at"]),
+                # Pages stored without a plan were parsed in full
+                plan=ParsePlan(
+                    tuple(stored_plan["sections"]),
+                    date.fromisoformat(stored_plan["solved_since"])
+                    if stored_plan["solved_since"]
+                    else None,
+                    frozenset(
+                        (town, postal_code)
+                        for town, postal_code in stored_plan["locations"]
+                    )
+                    if stored_plan.get("locations") is not None
+                    else None,
+                )
+                if stored_plan
+                else FULL_PLAN,
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid cached disruption page: %s", err)
+            return None
+        # The stored validators let the first download after a restart be a 304
+        self._etag = stored.get("etag")
+        self._last_modified = stored.get("last_modified")
+        self._body_hash = stored.get("body_hash")
+        self._page = page
+        _LOGGER.debug(
+            "Loaded cached page from %s with %d articles",
+            page.fetched_at,
+            len(page.articles),
+        )
+        return page
+
+    async def async_remove_store(self) -> None:
+        """Remove the persisted page."""
+        if self._store is not None:
+            await self._store.async_remove()
+
+    @callback
+    def _data_to_store(self) -> dict:
+        """Return the compact representation of the current page."""
+        return {
+            "fetched_at": self._page.fetched_at.isoformat(),
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "body_hash": self._body_hash,
+            "articles": [list(article) for article in self._page.articles],
+            "plan": {
+                "sections": list(self._page.plan.sections),
+                "solved_since": (
+                    self._page.plan.solved_since.isoformat()
+                    if self._page.plan.solved_since
+                    else None
+                ),
+                "locations": (
+                    sorted(list(location) for location in self._page.plan.locations)
+                    if self._page.plan.locations is not None
+                    else None
+                ),
+            },
+        }
+
+    async def async_get_page(
+        self, requester: EnnatuurlijkCoordinator | None = None
+    ) -> ParsedPage:
+        """Return the current page, downloading it only once per tick.
+
+        Callers arriving while a download is in flight share its result
+        instead of issuing their own request.
+        """
+        self._deliveries += 1
+        if (
+            self._page is not None
+            and self._is_fresh()
+            and self._page.plan.covers(self._parse_plan())
+        ):
+            self._cache_hits += 1
+            _LOGGER.debug("Reusing page parsed %s", self._page.fetched_at)
+            return self._page
+
+        if self._inflight is None:
+            self._issued += 1
+            self._inflight = self.hass.async_create_background_task(
+                self._async_refresh_page(requester),
+                f"{DOMAIN} page fetch",
+                eager_start=False,
+            )
+        else:
+            self._coalesced += 1
+            _LOGGER.debug("Joining in-flight page fetch")
+
+        if requester is not None:
+            self._waiters.add(requester)
+        try:
+            # Shielded so one cancelled caller does not abort the shared fetch
+            return await asyncio.shield(self._inflight)
+        finally:
+            self._waiters.discard(requester)
+
+    async def async_reparse(self) -> None:
+        """Parse the kept body again for the current locations, without a download.
+
+        Does nothing unless the page lacks locations or solved dates the kept
+        body has; a download in flight serves them instead.
+        """
+        if (
+            self._inflight is not None
+            or not self.needs_reparse
+            or not self._body_covers(self._parse_plan())
+        ):
+            return
+        self._inflight = self.hass.async_create_background_task(
+            self._async_refresh_page(None, reparse=True),
+            f"{DOMAIN} page reparse",
+            eager_start=False,
+        )
+        try:
+            await asyncio.shield(self._inflight)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Parsing the kept page again failed: %s", err)
+
+    async def _async_refresh_page(
+        self, requester: EnnatuurlijkCoordinator | None, reparse: bool = False
+    ) -> ParsedPage:
+        """Run the single in-flight fetch and publish its result.
+
+        While the page is fresh, or when asked to, a page that only lacks
+        locations or solved dates is parsed again from the kept body.
+        """
+        try:
+            plan = self._parse_plan()
+            if (reparse or self._is_fresh()) and self._body_covers(plan):
+                _LOGGER.debug("Parsing the kept page again for the locations")
+                page = await self._async_parse(
+                    self._body,
+                    self._etag,
+                    self._last_modified,
+                    self._body_hash,
+                    None,
+                    plan,
+                )
+                self._page = replace(page, fetched_at=self._page.fetched_at)
+            else:
+                self._page = await self._async_fetch_page()
+                self._page_monotonic = time.monotonic()
+        finally:
+            self._inflight = None
+        self._async_fan_out(requester)
+        _LOGGER.debug("Page hub stats: %s", self.stats)
+        return self._page
+
+    def _parse_plan(self) -> ParsePlan:
+        """Return the plan that serves every registered location.
+
+        The widest solved retention wins; without locations the whole page
+        is parsed.
+        """
+        if not self._coordinators:
+            return FULL_PLAN
+        return ParsePlan.for_retention(
+            max(c.days_to_keep_solved for c in self._coordinators),
+            dt_util.now().date(),
+            frozenset((c.town, c.postal_code) for c in self._coordinators),
+        )
+
+    def _body_covers(self, plan: ParsePlan) -> bool:
+        """Return True if the kept body can be parsed again for a plan.
+
+        It was read up to the last section of the current page and holds all
+        articles of its sections, whatever their solved date or location.
+        """
+        return (
+            self._body is not None
+            and self._page is not None
+            and ParsePlan(self._page.plan.sections).covers(plan)
+        )
+
+    def _is_fresh(self) -> bool:
+        if self._page_monotonic is None:
+            return False
+        age = time.monotonic() - self._page_monotonic
+        max_age = min(self._max_age, self._max_age_cap())
+        return age < max(PAGE_REUSE_SECONDS, max_age)
+
+    def _max_age_cap(self) -> float:
+        """Return the longest Cache-Control max-age honoured, in seconds.
+
+        A longer max-age would hide the site from polling and manual
+        refreshes, so it ends short of the next tick of the shortest interval,
+        which may fire slightly early.
+        """
+        interval = min(
+            (c.update_interval for c in self._coordinators if c.update_interval),
+            default=timedelta(minutes=DEFAULT_UPDATE_INTERVAL),
+        )
+        return interval.total_seconds() - PAGE_REUSE_SECONDS
+
+    async def _async_fetch_page(self) -> ParsedPage:
+        """Download the page with retries, parsing it only when its content changed."""
+        self._breaker.before_request()
+        plan = self._parse_plan()
+        try:
+            download = await self._async_download_with_retry(plan)
+            if isinstance(download, ParsedPage):
+                page = download
+            else:
+                page = await self._async_parse(*download, plan)
+        except Exception:
+            self._failed_fetches += 1
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        return page
+
+    async def _async_download_with_retry(
+        self, plan: ParsePlan
+    ) -> ParsedPage | _Download:
+        """Download with bounded retries, exponential backoff and a time budget."""
+        # A half-open breaker only allows a single probe request
+        attempts = 1 if self._breaker.state == STATE_HALF_OPEN else FETCH_ATTEMPTS
+        deadline = time.monotonic() + FETCH_BUDGET_SECONDS
+        for attempt in range(attempts):
+            timeout = min(REQUEST_TIMEOUT_SECONDS, deadline - time.monotonic())
+            try:
+                async with asyncio.timeout(timeout):
+                    return await self._async_download(plan)
+            except (aiohttp.ClientError, TimeoutError) as err:
+                delay = backoff_delay(attempt)
+                if (
+                    not _is_retryable(err)
+                    or attempt + 1 >= attempts
+                    or time.monotonic() + delay >= deadline
+                ):
+                    raise EnnatuurlijkFetchError(
+                        f"Fetching {ENNATUURLIJK_DISRUPTIONS_URL} failed after "
+                        f"{attempt + 1} attempt(s): {err!r}"
+                    ) from err
+                self._retries += 1
+                _LOGGER.debug(
+                    "Fetch attempt %d failed (%r), retrying in %.1fs",
+                    attempt + 1,
+                    err,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+        raise EnnatuurlijkFetchError("No fetch attempts allowed")
+
+    async def _async_download(self, plan: ParsePlan) -> ParsedPage | _Download:
+        """Perform one conditional download.
+
+        Returns the previous page when the content is unchanged and it was
+        parsed for everything the plan needs, otherwise the body to parse
+        together with its validators.
+        """
+        from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+        headers = dict(ENNATUURLIJK_HEADERS)
+        # A page parsed for fewer sections is parsed again from a new body,
+        # one parsed for fewer solved dates or locations from the kept body
+        page_reusable = self._page is not None and self._page.plan.covers(plan)
+        reusable = page_reusable or self._body_covers(plan)
+        if reusable:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        session = async_get_clientsession(self.hass)
+        _LOGGER.debug("Fetching HTML from: %s", ENNATUURLIJK_DISRUPTIONS_URL)
+        async with session.get(
+            ENNATUURLIJK_DISRUPTIONS_URL, headers=headers
+        ) as response:
+            self._fetches += 1
+            self._max_age = parse_max_age(response.headers.get("Cache-Control"))
+            if response.status == HTTPStatus.NOT_MODIFIED and reusable:
+                self._not_modified += 1
+                if not page_reusable:
+                    _LOGGER.debug("Page not modified, parsing the kept body")
+                    return (
+                        self._body,
+                        self._etag,
+                        self._last_modified,
+                        self._body_hash,
+                        None,
+                    )
+                _LOGGER.debug("Page not modified, reusing parsed result")
+                return replace(self._page, fetched_at=datetime.now())
+
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            self._check_body_size(response.headers.get("Content-Length"))
+            kept = self._body[0] if page_reusable and self._body else None
+            raw, body_hash, streamed = await self._async_read_body(
+                response, plan, kept
+            )
+            body = (raw, response.charset)
+            # A streamed parse only starts once the body differs from the kept one
+            if streamed is None and page_reusable and body_hash == self._body_hash:
+                self._hash_hits += 1
+                self._etag, self._last_modified = etag, last_modified
+                _LOGGER.debug("Page content unchanged, skipping parse")
+                return replace(self._page, fetched_at=datetime.now())
+
+        return body, etag, last_modified, body_hash, streamed
+
+    def _check_body_size(self, size: int | str | None) -> None:
+        """Abort a download beyond the size limit."""
+        if size is not None and int(size) > self._max_body_bytes:
+            raise EnnatuurlijkFetchError(
+                f"Page of {size} bytes exceeds the limit of "
+                f"{self._max_body_bytes} bytes"
+            )
+
+    def _finish_read(self, size: int, done: bool) -> None:
+        self._body_bytes = size
+        if done:
+            self._early_stops += 1
+        _LOGGER.debug(
+            "Fetched HTML content (%d bytes%s)",
+            size,
+            ", stopped after the last needed section" if done else "",
+        )
+
+    async def _async_read_body(
+        self, response, plan: ParsePlan, kept: bytes | None = None
+    ) -> tuple[bytes, str, asyncio.Future[_ParseJob] | None]:
+        """Read the raw body chunk by chunk, up to the size limit.
+
+        Reading stops once the last needed section has been closed. Returns
+        the body read, its hash and, for a streaming backend, the parse fed
+        with the chunks as they arrive. That parse starts at the first byte
+        that differs from the kept body, so an unchanged page is not parsed.
+        """
+        scanner = SectionEndScanner(plan.last_section)
+        body = bytearray()
+        digest = hashlib.sha256()
+        # Bytes hashed, and compared with the kept body or fed to the parse
+        read = 0
+        chunks: queue.SimpleQueue[bytes | None] | None = None
+        streamed: asyncio.Future[_ParseJob] | None = None
+        stream = self._backend.streaming and self._worker is None
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                body += chunk
+                self._check_body_size(len(body))
+                scanner.scan(body)
+                # How much arrives past the section depends on the network
+                # chunking, so it is neither hashed nor parsed
+                end = scanner.end if scanner.done else len(body)
+                new = bytes(body[read:end])
+                digest.update(new)
+                if (
+                    stream
+                    and chunks is None
+                    and (kept is None or kept[read:end] != new)
+                ):
+                    chunks = queue.SimpleQueue()
+                    streamed = self.hass.async_add_executor_job(
+                        self._stream_parse,
+                        chunks,
+                        response.charset,
+                        plan,
+                        time.monotonic(),
+                    )
+                    new = bytes(body[:end])
+                if chunks is not None:
+                    chunks.put(new)
+                read = end
+                if scanner.done:
+                    break
+        except BaseException:
+            if chunks is not None:
+                chunks.put(None)
+                # The parse of an aborted body is never used
+                streamed.cancel()
+            raise
+        if chunks is not None:
+            chunks.put(None)
+        self._finish_read(len(body), scanner.done)
+        del body[read:]
+        return bytes(body), digest.hexdigest(), streamed
+
+    def _parse_body(
+        self, raw: bytes, charset: str | None, plan: ParsePlan, submitted: float
+    ) -> _ParseJob:
+        """Prefilter, parse and index a raw body in a single executor job.
+
+        The tree never leaves the job; only the immutable page does. With a
+        worker process the job only waits for the articles it sends back.
+        The job leaves the hub untouched; its outcome is applied on the loop.
+        """
+        started = time.monotonic()
+        hits = misses = None
+        filtered = prefilter_body(raw, charset, plan)
+        if filtered is None:
+            plan = replace(plan, locations=None)
+        else:
+            raw, charset = filtered.body, filtered.encoding
+            hits, misses = filtered.hits, filtered.misses
+        articles = None
+        worker_failed = False
+        if (worker := self._worker) is not None:
+            try:
+                articles = worker.parse(raw, charset, self._backend.name, plan)
+            except ParseWorkerError as err:
+                worker_failed = True
+                _LOGGER.warning("%s, parsing in a thread instead", err)
+        if articles is None:
+            articles = self._backend.parse_bytes(raw, charset, plan)
+        return _ParseJob(
+            page=ParsedPage(articles=articles, fetched_at=datetime.now(), plan=plan),
+            prefilter_hits=hits,
+            prefilter_misses=misses,
+            worker_failed=worker_failed,
+            wait=started - submitted,
+            run=time.monotonic() - started,
+        )
+
+    def _stream_parse(
+        self,
+        chunks: queue.SimpleQueue[bytes | None],
+        charset: str | None,
+        plan: ParsePlan,
+        submitted: float,
+    ) -> _ParseJob:
+        """Feed the downloading body to the streaming backend, in an executor job.
+
+        Only the article being parsed is held besides the pending input. The
+        articles are not prefiltered, so the page serves every location.
+        """
+        started = time.monotonic()
+        run = 0.0
+        stream = self._backend.open_stream(plan)
+        decoder = None
+        # Bytes held back until a meta charset could be detected
+        head = b""
+        while (chunk := chunks.get()) is not None:
+            if stream.done:
+                continue
+            feed_started = time.monotonic()
+            if decoder is None:
+                head += chunk
+                if len(head) < META_SNIFF_BYTES:
+                    continue
+                decoder = self._decoder(head, charset)
+                chunk, head = head, b""
+            stream.feed(decoder.decode(chunk))
+            run += time.monotonic() - feed_started
+        feed_started = time.monotonic()
+        if decoder is None:
+            decoder = self._decoder(head, charset)
+        stream.feed(decoder.decode(head, final=True))
+        stream.close()
+        page = ParsedPage(
+            articles=tuple(stream.articles),
+            fetched_at=datetime.now(),
+            plan=replace(plan, locations=None),
+        )
+        return _ParseJob(
+            page=page,
+            prefilter_hits=None,
+            prefilter_misses=None,
+            worker_failed=False,
+            wait=started - submitted,
+            run=run + time.monotonic() - feed_started,
+        )
+
+    @staticmethod
+    def _decoder(head: bytes, charset: str | None) -> codecs.IncrementalDecoder:
+        """Return the incremental decoder for a body starting with head."""
+        return codecs.getincrementaldecoder(detect_encoding(head, charset))(
+            errors="replace"
+        )
+
+    async def _async_parse(
+        self,
+        body: tuple[bytes, str | None],
+        etag: str | None,
+        last_modified: str | None,
+        body_hash: str,
+        streamed: asyncio.Future[_ParseJob] | None,
+        plan: ParsePlan,
+    ) -> ParsedPage:
+        """Parse a downloaded body and remember the validators describing it."""
+        if streamed is not None:
+            job = await streamed
+        else:
+            job = await self.hass.async_add_executor_job(
+                self._parse_body, *body, plan, time.monotonic()
+            )
+        page = job.page
+        self._prefilter_hits = job.prefilter_hits
+        self._prefilter_misses = job.prefilter_misses
+        self._worker_fallbacks += job.worker_failed
+        self._parse_wait_ms = round(job.wait * 1000, 1)
+        self._parse_run_ms = round(job.run * 1000, 1)
+        _LOGGER.debug(
+            "Parsed page in %.1f ms after waiting %.1f ms for an executor thread",
+            self._parse_run_ms,
+            self._parse_wait_ms,
+        )
+        if self._prefilter_hits is not None:
+            _LOGGER.debug(
+                "Prefilter passed %d of %d articles",
+                self._prefilter_hits,
+                self._prefilter_hits + self._prefilter_misses,
+            )
+        self._parses += 1
+        # Only remember validators once the body they describe has been parsed
+        self._etag, self._last_modified = etag, last_modified
+        self._body_hash = body_hash
+        self._body = body
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        return page
+
+    @callback
+    def _async_fan_out(self, requester: EnnatuurlijkCoordinator | None) -> None:
+        """Push the fresh page to every other coordinator that already has data.
+
+        Coordinators awaiting the fetch themselves receive it as its result.
+
+        This also resets their refresh timers, so all locations share one tick.
+        """
+        for coordinator in self._coordinators:
+            if (
+                coordinator is requester
+                or coordinator in self._waiters
+                or coordinator.data is None
+            ):
+                continue
+            self._deliveries += 1
+            coordinator.async_set_updated_data(coordinator.build_data(self._page))
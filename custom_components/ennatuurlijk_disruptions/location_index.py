@@ -0,0 +1,89 @@
+"""Inverted index from location tokens to the disruption articles of a page."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import re
+import unicodedata
+
+# Longest town name, in words, that is a single index key ("Bergen op Zoom").
+# Longer names are looked up by their first words and then verified.
+MAX_TOWN_WORDS = 4
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+# Postal codes must not be part of a longer number: "1234" does not match "12345"
+_PC4_RE = re.compile(r"(?<!\d)(\d{4})(?!\d)")
+_PC6_RE = re.compile(r"(?<!\d)(\d{4}) ?([A-Za-z]{2})(?![^\W\d_])")
+
+
+def town_tokens(text: str) -> tuple[str, ...]:
+    """Return the case and accent folded words of a text."""
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return tuple(_WORD_RE.findall(folded))
+
+
+def town_key(town: str) -> str:
+    """Return the index key of a configured town."""
+    return " ".join(town_tokens(town))
+
+
+def postal_code_keys(postal_code: str) -> tuple[str, str]:
+    """Return the PC4 and PC6 index keys of a configured postal code."""
+    normalized = postal_code.replace(" ", "").upper()
+    return normalized[:4], normalized
+
+
+class LocationIndex:
+    """Map towns, PC4 prefixes and full postal codes to article ids.
+
+    Built once per parsed page; every location is then resolved with a few
+    dictionary lookups instead of substring scans over all titles. Article ids
+    are positions in the page's article tuple.
+    """
+
+    def __init__(self, articles: tuple[tuple, ...]) -> None:
+        """Tokenize all article titles."""
+        self._words: list[tuple[str, ...]] = []
+        self._towns: dict[str, set[int]] = defaultdict(set)
+        self._postal_codes: dict[str, set[int]] = defaultdict(set)
+        for article_id, (_, title, *_rest) in enumerate(articles):
+            words = town_tokens(title)
+            self._words.append(words)
+            for size in range(1, MAX_TOWN_WORDS + 1):
+                for start in range(len(words) - size + 1):
+                    self._towns[" ".join(words[start : start + size])].add(
+                        article_id
+                    )
+            for match in _PC4_RE.finditer(title):
+                self._postal_codes[match.group(1)].add(article_id)
+            for match in _PC6_RE.finditer(title):
+                self._postal_codes[
+                    f"{match.group(1)}{match.group(2).upper()}"
+                ].add(article_id)
+
+    def lookup(self, town: str, postal_code: str) -> list[int]:
+        """Return the ids of the articles mentioning the town or postal code."""
+        pc4, pc6 = postal_code_keys(postal_code)
+        ids = self._lookup_town(town_tokens(town))
+        for key in (pc4, pc6):
+            if key:
+                ids |= self._postal_codes.get(key, set())
+        return sorted(ids)
+
+    def _lookup_town(self, words: tuple[str, ...]) -> set[int]:
+        """Return the ids of the articles containing the town's words in order."""
+        if not words:
+            return set()
+        ids = self._towns.get(" ".join(words[:MAX_TOWN_WORDS]), set())
+        if len(words) <= MAX_TOWN_WORDS:
+            return set(ids)
+        size = len(words)
+        return {
+            article_id
+            for article_id in ids
+            if any(
+                self._words[article_id][start : start + size] == words
+                for start in range(len(self._words[article_id]) - size + 1)
+            )
+        }
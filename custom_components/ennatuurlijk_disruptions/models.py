@@ -0,0 +1,61 @@
+"""Typed disruption records for Ennatuurlijk Disruptions."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+import logging
+import re
+
+from .parser import SECTION_MAP
+
+_LOGGER = logging.getLogger(__name__)
+
+_ID_RE = re.compile(r"/(\d+)$")
+
+
+@dataclass(frozen=True, slots=True)
+class Disruption:
+    """A disruption with its date, link and id parsed once per page.
+
+    ``status`` is the coordinator key: planned, current or solved. Entities
+    turn records into attribute dicts with :meth:`as_dict` only when writing
+    their state.
+    """
+
+    id: int | None
+    status: str
+    title: str
+    date: date
+    link: str | None
+
+    @classmethod
+    def from_article(cls, article: tuple) -> Disruption | None:
+        """Build a record from a ``(section, title, date, link)`` article.
+
+        Returns None if the date does not exist in the calendar.
+        """
+        section, title, date_str, link = article
+        day, month, year = date_str.split("-")
+        try:
+            day_date = date(int(year), int(month), int(day))
+        except ValueError:
+            _LOGGER.debug("Skipping '%s' with invalid date %s", title, date_str)
+            return None
+        match = _ID_RE.search(link) if link else None
+        return cls(
+            id=int(match.group(1)) if match else None,
+            status=SECTION_MAP[section],
+            title=title,
+            date=day_date,
+            link=link,
+        )
+
+    @property
+    def date_str(self) -> str:
+        """Return the date as shown on the website, dd-mm-YYYY."""
+        return self.date.strftime("%d-%m-%Y")
+
+    def as_dict(self) -> dict:
+        """Return the dict used in the entity ``dates`` attributes."""
+        return {"description": self.title, "date": self.date_str, "link": self.link}
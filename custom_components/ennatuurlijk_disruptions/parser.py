@@ -0,0 +1,259 @@
+"""HTML parsing for the Ennatuurlijk storingen page."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import logging
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .const import MONTH_TO_NUMBER
+
+_LOGGER = logging.getLogger(__name__)
+
+DATE_PATTERN = r"\b(\d{1,2}\s+(?:januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)\s+\d{4})\b"
+
+# Page section id -> result key
+SECTION_MAP = {
+    "current": "current",
+    "planned": "planned",
+    "completed": "solved",
+}
+
+SOLVED_SECTION = "completed"
+
+# Only the section containers (and everything inside them) are built into the
+# tree; headers, navigation, scripts and the footer are skipped while parsing.
+SECTION_STRAINER = SoupStrainer("div", id=list(SECTION_MAP))
+
+
+@dataclass(frozen=True, slots=True)
+class ParsePlan:
+    """The sections and solved dates the configuration needs from a page.
+
+    Sections are in page order, which is the order of SECTION_MAP, so
+    nothing after ``last_section`` is needed.
+    """
+
+    sections: tuple[str, ...] = tuple(SECTION_MAP)
+    # Solved articles dated before this are rejected; None keeps them all
+    solved_since: date | None = None
+    # (town, postal code) of the monitored locations; only articles that may
+    # mention one of them are parsed. None parses every article.
+    locations: frozenset[tuple[str, str]] | None = None
+
+    @classmethod
+    def for_retention(
+        cls,
+        days_to_keep_solved: int,
+        today: date,
+        locations: frozenset[tuple[str, str]] | None = None,
+    ) -> ParsePlan:
+        """Return the plan for a solved retention; 0 skips solved disruptions."""
+        if days_to_keep_solved <= 0:
+            return cls(
+                tuple(s for s in SECTION_MAP if s != SOLVED_SECTION),
+                locations=locations,
+            )
+        return cls(
+            solved_since=today - timedelta(days=days_to_keep_solved),
+            locations=locations,
+        )
+
+    @property
+    def last_section(self) -> str:
+        """Return the last needed section in page order."""
+        return self.sections[-1]
+
+    def keeps_solved(self, day: date) -> bool:
+        """Return True if a disruption solved on a day is kept."""
+        return SOLVED_SECTION in self.sections and (
+            self.solved_since is None or day >= self.solved_since
+        )
+
+    def keeps(self, section_name: str, date_text: str) -> bool:
+        """Return False for a solved article (dd-mm-YYYY) outside the window."""
+        if section_name != SOLVED_SECTION or self.solved_since is None:
+            return True
+        try:
+            day = datetime.strptime(date_text, "%d-%m-%Y").date()
+        except ValueError:
+            # Left to the record validation
+            return True
+        return day >= self.solved_since
+
+    def covers(self, other: ParsePlan) -> bool:
+        """Return True if a page parsed with this plan has all other needs."""
+        if not set(other.sections) <= set(self.sections):
+            return False
+        if self.locations is not None and (
+            other.locations is None or not other.locations <= self.locations
+        ):
+            return False
+        if SOLVED_SECTION not in other.sections or self.solved_since is None:
+            return True
+        return (
+            other.solved_since is not None
+            and other.solved_since >= self.solved_since
+        )
+
+
+FULL_PLAN = ParsePlan()
+
+
+def build_soup(
+    html, restrict_sections=True, from_encoding=None, sections=FULL_PLAN.sections
+):
+    """Build the BeautifulSoup tree, by default only for the disruption sections."""
+    if not restrict_sections:
+        strainer = None
+    elif sections == FULL_PLAN.sections:
+        strainer = SECTION_STRAINER
+    else:
+        strainer = SoupStrainer("div", id=list(sections))
+    return BeautifulSoup(
+        html, "html.parser", parse_only=strainer, from_encoding=from_encoding
+    )
+
+
+def get_sections(soup, names=FULL_PLAN.sections):
+    sections = {name: soup.find("div", id=name) for name in names}
+    _LOGGER.debug("Found sections: %s", {k: bool(v) for k, v in sections.items()})
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return sections
+
+    # Additional debug info about sections content
+    for section_name, section in sections.items():
+        if section:
+            articles = section.find_all("article", class_="node--type-malfunction")
+            _LOGGER.debug(
+                "Section '%s' contains %d articles", section_name, len(articles)
+            )
+            for i, article in enumerate(articles):
+                title_elem = article.find("h4", class_="h3")
+                title = title_elem.get_text(strip=True) if title_elem else "No title"
+                _LOGGER.debug("  Article %d in '%s': %s", i + 1, section_name, title)
+        else:
+            _LOGGER.debug("Section '%s' not found in HTML", section_name)
+
+    return sections
+
+
+def extract_date(disruption, date_pattern):
+    expectation = disruption.find("div", class_="expectation")
+    if not expectation:
+        _LOGGER.debug("No expectation div found in disruption article")
+        return ""
+
+    value = expectation.find("div", class_="value")
+    if not value:
+        _LOGGER.debug("No value div found in expectation div")
+        return ""
+
+    date = value.get_text(strip=True)
+    _LOGGER.debug("Raw date text from expectation value: '%s'", date)
+    return normalize_date(date, date_pattern)
+
+
+def normalize_date(date, date_pattern=DATE_PATTERN):
+    """Return a Dutch date text as dd-mm-YYYY, or "" if it is not a date."""
+    match = date and re.match(date_pattern, date, re.IGNORECASE)
+    _LOGGER.debug(
+        "Date pattern match for '%s': %s (pattern: %s)", date, bool(match), date_pattern
+    )
+
+    if match:
+        m = re.match(r"(\d{1,2})\s+([a-z]+)\s+(\d{4})", date, re.IGNORECASE)
+        if m:
+            day = m.group(1).zfill(2)
+            month = MONTH_TO_NUMBER.get(m.group(2).lower(), "01")
+            year = m.group(3)
+            formatted_date = f"{day}-{month}-{year}"
+            _LOGGER.debug(
+                "Formatted date: %s (from %s %s %s)",
+                formatted_date,
+                day,
+                m.group(2),
+                year,
+            )
+            return formatted_date
+
+    return date if match else ""
+
+
+def normalize_link(link):
+    """Return an absolute disruption link."""
+    if link and link.startswith("/"):
+        return f"https://ennatuurlijk.nl{link}"
+    return link
+
+
+def parse_article(disruption, section_name, date_pattern=DATE_PATTERN, plan=FULL_PLAN):
+    """Return (section, title, date, link) for an article.
+
+    Returns None without a date, or when the plan does not keep the date.
+    """
+    date = extract_date(disruption, date_pattern)
+    if not date:
+        _LOGGER.debug(
+            "Failed to extract date from article in '%s', skipping", section_name
+        )
+        return None
+    if not plan.keeps(section_name, date):
+        _LOGGER.debug("Skipping article in '%s' dated %s", section_name, date)
+        return None
+
+    title_elem = disruption.find("h4", class_="h3")
+    title = title_elem.get_text(strip=True) if title_elem else ""
+    _LOGGER.debug("Parsing article in section '%s': title='%s'", section_name, title)
+
+    # Robustly find a link to the disruption if present (any <a> in the article)
+    link_elem = disruption.find("a", href=True)
+    link = None
+    if link_elem:
+        link = normalize_link(link_elem["href"])
+        _LOGGER.debug("Found link for article: %s", link)
+    else:
+        _LOGGER.debug("No link found for article: %s", title)
+
+    return (section_name, title, date, link)
+
+
+def parse_section(section, section_name, date_pattern=DATE_PATTERN, plan=FULL_PLAN):
+    """Return every dated article of a section, regardless of location."""
+    disruptions_info = []
+    if not section:
+        _LOGGER.debug("Section %s not found on the page", section_name)
+        return disruptions_info
+
+    disruptions = section.find_all("article", class_="node--type-malfunction")
+    _LOGGER.debug("Found %d disruptions in section %s", len(disruptions), section_name)
+
+    for i, disruption in enumerate(disruptions):
+        info = parse_article(disruption, section_name, date_pattern, plan)
+        if info:
+            disruptions_info.append(info)
+        else:
+            _LOGGER.debug("Skipped disruption %d (invalid)", i + 1)
+
+    _LOGGER.debug(
+        "Section '%s' processing complete: %d valid disruptions found",
+        section_name,
+        len(disruptions_info),
+    )
+    return disruptions_info
+
+
+def parse_page(soup, plan=FULL_PLAN) -> tuple[tuple, ...]:
+    """Parse the disruption articles the plan needs, independent of location.
+
+    The result is shared by all locations, which only need to filter it.
+    """
+    articles = []
+    for section_name, section in get_sections(soup, plan.sections).items():
+        articles.extend(parse_section(section, section_name, plan=plan))
+    _LOGGER.debug("Parsed %d disruption articles from page", len(articles))
+    return tuple(articles)
+
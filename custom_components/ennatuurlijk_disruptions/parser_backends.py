@@ -0,0 +1,417 @@
+"""Pluggable HTML parser backends for the storingen page.
+
+Every backend turns the page HTML into the same tuple of
+``(section, title, date, link)`` articles as :func:`parser.parse_page`, limited
+to what a :class:`parser.ParsePlan` asks for. The html.parser backend is always
+available; lxml and selectolax are optional fast paths used when the library
+is installed.
+"""
+
+from __future__ import annotations
+
+import codecs
+import logging
+import re
+
+from .parser import (
+    DATE_PATTERN,
+    FULL_PLAN,
+    ParsePlan,
+    build_soup,
+    get_sections,
+    normalize_date,
+    normalize_link,
+    parse_section,
+)
+from .streaming import DisruptionStreamParser
+
+try:
+    import lxml.html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    lxml_html = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:  # pragma: no cover - optional dependency
+    SelectolaxParser = None
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKEND_AUTO = "auto"
+BACKEND_HTML_PARSER = "html.parser"
+BACKEND_LXML = "lxml"
+BACKEND_SELECTOLAX = "selectolax"
+BACKEND_STREAM = "stream"
+
+# Preference order when the backend is "auto", fastest first
+AUTO_ORDER = (BACKEND_SELECTOLAX, BACKEND_LXML, BACKEND_STREAM, BACKEND_HTML_PARSER)
+
+
+# A meta charset must appear this early in the document
+META_SNIFF_BYTES = 1024
+
+_META_CHARSET_RE = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-z0-9_.:-]+)""", re.IGNORECASE
+)
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _known_encoding(label: str | bytes | None) -> str | None:
+    """Return the canonical codec name of a charset label, if Python knows it."""
+    if not label:
+        return None
+    if isinstance(label, bytes):
+        label = label.decode("ascii", errors="ignore")
+    try:
+        return codecs.lookup(label).name
+    except LookupError:
+        return None
+
+
+def detect_encoding(raw: bytes, charset: str | None = None) -> str:
+    """Return the encoding of a page body.
+
+    A byte order mark wins, then the Content-Type charset, then a meta
+    charset near the top of the document; UTF-8 otherwise.
+    """
+    for bom, encoding in _BOMS:
+        if raw.startswith(bom):
+            return encoding
+    if encoding := _known_encoding(charset):
+        return encoding
+    if match := _META_CHARSET_RE.search(raw, 0, META_SNIFF_BYTES):
+        if encoding := _known_encoding(match.group(1)):
+            return encoding
+    return "utf-8"
+
+
+def decode_body(raw: bytes, charset: str | None) -> str:
+    """Decode a page body in its detected encoding."""
+    return raw.decode(detect_encoding(raw, charset), errors="replace")
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+class ParserBackend:
+    """Base class for a parser backend.
+
+    Subclasses provide the tree specific ``build_tree``, ``get_sections``,
+    ``find_articles``, ``get_title``, ``get_link`` and ``get_date_text``; the
+    article assembly is shared so all backends produce identical output.
+    """
+
+    name = ""
+    # Streaming backends parse the body while it downloads, see open_stream
+    streaming = False
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return True if the backend library is installed."""
+        return True
+
+    def build_tree(self, html: str, plan: ParsePlan = FULL_PLAN):
+        """Build the document tree for the page."""
+        raise NotImplementedError
+
+    def build_tree_from_bytes(
+        self, raw: bytes, charset: str | None, plan: ParsePlan = FULL_PLAN
+    ):
+        """Build the tree from a raw body; by default it is decoded first."""
+        return self.build_tree(decode_body(raw, charset), plan)
+
+    def get_sections(self, tree, names=FULL_PLAN.sections) -> dict:
+        """Return the named section nodes."""
+        raise NotImplementedError
+
+    def find_articles(self, section) -> list:
+        """Return the disruption article nodes of a section."""
+        raise NotImplementedError
+
+    def get_title(self, article) -> str:
+        """Return the stripped title text of an article."""
+        raise NotImplementedError
+
+    def get_link(self, article) -> str | None:
+        """Return the href of the first link in an article."""
+        raise NotImplementedError
+
+    def get_date_text(self, article) -> str:
+        """Return the raw expectation date text of an article."""
+        raise NotImplementedError
+
+    def extract_date(self, article, date_pattern=DATE_PATTERN) -> str:
+        """Return the article date as dd-mm-YYYY, or "" without a date."""
+        return normalize_date(self.get_date_text(article), date_pattern)
+
+    def parse_section(
+        self, section, section_name, date_pattern=DATE_PATTERN, plan=FULL_PLAN
+    ):
+        """Return every dated article of a section the plan keeps."""
+        if section is None:
+            return []
+        articles = []
+        for article in self.find_articles(section):
+            date = self.extract_date(article, date_pattern)
+            if not date or not plan.keeps(section_name, date):
+                continue
+            link = self.get_link(article)
+            articles.append(
+                (
+                    section_name,
+                    self.get_title(article),
+                    date,
+                    normalize_link(link) if link is not None else None,
+                )
+            )
+        return articles
+
+    def parse_tree(self, tree, plan: ParsePlan = FULL_PLAN) -> tuple[tuple, ...]:
+        """Parse the disruption articles in the tree that the plan needs."""
+        articles = []
+        for section_name, section in self.get_sections(tree, plan.sections).items():
+            articles.extend(self.parse_section(section, section_name, plan=plan))
+        _LOGGER.debug(
+            "Parsed %d disruption articles with %s", len(articles), self.name
+        )
+        return tuple(articles)
+
+    def release_tree(self, tree) -> None:
+        """Free a parsed tree; by default it is left to the garbage collector."""
+
+    def parse_page(self, html: str, plan: ParsePlan = FULL_PLAN) -> tuple[tuple, ...]:
+        """Build the tree, parse it and release it in one go."""
+        tree = self.build_tree(html, plan)
+        try:
+            return self.parse_tree(tree, plan)
+        finally:
+            self.release_tree(tree)
+
+    def parse_bytes(
+        self, raw: bytes, charset: str | None, plan: ParsePlan = FULL_PLAN
+    ) -> tuple[tuple, ...]:
+        """Parse a raw page body, decoding it only if the library needs text."""
+        tree = self.build_tree_from_bytes(raw, charset, plan)
+        try:
+            return self.parse_tree(tree, plan)
+        finally:
+            self.release_tree(tree)
+
+
+class HtmlParserBackend(ParserBackend):
+    """BeautifulSoup with the standard library html.parser.
+
+    By default only the section divs are built into the tree, which roughly
+    halves both parse time and tree memory on the real page.
+    """
+
+    name = BACKEND_HTML_PARSER
+
+    def __init__(self, restrict_sections: bool = True) -> None:
+        """Initialize the backend."""
+        self.restrict_sections = restrict_sections
+
+    def build_tree(self, html: str, plan: ParsePlan = FULL_PLAN):
+        """Build a BeautifulSoup tree of the needed sections."""
+        return build_soup(html, self.restrict_sections, sections=plan.sections)
+
+    def build_tree_from_bytes(
+        self, raw: bytes, charset: str | None, plan: ParsePlan = FULL_PLAN
+    ):
+        """Let BeautifulSoup decode the body in the detected encoding."""
+        return build_soup(
+            raw,
+            self.restrict_sections,
+            from_encoding=detect_encoding(raw, charset),
+            sections=plan.sections,
+        )
+
+    def get_sections(self, tree, names=FULL_PLAN.sections) -> dict:
+        """Return the section divs."""
+        return get_sections(tree, names)
+
+    def parse_section(
+        self, section, section_name, date_pattern=DATE_PATTERN, plan=FULL_PLAN
+    ):
+        """Use the original BeautifulSoup section parser."""
+        return parse_section(section, section_name, date_pattern, plan)
+
+    def release_tree(self, tree) -> None:
+        """Break up the soup so its reference cycles are freed at once."""
+        tree.decompose()
+
+
+class LxmlBackend(ParserBackend):
+    """lxml.html with XPath lookups."""
+
+    name = BACKEND_LXML
+
+    _ARTICLES = f".//article[{_has_class('node--type-malfunction')}]"
+    _TITLE = f".//h4[{_has_class('h3')}]"
+    _DATE = f".//div[{_has_class('expectation')}]//div[{_has_class('value')}]"
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return True if lxml is installed."""
+        return lxml_html is not None
+
+    @staticmethod
+    def _text(element) -> str:
+        return "".join(text.strip() for text in element.itertext())
+
+    @staticmethod
+    def _first(elements):
+        return elements[0] if elements else None
+
+    def build_tree(self, html: str, plan: ParsePlan = FULL_PLAN):
+        """Build an lxml element tree."""
+        return lxml_html.document_fromstring(html)
+
+    def build_tree_from_bytes(
+        self, raw: bytes, charset: str | None, plan: ParsePlan = FULL_PLAN
+    ):
+        """Let libxml2 decode the body while it parses."""
+        parser = lxml_html.HTMLParser(encoding=detect_encoding(raw, charset))
+        return lxml_html.document_fromstring(raw, parser=parser)
+
+    def release_tree(self, tree) -> None:
+        """Drop the children of the document."""
+        tree.clear()
+
+    def get_sections(self, tree, names=FULL_PLAN.sections) -> dict:
+        """Return the section divs."""
+        return {
+            section: self._first(tree.xpath(f"//div[@id='{section}']"))
+            for section in names
+        }
+
+    def find_articles(self, section) -> list:
+        """Return the malfunction articles of a section."""
+        return section.xpath(self._ARTICLES)
+
+    def get_title(self, article) -> str:
+        """Return the h4 title text."""
+        title = self._first(article.xpath(self._TITLE))
+        return self._text(title) if title is not None else ""
+
+    def get_link(self, article) -> str | None:
+        """Return the first href in the article."""
+        return self._first(article.xpath(".//a/@href"))
+
+    def get_date_text(self, article) -> str:
+        """Return the expectation value text."""
+        value = self._first(article.xpath(self._DATE))
+        return self._text(value) if value is not None else ""
+
+
+class SelectolaxBackend(ParserBackend):
+    """selectolax (lexbor) with CSS selectors."""
+
+    name = BACKEND_SELECTOLAX
+
+    @classmethod
+    def available(cls) -> bool:
+        """Return True if selectolax is installed."""
+        return SelectolaxParser is not None
+
+    @staticmethod
+    def _text(node) -> str:
+        return node.text(deep=True, separator="", strip=True)
+
+    def build_tree(self, html: str, plan: ParsePlan = FULL_PLAN):
+        """Build a selectolax tree."""
+        return SelectolaxParser(html)
+
+    def build_tree_from_bytes(
+        self, raw: bytes, charset: str | None, plan: ParsePlan = FULL_PLAN
+    ):
+        """Hand UTF-8 bodies to lexbor as is; it decodes bytes as UTF-8."""
+        if detect_encoding(raw, charset) == "utf-8":
+            return SelectolaxParser(raw)
+        return self.build_tree(decode_body(raw, charset))
+
+    def get_sections(self, tree, names=FULL_PLAN.sections) -> dict:
+        """Return the section divs."""
+        return {section: tree.css_first(f"div#{section}") for section in names}
+
+    def find_articles(self, section) -> list:
+        """Return the malfunction articles of a section."""
+        return section.css("article.node--type-malfunction")
+
+    def get_title(self, article) -> str:
+        """Return the h4 title text."""
+        title = article.css_first("h4.h3")
+        return self._text(title) if title is not None else ""
+
+    def get_link(self, article) -> str | None:
+        """Return the first href in the article."""
+        link = article.css_first("a[href]")
+        return link.attributes.get("href") if link is not None else None
+
+    def get_date_text(self, article) -> str:
+        """Return the expectation value text."""
+        value = article.css_first("div.expectation div.value")
+        return self._text(value) if value is not None else ""
+
+
+class StreamBackend(ParserBackend):
+    """Event driven extractor on the standard library tokenizer, without a tree."""
+
+    name = BACKEND_STREAM
+    streaming = True
+
+    def open_stream(self, plan: ParsePlan = FULL_PLAN) -> DisruptionStreamParser:
+        """Return a parser to feed the page to chunk by chunk."""
+        return DisruptionStreamParser(plan=plan)
+
+    def build_tree(self, html: str, plan: ParsePlan = FULL_PLAN):
+        """Feed the whole page; the finished parser stands in for a tree."""
+        stream = self.open_stream(plan)
+        stream.feed(html)
+        stream.close()
+        return stream
+
+    def parse_tree(self, tree, plan: ParsePlan = FULL_PLAN) -> tuple[tuple, ...]:
+        """Return the articles collected by the parser."""
+        return tuple(tree.articles)
+
+
+BACKENDS: dict[str, type[ParserBackend]] = {
+    BACKEND_HTML_PARSER: HtmlParserBackend,
+    BACKEND_LXML: LxmlBackend,
+    BACKEND_SELECTOLAX: SelectolaxBackend,
+    BACKEND_STREAM: StreamBackend,
+}
+
+
+def available_backends() -> list[str]:
+    """Return the names of the installed backends."""
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+
+def get_backend(name: str | None = BACKEND_AUTO) -> ParserBackend:
+    """Return the requested backend, falling back to html.parser.
+
+    "auto" picks the fastest installed backend. A backend whose library is
+    missing logs a warning and falls back instead of failing the setup.
+    """
+    if not name or name == BACKEND_AUTO:
+        candidates = AUTO_ORDER
+    else:
+        candidates = (name, BACKEND_HTML_PARSER)
+    for candidate in candidates:
+        backend = BACKENDS.get(candidate)
+        if backend is not None and backend.available():
+            return backend()
+        if candidate == name:
+            _LOGGER.warning(
+                "Parser backend %s is not available, falling back to %s",
+                name,
+                BACKEND_HTML_PARSER,
+            )
+    return HtmlParserBackend()
@@ -0,0 +1,133 @@
+"""Raw text prefilter for the articles of the monitored locations.
+
+Most articles on the storingen page are about places no location monitors.
+Before the body is parsed, the raw article fragments of the needed sections
+are scanned for every configured town and postal code, and only the fragments
+that hit are handed to the parser as a much smaller document. The scan is
+conservative: it never drops an article that
+:class:`location_index.LocationIndex` would match for a location.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import re
+
+from .location_index import postal_code_keys, town_tokens
+from .parser import ParsePlan
+from .parser_backends import detect_encoding
+from .streaming import SectionEndScanner
+
+_ARTICLE_START_RE = re.compile(
+    rb"<article\b[^>]*\bnode--type-malfunction\b", re.IGNORECASE
+)
+_ARTICLE_END = b"</article"
+
+
+@dataclass(frozen=True, slots=True)
+class PrefilterResult:
+    """The reduced document and how many articles hit or missed."""
+
+    body: bytes
+    encoding: str
+    hits: int
+    misses: int
+
+
+class LocationMatcher:
+    """Multi-pattern scan for the locations in lower cased raw text.
+
+    A town is matched by its longest word, which every title naming the town
+    contains; a postal code by its PC4 digits, with which the full postal
+    code starts. Each term is a substring search, which is several times
+    faster than one alternation regex for a handful of locations.
+    """
+
+    def __init__(self, towns: Iterable[bytes], pc4s: Iterable[bytes]) -> None:
+        """Initialize the matcher from lower cased ASCII terms."""
+        self._towns = tuple(sorted(set(towns)))
+        self._pc4s = tuple(sorted(set(pc4s)))
+        # Postal codes must not be part of a longer number, as in the index
+        self._pc4_re = re.compile(
+            rb"(?<![0-9])(?:%s)(?![0-9])" % b"|".join(self._pc4s)
+        )
+
+    @classmethod
+    def for_locations(
+        cls, locations: Iterable[tuple[str, str]]
+    ) -> LocationMatcher | None:
+        """Return the matcher, or None for a town that is not ASCII once folded."""
+        towns = []
+        pc4s = []
+        for town, postal_code in locations:
+            if words := town_tokens(town):
+                word = max(words, key=len)
+                if not word.isascii():
+                    return None
+                towns.append(word.encode())
+            pc4, _pc6 = postal_code_keys(postal_code)
+            # Anything else never matches the index either
+            if len(pc4) == 4 and pc4.isdigit():
+                pc4s.append(pc4.encode())
+        return cls(towns, pc4s)
+
+    def hits(self, fragment: bytes) -> bool:
+        """Return True if a lower cased fragment may mention a location.
+
+        Accented letters and character references may spell a town
+        differently from its folded key, so such fragments always hit.
+        """
+        if not fragment.isascii() or b"&" in fragment:
+            return True
+        if any(town in fragment for town in self._towns):
+            return True
+        return any(pc4 in fragment for pc4 in self._pc4s) and bool(
+            self._pc4_re.search(fragment)
+        )
+
+
+def prefilter_body(
+    raw: bytes, charset: str | None, plan: ParsePlan
+) -> PrefilterResult | None:
+    """Keep only the articles of the needed sections that hit a location.
+
+    Returns None when the body is parsed unfiltered: the plan has no
+    locations, a town cannot be matched on raw bytes, or the encoding is not
+    ASCII compatible.
+    """
+    if plan.locations is None:
+        return None
+    matcher = LocationMatcher.for_locations(plan.locations)
+    if matcher is None:
+        return None
+    encoding = detect_encoding(raw, charset)
+    if "<article>".encode(encoding) != b"<article>":
+        return None
+
+    lowered = raw.lower()
+    parts: list[bytes] = []
+    hits = misses = 0
+    pos = 0
+    for section in plan.sections:
+        # Sections follow each other in page order
+        scanner = SectionEndScanner(section, pos)
+        scanner.scan(raw)
+        if scanner.start is None:
+            continue
+        end = pos = scanner.end if scanner.end is not None else len(raw)
+        parts.append(b'<div id="%s">' % section.encode())
+        for match in _ARTICLE_START_RE.finditer(raw, scanner.start, end):
+            stop = raw.find(_ARTICLE_END, match.end(), end)
+            if stop < 0 or (stop := raw.find(b">", stop, end)) < 0:
+                # An unclosed article runs to the end of the section
+                stop = end
+            else:
+                stop += 1
+            if matcher.hits(lowered[match.start() : stop]):
+                parts.append(raw[match.start() : stop])
+                hits += 1
+            else:
+                misses += 1
+        parts.append(b"</div>")
+    return PrefilterResult(b"\n".join(parts), encoding, hits, misses)
@@ -0,0 +1,151 @@
+"""Optional parse worker process for very large storingen pages.
+
+A pure Python parse holds the GIL for its whole run, which shows up as event
+loop latency in the rest of Home Assistant when the page is large. The worker
+parses in a separate, long lived process instead: raw bytes go in and the
+compact ``(section, title, date, link)`` article tuples come back. A crashed
+or hung worker is replaced and the caller falls back to parsing in a thread.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import contextlib
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+
+from .parser import FULL_PLAN, ParsePlan
+from .parser_backends import ParserBackend, get_backend
+
+_LOGGER = logging.getLogger(__name__)
+
+# Run in the worker before anything is unpickled: registers the parent
+# packages as bare modules, so importing this module there does not run the
+# integration's __init__, which imports Home Assistant
+_BOOTSTRAP = """
+import sys
+import types
+
+for name, path in packages:
+    if name not in sys.modules:
+        module = sys.modules[name] = types.ModuleType(name)
+        module.__path__ = [path]
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, module)
+"""
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PACKAGES = [
+    (__package__.rpartition(".")[0], os.path.dirname(_PACKAGE_DIR)),
+    (__package__, _PACKAGE_DIR),
+]
+
+# Backends of the worker process, kept warm between parses
+_WORKER_BACKENDS: dict[str, ParserBackend] = {}
+
+
+def _warm_up(backend_name: str) -> str:
+    """Import and create the backend in the worker process."""
+    backend = _WORKER_BACKENDS.setdefault(backend_name, get_backend(backend_name))
+    return backend.name
+
+
+def _parse_in_worker(
+    raw: bytes, charset: str | None, backend_name: str, plan: ParsePlan
+) -> tuple[tuple, ...]:
+    """Parse a body in the worker process."""
+    backend = _WORKER_BACKENDS.get(backend_name)
+    if backend is None:
+        backend = _WORKER_BACKENDS[backend_name] = get_backend(backend_name)
+    return backend.parse_bytes(raw, charset, plan)
+
+
+class ParseWorkerError(Exception):
+    """The worker process crashed or did not answer in time."""
+
+
+class ParseWorker:
+    """A single warm worker process, restarted after a crash or timeout.
+
+    The blocking methods are meant to run in an executor thread, which only
+    waits on the process and so does not hold the GIL.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize the worker; the process starts on first use."""
+        self.timeout = timeout
+        self.restarts = 0
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pid: int | None = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # Spawned, as forking the threaded Home Assistant process is unsafe
+                pool = ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=exec,
+                    initargs=(_BOOTSTRAP, {"packages": _PACKAGES}),
+                )
+                # Starts the process; its pid is kept to stop it when it hangs
+                try:
+                    self._pid = pool.submit(os.getpid).result(timeout=self.timeout)
+                except BaseException:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+                self._pool = pool
+            return self._pool
+
+    def _restart(self, pool: ProcessPoolExecutor, hung: bool) -> None:
+        """Drop a broken or hung pool; the next call starts a fresh process."""
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+            self.restarts += 1
+            pid = self._pid
+        # A hung worker does not exit by itself; a crashed one is already gone
+        if hung and pid is not None:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, fn, *args):
+        try:
+            pool = self._get_pool()
+        except (BrokenProcessPool, TimeoutError, OSError) as err:
+            raise ParseWorkerError(f"Parse worker did not start: {err!r}") from err
+        try:
+            return pool.submit(fn, *args).result(timeout=self.timeout)
+        except (BrokenProcessPool, TimeoutError, OSError) as err:
+            self._restart(pool, hung=isinstance(err, TimeoutError))
+            raise ParseWorkerError(f"Parse worker failed: {err!r}") from err
+
+    def start(self, backend_name: str) -> None:
+        """Start the process and load the parser backend in it."""
+        _LOGGER.debug(
+            "Parse worker process ready with %s", self._run(_warm_up, backend_name)
+        )
+
+    def parse(
+        self,
+        raw: bytes,
+        charset: str | None,
+        backend_name: str,
+        plan: ParsePlan = FULL_PLAN,
+    ) -> tuple[tuple, ...]:
+        """Parse a raw body with a backend in the worker process."""
+        return self._run(_parse_in_worker, raw, charset, backend_name, plan)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,99 @@
+"""Retry and circuit breaker helpers for fetching the storingen page."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+
+from .const import (
+    BACKOFF_BASE_SECONDS,
+    BACKOFF_MAX_SECONDS,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class EnnatuurlijkFetchError(Exception):
+    """Raised when the storingen page could not be fetched."""
+
+
+class CircuitOpenError(EnnatuurlijkFetchError):
+    """Raised when requests are blocked by an open circuit breaker."""
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return the delay before retry ``attempt`` (0 based), with full jitter."""
+    ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Stop requesting the site after repeated failures.
+
+    After ``failure_threshold`` consecutive failed fetches the breaker opens and
+    rejects requests for ``reset_seconds``. It then goes half-open and lets a
+    single probe through: success closes it, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+    ) -> None:
+        """Initialize the breaker in the closed state."""
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self._opened_at is None:
+            return STATE_CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_seconds - time.monotonic())
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError if requests are currently blocked."""
+        if self.state == STATE_OPEN:
+            raise CircuitOpenError(
+                f"Circuit breaker open after {self.consecutive_failures} failures, "
+                f"retrying in {self.retry_after:.0f}s"
+            )
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful fetch."""
+        if self._opened_at is not None:
+            _LOGGER.info("Ennatuurlijk site reachable again, closing circuit breaker")
+        self.consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed fetch and open the breaker when over the threshold."""
+        self.consecutive_failures += 1
+        if self.state == STATE_HALF_OPEN or (
+            self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != STATE_OPEN:
+                _LOGGER.warning(
+                    "Opening circuit breaker after %d failed fetches, pausing %ds",
+                    self.consecutive_failures,
+                    self.reset_seconds,
+                )
+            self._opened_at = time.monotonic()
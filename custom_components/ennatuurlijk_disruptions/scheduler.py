@@ -0,0 +1,82 @@
+"""Adaptive polling interval for Ennatuurlijk Disruptions."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+
+from .const import (
+    ACTIVE_INTERVAL_DIVISOR,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    QUIET_HOURS_INTERVAL_FACTOR,
+    QUIET_INTERVAL_FACTOR,
+)
+
+type QuietHours = tuple[tuple[time, time], ...]
+
+
+def parse_quiet_hours(value: str | None) -> QuietHours:
+    """Parse quiet hours like "23:00-07:00, 12:00-13:30".
+
+    Windows may wrap around midnight. Raises ValueError on malformed input.
+    """
+    windows = []
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, sep, end = part.partition("-")
+        if not sep:
+            raise ValueError(f"Invalid quiet hours window: {part}")
+        windows.append(
+            (time.fromisoformat(start.strip()), time.fromisoformat(end.strip()))
+        )
+    return tuple(windows)
+
+
+def in_quiet_hours(moment: time, quiet_hours: QuietHours) -> bool:
+    """Return True if the time of day falls in one of the windows."""
+    for start, end in quiet_hours:
+        if start <= end:
+            if start <= moment < end:
+                return True
+        elif moment >= start or moment < end:
+            return True
+    return False
+
+
+def has_activity(data: dict | None, today: date) -> bool:
+    """Return True if a location has a current disruption or a planned one today."""
+    if not data:
+        return False
+    if data.get("current", {}).get("dates"):
+        return True
+    return any(d.date == today for d in data.get("planned", {}).get("dates", []))
+
+
+def adaptive_interval(
+    baseline: timedelta,
+    active: bool,
+    now: datetime,
+    quiet_hours: QuietHours = (),
+) -> timedelta:
+    """Return the polling interval for the current disruption state.
+
+    Active disruptions tighten the user configured baseline, a quiet page backs
+    off from it, and quiet hours back off further unless something is active.
+    The result is always clamped to the hard bounds.
+    """
+    if active:
+        interval = (
+            baseline
+            if in_quiet_hours(now.time(), quiet_hours)
+            else baseline / ACTIVE_INTERVAL_DIVISOR
+        )
+    elif in_quiet_hours(now.time(), quiet_hours):
+        interval = baseline * QUIET_HOURS_INTERVAL_FACTOR
+    else:
+        interval = baseline * QUIET_INTERVAL_FACTOR
+    return min(
+        max(interval, timedelta(minutes=MIN_UPDATE_INTERVAL)),
+        timedelta(minutes=MAX_UPDATE_INTERVAL),
+    )
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import SIGNAL_LOCATION_ADDED
 from .entity import EnnatuurlijkSensor
 from .sensor_types import SENSOR_TYPES
 
@@ -24,21 +26,9 @@ async def async_setup_entry(
         "Setting up Ennatuurlijk Disruptions sensors for entry: %s", entry.entry_id
     )
 
-    # Get coordinators from runtime_data
-    coordinators = entry.runtime_data
-    
-    _LOGGER.debug(
-        "Found %d coordinators for entry %s: %s", 
-        len(coordinators), 
-        entry.entry_id,
-        list(coordinators.keys())
-    )
-
-    if not coordinators:
-        _LOGGER.info("No location subentries found, no sensors to create for entry: %s", entry.entry_id)
-        return
-
-    for subentry_id, coordinator in coordinators.items():
+    @callback
+    def _async_add_location(subentry_id: str, coordinator) -> None:
+        """Create the sensors of one location."""
         # Get the subentry object
         subentry = entry.subentries[subentry_id]
 
@@ -55,4 +45,28 @@ async def async_setup_entry(
         # Add entities with proper subentry association (following NS pattern)
         async_add_entities(sensors, config_subentry_id=subentry_id)
 
+    # Locations added later get their sensors without reloading the entry
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_LOCATION_ADDED.format(entry.entry_id), _async_add_location
+        )
+    )
+
+    # Get coordinators from runtime_data
+    coordinators = entry.runtime_data
+    
+    _LOGGER.debug(
+        "Found %d coordinators for entry %s: %s", 
+        len(coordinators), 
+        entry.entry_id,
+        list(coordinators.keys())
+    )
+
+    if not coordinators:
+        _LOGGER.info("No location subentries found, no sensors to create for entry: %s", entry.entry_id)
+        return
+
+    for subentry_id, coordinator in coordinators.items():
+        _async_add_location(subentry_id, coordinator)
+
     _LOGGER.info("Entity setup completed for entry: %s", entry.entry_id)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime, date
+from datetime import date
 
 from .entity import EnnatuurlijkSensorEntityDescription
+from .views import SectionView
 from .const import (
     ATTR_ERROR,
     ATTR_FRIENDLY_NAME,
@@ -16,116 +17,76 @@ from .const import (
     ATTR_IS_PLANNED_DATE_TODAY,
     ATTR_IS_CURRENT_DATE_TODAY,
     ATTR_IS_SOLVED_DATE_TODAY,
+    ATTR_DATES,
+    ATTR_DATES_TRUNCATED,
+    ATTR_DISRUPTION_COUNT,
+    ATTR_SUMMARY,
 )
 
 
-def _get_closest_date(data: dict, today: date) -> date | None:
-    """Return closest date from disruption data."""
-    dates = [d["date"] for d in data.get("dates", []) if d.get("date")]
-    if not dates:
-        return None
-    date_objs = [datetime.strptime(d, "%d-%m-%Y").date() for d in dates]
-    return min(date_objs, key=lambda d: abs((d - today).days))
-
-
-def _get_closest_disruption(data: dict, today: date) -> dict | None:
-    """Return closest disruption from data."""
-    dates = data.get("dates", [])
-    if not dates:
-        return None
-
-    valid_dates = [d for d in dates if d and d.get("date")]
-    if not valid_dates:
-        return None
-
-    return min(
-        valid_dates,
-        key=lambda d: abs(
-            (datetime.strptime(d["date"], "%d-%m-%Y").date() - today).days
-        ),
-    )
+def _format(day: date | None) -> str | None:
+    return day.strftime("%Y-%m-%d") if day else None
 
 
 def _build_common_attributes(
-    data: dict, today: date, name: str, days_key: str, is_today_key: str
+    view: SectionView, name: str, days_key: str, is_today_key: str
 ) -> dict:
     """Return common attributes for sensors."""
-    dates = data.get("dates", [])
-    closest_date = _get_closest_date(data, today)
-    closest_disruption = _get_closest_disruption(data, today)
-
-    days_diff = None
-    if closest_date:
-        days_diff = (
-            (today - closest_date).days
-            if days_key.startswith("days_since")
-            else (closest_date - today).days
-        )
-
+    closest = view.closest
+    closest_date = _format(view.closest_date)
     return {
         ATTR_ERROR: False,
         ATTR_FRIENDLY_NAME: name,
-        ATTR_YEAR_MONTH_DAY_DATE: closest_date.strftime("%Y-%m-%d")
-        if closest_date
-        else None,
-        ATTR_LAST_UPDATE: data.get("last_update_date"),
-        days_key: days_diff,
-        is_today_key: closest_date == today if closest_date else False,
-        "dates": dates,
+        ATTR_YEAR_MONTH_DAY_DATE: closest_date,
+        ATTR_LAST_UPDATE: view.last_update_date,
+        days_key: view.days_since
+        if days_key.startswith("days_since")
+        else view.days_until,
+        is_today_key: view.is_today,
+        ATTR_DATES: view.date_dicts,
+        ATTR_DATES_TRUNCATED: view.truncated,
+        ATTR_SUMMARY: view.summary,
         "icon": "mdi:calendar-alert",
-        "latest_link": closest_disruption.get("link") if closest_disruption else None,
-        "latest_description": closest_disruption.get("description")
-        if closest_disruption
-        else None,
-        "disruption_count": len(dates),
-        "next_disruption_date": closest_date.strftime("%Y-%m-%d")
-        if closest_date
-        else None,
+        "latest_link": closest.link if closest else None,
+        "latest_description": closest.title if closest else None,
+        ATTR_DISRUPTION_COUNT: view.count,
+        "next_disruption_date": closest_date,
     }
 
 
-def _planned_value_fn(data: dict, today: date) -> str | None:
+def _planned_value_fn(view: SectionView) -> str | None:
     """Return planned sensor value (next future date)."""
-    dates = [d["date"] for d in data.get("dates", []) if d.get("date")]
-    future_dates = [
-        d for d in dates if datetime.strptime(d, "%d-%m-%Y").date() >= today
-    ]
-    closest_date = min(
-        (datetime.strptime(d, "%d-%m-%Y").date() for d in future_dates), default=None
-    )
-    return closest_date.strftime("%Y-%m-%d") if closest_date else None
+    return _format(view.next_date)
 
 
-def _planned_attributes_fn(data: dict, today: date, name: str) -> dict:
+def _planned_attributes_fn(view: SectionView, name: str) -> dict:
     """Return planned sensor attributes."""
     return _build_common_attributes(
-        data, today, name, ATTR_DAYS_UNTIL_PLANNED_DATE, ATTR_IS_PLANNED_DATE_TODAY
+        view, name, ATTR_DAYS_UNTIL_PLANNED_DATE, ATTR_IS_PLANNED_DATE_TODAY
     )
 
 
-def _current_value_fn(data: dict, today: date) -> str | None:
+def _current_value_fn(view: SectionView) -> str | None:
     """Return current sensor value (closest date)."""
-    closest_date = _get_closest_date(data, today)
-    return closest_date.strftime("%Y-%m-%d") if closest_date else None
+    return _format(view.closest_date)
 
 
-def _current_attributes_fn(data: dict, today: date, name: str) -> dict:
+def _current_attributes_fn(view: SectionView, name: str) -> dict:
     """Return current sensor attributes."""
     return _build_common_attributes(
-        data, today, name, ATTR_DAYS_SINCE_CURRENT_DATE, ATTR_IS_CURRENT_DATE_TODAY
+        view, name, ATTR_DAYS_SINCE_CURRENT_DATE, ATTR_IS_CURRENT_DATE_TODAY
     )
 
 
-def _solved_value_fn(data: dict, today: date) -> str | None:
+def _solved_value_fn(view: SectionView) -> str | None:
     """Return solved sensor value (closest date)."""
-    closest_date = _get_closest_date(data, today)
-    return closest_date.strftime("%Y-%m-%d") if closest_date else None
+    return _format(view.closest_date)
 
 
-def _solved_attributes_fn(data: dict, today: date, name: str) -> dict:
+def _solved_attributes_fn(view: SectionView, name: str) -> dict:
     """Return solved sensor attributes."""
     return _build_common_attributes(
-        data, today, name, ATTR_DAYS_SINCE_SOLVED_DATE, ATTR_IS_SOLVED_DATE_TODAY
+        view, name, ATTR_DAYS_SINCE_SOLVED_DATE, ATTR_IS_SOLVED_DATE_TODAY
     )
 
 
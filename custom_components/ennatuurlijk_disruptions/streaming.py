@@ -0,0 +1,243 @@
+"""Streaming disruption extractor for the storingen page.
+
+Instead of building a tree, :class:`DisruptionStreamParser` reacts to the
+tokenizer events of :class:`html.parser.HTMLParser` and only keeps the state of
+the article it is currently in. It can be fed the page chunk by chunk while it
+downloads and emits the same ``(section, title, date, link)`` tuples as
+:func:`parser.parse_page`.
+"""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+import logging
+import re
+
+from .parser import (
+    DATE_PATTERN,
+    FULL_PLAN,
+    ParsePlan,
+    normalize_date,
+    normalize_link,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Element contents BeautifulSoup leaves out of get_text()
+_IGNORED_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+_DIV_TAG_RE = re.compile(rb"<(/?)div[\s/>]", re.IGNORECASE)
+# Bytes kept for a rescan, so tags split over two chunks are still found
+_SECTION_TAG_OVERLAP = 512
+_DIV_TAG_OVERLAP = len(b"</div>")
+
+
+def _has_class(attrs, name: str) -> bool:
+    for key, value in attrs:
+        if key == "class" and value and name in value.split():
+            return True
+    return False
+
+
+class DisruptionStreamParser(HTMLParser):
+    """Event driven extractor for the disruption articles.
+
+    Sections, the expectation block and its value are ``div`` elements, so
+    they are closed by counting ``div`` nesting; articles and titles end with
+    their own closing tag. Peak memory is bounded by the unprocessed tail of
+    the input and the fields of a single article.
+    """
+
+    def __init__(
+        self, date_pattern: str = DATE_PATTERN, plan: ParsePlan = FULL_PLAN
+    ) -> None:
+        """Initialize the parser."""
+        super().__init__(convert_charrefs=True)
+        self.date_pattern = date_pattern
+        self.plan = plan
+        self.articles: list[tuple] = []
+        # The last needed section has been closed, the rest is not needed
+        self.done = False
+        self._div_depth = 0
+        self._section: str | None = None
+        self._section_depth = 0
+        self._in_article = False
+        self._ignored_depth = 0
+        # Field currently collecting text: "title", "date" or None
+        self._capture: str | None = None
+        self._expectation_depth: int | None = None
+        self._value_depth: int | None = None
+        self._text: list[str] = []
+        self._pending: list[str] = []
+        self._reset_article()
+
+    def _reset_article(self) -> None:
+        self._title: str | None = None
+        self._date: str | None = None
+        self._link: str | None = None
+        self._seen_expectation = False
+
+    def _flush_text(self) -> None:
+        """Close the current text node, stripping it like get_text(strip=True)."""
+        if self._pending:
+            text = "".join(self._pending).strip()
+            if text:
+                self._text.append(text)
+            self._pending.clear()
+
+    def _finish_capture(self) -> str:
+        self._flush_text()
+        text = "".join(self._text)
+        self._text.clear()
+        self._capture = None
+        return text
+
+    def handle_starttag(self, tag, attrs) -> None:
+        """Track section, article and field context."""
+        self._flush_text()
+        if tag in _IGNORED_TEXT_TAGS:
+            self._ignored_depth += 1
+        if tag == "div":
+            self._div_depth += 1
+            if self._section is None:
+                section = dict(attrs).get("id")
+                if section in self.plan.sections:
+                    self._section = section
+                    self._section_depth = self._div_depth
+            elif self._in_article:
+                self._start_article_div(attrs)
+        elif self._section is None:
+            return
+        elif tag == "article" and _has_class(attrs, "node--type-malfunction"):
+            self._in_article = True
+            self._reset_article()
+        elif not self._in_article:
+            return
+        elif tag == "h4" and self._title is None and _has_class(attrs, "h3"):
+            self._capture = "title"
+        elif tag == "a" and self._link is None:
+            for key, value in attrs:
+                if key == "href":
+                    self._link = normalize_link(value or "")
+                    break
+
+    def _start_article_div(self, attrs) -> None:
+        if not self._seen_expectation and _has_class(attrs, "expectation"):
+            self._seen_expectation = True
+            self._expectation_depth = self._div_depth
+        elif (
+            self._expectation_depth is not None
+            and self._value_depth is None
+            and self._date is None
+            and _has_class(attrs, "value")
+        ):
+            self._value_depth = self._div_depth
+            self._capture = "date"
+
+    def handle_endtag(self, tag) -> None:
+        """Close contexts and emit finished articles."""
+        self._flush_text()
+        if tag in _IGNORED_TEXT_TAGS and self._ignored_depth:
+            self._ignored_depth -= 1
+        if tag == "div":
+            if self._div_depth == self._value_depth:
+                self._date = self._finish_capture()
+                self._value_depth = None
+            elif self._div_depth == self._expectation_depth:
+                self._expectation_depth = None
+            elif self._div_depth == self._section_depth and self._section:
+                self.done = self._section == self.plan.last_section
+                self._section = None
+            self._div_depth = max(0, self._div_depth - 1)
+        elif tag == "h4" and self._capture == "title":
+            self._title = self._finish_capture()
+        elif tag == "article" and self._in_article:
+            self._emit_article()
+
+    def handle_data(self, data) -> None:
+        """Collect text for the field being captured."""
+        if self._capture is not None and not self._ignored_depth:
+            self._pending.append(data)
+
+    def handle_comment(self, data) -> None:
+        """Comments end a text node but are not part of it."""
+        self._flush_text()
+
+    def _emit_article(self) -> None:
+        if self._capture is not None:
+            text = self._finish_capture()
+            if self._value_depth is not None:
+                self._date = text
+            elif self._title is None:
+                self._title = text
+        self._in_article = False
+        self._expectation_depth = None
+        self._value_depth = None
+        date = normalize_date(self._date or "", self.date_pattern)
+        if date and self.plan.keeps(self._section, date):
+            self.articles.append((self._section, self._title or "", date, self._link))
+
+    def close(self) -> None:
+        """Flush the remaining input."""
+        super().close()
+        _LOGGER.debug("Streamed %d disruption articles", len(self.articles))
+
+
+class SectionEndScanner:
+    """Find the end of a section in a body that is still downloading.
+
+    The tree backends only parse once the body is complete, so this cheap
+    byte level scan tells the download when it may stop: after the opening
+    tag of the last needed section it balances ``div`` tags until the section
+    closes.
+    """
+
+    def __init__(self, section: str, pos: int = 0) -> None:
+        """Initialize the scanner for a section id, searched from an offset."""
+        self._section_re = re.compile(
+            rb"""<div\b[^>]*\bid\s*=\s*["']?%s["'\s/>]""" % section.encode(),
+            re.IGNORECASE,
+        )
+        self.done = False
+        # Offsets of the section's opening tag and of the end of its closing tag
+        self.start: int | None = None
+        self.end: int | None = None
+        self._pos = pos
+        self._depth: int | None = None
+
+    def scan(self, buffer: bytes | bytearray) -> bool:
+        """Scan the part of the body added since the last call.
+
+        Returns True once the section has been closed.
+        """
+        if self.done:
+            return True
+        if self._depth is None:
+            match = self._section_re.search(buffer, self._pos)
+            if match is None:
+                self._pos = max(self._pos, len(buffer) - _SECTION_TAG_OVERLAP)
+                return False
+            self._depth = 1
+            self.start = match.start()
+            self._pos = match.end()
+        for match in _DIV_TAG_RE.finditer(buffer, self._pos):
+            self._depth += -1 if match.group(1) else 1
+            self._pos = match.end()
+            if not self._depth:
+                self.done = True
+                self.end = self._pos
+                return True
+        self._pos = max(self._pos, len(buffer) - _DIV_TAG_OVERLAP)
+        return False
+
+
+def parse_stream(html: str, chunk_size: int | None = None) -> tuple[tuple, ...]:
+    """Parse a complete page with the streaming extractor."""
+    parser = DisruptionStreamParser()
+    if chunk_size:
+        for start in range(0, len(html), chunk_size):
+            parser.feed(html[start : start + chunk_size])
+    else:
+        parser.feed(html)
+    parser.close()
+    return tuple(parser.articles)
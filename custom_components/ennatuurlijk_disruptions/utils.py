@@ -7,10 +7,22 @@ from .const import (
     CONF_DAYS_TO_KEEP_SOLVED,
     CONF_CREATE_ALERT_SENSORS,
     CONF_UPDATE_INTERVAL,
+    CONF_QUIET_HOURS,
+    CONF_PARSER_BACKEND,
+    CONF_MAX_LISTED_DISRUPTIONS,
+    CONF_PARSE_IN_PROCESS,
+    CONF_MAX_PAGE_SIZE,
     DEFAULT_DAYS_TO_KEEP_SOLVED,
     DEFAULT_CREATE_ALERT_SENSORS,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_QUIET_HOURS,
+    DEFAULT_PARSER_BACKEND,
+    DEFAULT_MAX_LISTED_DISRUPTIONS,
+    DEFAULT_PARSE_IN_PROCESS,
+    DEFAULT_MAX_PAGE_SIZE,
+    PARSER_BACKENDS,
 )
+from .scheduler import parse_quiet_hours
 
 
 class PostalCodeValidator:
@@ -61,3 +73,44 @@ class SchemaHelper:
                 default=defaults.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
             ): int,
         }
+
+    @staticmethod
+    def get_global_options(defaults=None):
+        """Get options schema elements that only apply to the main entry."""
+        if defaults is None:
+            defaults = {}
+
+        return {
+            **SchemaHelper.get_common_options(defaults),
+            vol.Optional(
+                CONF_QUIET_HOURS,
+                default=defaults.get(CONF_QUIET_HOURS, DEFAULT_QUIET_HOURS),
+            ): str,
+            vol.Optional(
+                CONF_PARSER_BACKEND,
+                default=defaults.get(CONF_PARSER_BACKEND, DEFAULT_PARSER_BACKEND),
+            ): vol.In(PARSER_BACKENDS),
+            vol.Optional(
+                CONF_MAX_LISTED_DISRUPTIONS,
+                default=defaults.get(
+                    CONF_MAX_LISTED_DISRUPTIONS, DEFAULT_MAX_LISTED_DISRUPTIONS
+                ),
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_PARSE_IN_PROCESS,
+                default=defaults.get(CONF_PARSE_IN_PROCESS, DEFAULT_PARSE_IN_PROCESS),
+            ): bool,
+            vol.Optional(
+                CONF_MAX_PAGE_SIZE,
+                default=defaults.get(CONF_MAX_PAGE_SIZE, DEFAULT_MAX_PAGE_SIZE),
+            ): vol.All(int, vol.Range(min=256)),
+        }
+
+    @staticmethod
+    def validate_quiet_hours(value: str) -> bool:
+        """Check if quiet hours are formatted like 23:00-07:00[, ...]."""
+        try:
+            parse_quiet_hours(value)
+        except ValueError:
+            return False
+        return True
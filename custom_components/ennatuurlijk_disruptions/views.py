@@ -0,0 +1,98 @@
+"""Derived per-section values shared by the entities of a location."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date
+
+from .const import DEFAULT_MAX_LISTED_DISRUPTIONS
+from .models import Disruption
+
+
+@dataclass(frozen=True, slots=True)
+class SectionView:
+    """Values derived from one coordinator section for one day.
+
+    Built once per coordinator update or day rollover, so the sensor, binary
+    sensor and calendar properties only read fields.
+    """
+
+    today: date
+    state: bool
+    # Records in page order, and the attribute dicts of the listed ones
+    dates: tuple[Disruption, ...]
+    date_dicts: list[dict]
+    # Compact recorded stand-in for the unrecorded dates attribute
+    summary: str
+    sorted_dates: tuple[date, ...]
+    # First date on or after today
+    next_date: date | None
+    # Disruption whose date is closest to today, earliest on the page on ties
+    closest: Disruption | None
+    last_update_date: str | None
+
+    @property
+    def count(self) -> int:
+        """Return the number of disruptions."""
+        return len(self.dates)
+
+    @property
+    def truncated(self) -> bool:
+        """Return True if not every disruption is listed in date_dicts."""
+        return len(self.date_dicts) < len(self.dates)
+
+    @property
+    def closest_date(self) -> date | None:
+        """Return the date of the closest disruption."""
+        return self.closest.date if self.closest else None
+
+    @property
+    def days_until(self) -> int | None:
+        """Return the days from today until the closest date."""
+        return (self.closest.date - self.today).days if self.closest else None
+
+    @property
+    def days_since(self) -> int | None:
+        """Return the days from the closest date until today."""
+        return (self.today - self.closest.date).days if self.closest else None
+
+    @property
+    def is_today(self) -> bool:
+        """Return True if the closest date is today."""
+        return self.closest is not None and self.closest.date == self.today
+
+
+def summarize(dates: tuple[Disruption, ...], max_listed: int) -> str:
+    """Return a compact summary like "#108259 2025-10-31, ... (+2 more)"."""
+    parts = [
+        f"#{d.id} {d.date.isoformat()}" if d.id is not None else d.date.isoformat()
+        for d in dates[:max_listed]
+    ]
+    summary = ", ".join(parts)
+    if len(dates) > max_listed:
+        summary += f" (+{len(dates) - max_listed} more)"
+    return summary
+
+
+def build_section_view(
+    section: dict, today: date, max_listed: int = DEFAULT_MAX_LISTED_DISRUPTIONS
+) -> SectionView:
+    """Derive the view of a coordinator section for a day.
+
+    Only the first ``max_listed`` disruptions get an attribute dict.
+    """
+    dates = tuple(section.get("dates", ()))
+    sorted_dates = tuple(sorted(d.date for d in dates))
+    index = bisect_left(sorted_dates, today)
+    return SectionView(
+        today=today,
+        state=bool(section.get("state")),
+        dates=dates,
+        date_dicts=[d.as_dict() for d in dates[:max_listed]],
+        summary=summarize(dates, max_listed),
+        sorted_dates=sorted_dates,
+        next_date=sorted_dates[index] if index < len(sorted_dates) else None,
+        closest=min(dates, key=lambda d: abs((d.date - today).days), default=None),
+        last_update_date=section.get("last_update_date"),
+    )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import types
 from collections.abc import Generator
+from datetime import datetime
 from unittest.mock import AsyncMock, patch
 import os
 
@@ -13,6 +14,7 @@ from custom_components.ennatuurlijk_disruptions.const import (
     CONF_TOWN,
     CONF_POSTAL_CODE,
 )
+from custom_components.ennatuurlijk_disruptions.hub import ParsedPage
 
 """Pytest fixtures for Ennatuurlijk Disruptions integration tests.
 
@@ -75,41 +77,72 @@ def load_fixture():
     return _load_fixture
 
 
-@pytest.fixture
-async def mock_aiohttp_session(load_fixture):
-    """Mock aiohttp client session to return the HTML fixture."""
+class MockStreamReader:
+    """Mock aiohttp StreamReader yielding a body in chunks."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+        self.chunk_sizes: list[int] = []
+
+    async def iter_chunked(self, n: int):
+        for start in range(0, len(self._body), n):
+            chunk = self._body[start : start + n]
+            self.chunk_sizes.append(len(chunk))
+            yield chunk
+
+
+class MockResponse:
+    """Mock aiohttp response."""
 
-    class MockResponse:
-        """Mock aiohttp response."""
+    def __init__(self, text: str, status: int = 200, headers=None):
+        self._text = text
+        self.status = status
+        self.headers = headers or {}
+        self.charset = "utf-8"
+        self.content = MockStreamReader(text.encode("utf-8"))
 
-        def __init__(self, text: str, status: int = 200):
-            self._text = text
-            self.status = status
+    async def read(self):
+        return self._text.encode("utf-8")
 
-        async def text(self):
-            return self._text
+    async def text(self):
+        return self._text
 
-        async def __aenter__(self):
-            return self
+    async def __aenter__(self):
+        return self
 
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            pass
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
 
-        def raise_for_status(self):
-            if self.status >= 400:
-                raise Exception(f"HTTP {self.status}")
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise Exception(f"HTTP {self.status}")
 
-    class MockSession:
-        """Mock aiohttp session."""
 
-        def get(self, url, **kwargs):
-            html = load_fixture("ennatuurlijk_storingen.html")
-            return MockResponse(html)
+class MockSession:
+    """Mock aiohttp session serving a fixture, honouring If-None-Match."""
 
+    def __init__(self, load_fixture, headers=None):
+        self._load_fixture = load_fixture
+        self.headers = headers or {}
+        self.requests: list[dict] = []
+
+    def get(self, url, **kwargs):
+        request_headers = kwargs.get("headers") or {}
+        self.requests.append(request_headers)
+        etag = self.headers.get("ETag")
+        if etag and request_headers.get("If-None-Match") == etag:
+            return MockResponse("", status=304, headers=self.headers)
+        html = self._load_fixture("ennatuurlijk_storingen.html")
+        return MockResponse(html, headers=self.headers)
+
+
+@pytest.fixture
+async def mock_aiohttp_session(load_fixture):
+    """Mock aiohttp client session to return the HTML fixture."""
     with patch(
         "homeassistant.helpers.aiohttp_client.async_get_clientsession"
     ) as mock_get_session:
-        mock_get_session.return_value = MockSession()
+        mock_get_session.return_value = MockSession(load_fixture)
         yield mock_get_session
 
 
@@ -121,39 +154,32 @@ def mock_requests_get(mock_aiohttp_session):
 
 @pytest.fixture
 def mock_async_update_data() -> Generator[AsyncMock, None, None]:
-    """Patch fetch_disruption_section to avoid network and return deterministic data."""
+    """Patch the page hub to avoid network and return deterministic articles."""
     with patch(
-        "custom_components.ennatuurlijk_disruptions.coordinator.fetch_disruption_section",
+        "custom_components.ennatuurlijk_disruptions.hub.EnnatuurlijkPageHub.async_get_page",
         autospec=True,
     ) as mock:
 
-        async def mock_fetch(hass, section, town, postal_code):
-            if section == "planned":
-                return {
-                    "state": True,
-                    "dates": [
-                        {
-                            "description": "Planned Tilburg",
-                            "date": "30-10-2025",
-                            "link": "https://ennatuurlijk.nl/storingen/108227",
-                        }
-                    ],
-                }
-            elif section == "solved":
-                return {
-                    "state": True,
-                    "dates": [
-                        {
-                            "description": "Solved Breda",
-                            "date": "29-10-2025",
-                            "link": "https://ennatuurlijk.nl/storingen/108219",
-                        }
-                    ],
-                }
-            else:
-                return {"state": False, "dates": []}
-
-        mock.side_effect = mock_fetch
+        async def mock_get_page(hub, requester=None):
+            return ParsedPage(
+                articles=(
+                    (
+                        "planned",
+                        "Planned Tilburg",
+                        "30-10-2025",
+                        "https://ennatuurlijk.nl/storingen/108227",
+                    ),
+                    (
+                        "completed",
+                        "Solved Breda",
+                        "29-10-2025",
+                        "https://ennatuurlijk.nl/storingen/108219",
+                    ),
+                ),
+                fetched_at=datetime.now(),
+            )
+
+        mock.side_effect = mock_get_page
         yield mock
 
 
@@ -1,12 +1,26 @@
 import pytest
 from datetime import date
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 from freezegun import freeze_time
 from custom_components.ennatuurlijk_disruptions.calendar import (
     EnnatuurlijkDisruptionsCalendar,
 )
+from custom_components.ennatuurlijk_disruptions.calendar_index import (
+    CalendarIndex,
+    merge_disruptions,
+)
+from custom_components.ennatuurlijk_disruptions.const import DOMAIN
 from custom_components.ennatuurlijk_disruptions.coordinator import (
     EnnatuurlijkCoordinator,
 )
+from custom_components.ennatuurlijk_disruptions.models import Disruption
+
+from .conftest import setup_integration
 
 
 @pytest.fixture
@@ -65,3 +79,104 @@ async def test_planned_event_all_day_and_hashtag(setup_calendar_env):
     events = cal._get_events(start, end)
     assert len(events) >= 1
     assert any("Status: #planned" in ev.description for ev in events)
+
+
+def _record(disruption_id, status, day):
+    return Disruption(
+        disruption_id, status, f"{disruption_id} - Tilburg", day, f"/storingen/{disruption_id}"
+    )
+
+
+def test_merge_disruptions_into_spans():
+    """Test that statuses of one id merge into a single span."""
+    spans = merge_disruptions(
+        [
+            _record(1, "current", date(2025, 10, 28)),
+            _record(2, "planned", date(2025, 11, 2)),
+            _record(3, "current", date(2025, 10, 30)),
+            _record(1, "solved", date(2025, 10, 29)),
+            _record(None, "planned", date(2025, 11, 1)),
+        ]
+    )
+
+    assert [(s.id, s.status, s.start, s.end) for s in spans] == [
+        (1, "solved", date(2025, 10, 28), date(2025, 10, 29)),
+        (2, "planned", date(2025, 11, 2), date(2025, 11, 3)),
+        (3, "current", date(2025, 10, 30), date(2025, 10, 31)),
+    ]
+    assert spans[0].was_current
+
+
+def test_calendar_index_window():
+    """Test range queries over the sorted spans."""
+    index = CalendarIndex(
+        merge_disruptions(
+            _record(i, "planned", date(2025, 11, day))
+            for i, day in enumerate((5, 1, 3, 3, 9))
+        )
+    )
+
+    window = index.window(date(2025, 11, 2), date(2025, 11, 5))
+
+    assert [index.spans[p].id for p in window] == [2, 3, 0]
+    assert not index.window(date(2025, 11, 6), date(2025, 11, 8))
+    assert index.event(0) is index.event(0)
+    assert index.event(0).summary == "#1 - 1 - Tilburg"
+
+
+@pytest.mark.asyncio
+async def test_index_rebuilt_only_for_new_data(setup_calendar_env):
+    """Test that queries reuse the index until a coordinator has new data."""
+    cal = setup_calendar_env
+    coordinator = next(iter(cal.main_entry.runtime_data.values()))
+
+    first = cal._get_events(date(2025, 1, 1), date(2025, 12, 31))
+    index = cal._index
+    assert cal._get_events(date(2025, 1, 1), date(2025, 12, 31)) == first
+    assert cal._index is index
+
+    coordinator.data = dict(coordinator.data)
+    cal._get_events(date(2025, 1, 1), date(2025, 12, 31))
+    assert cal._index is not index
+
+
+@pytest.mark.asyncio
+async def test_next_event_pointer_moves_on_at_event_end(
+    hass, enable_custom_integrations, mock_aiohttp_session, freezer
+):
+    """Test that the cached next event is replaced when it ends."""
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+    freezer.move_to("2025-10-31 12:00:00+01:00")
+    main_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Ennatuurlijk Disruptions",
+        data={"name": "Ennatuurlijk Disruptions"},
+        options={"days_to_keep_solved": 7, "update_interval": 120},
+        unique_id="ennatuurlijk_global",
+        version=2,
+        subentries_data=[
+            {
+                "data": {"name": "Home", "town": "Tilburg", "postal_code": "5045AB"},
+                "subentry_type": "location",
+                "title": "Tilburg - 5045AB",
+                "unique_id": "5045AB",
+            }
+        ],
+    )
+    await setup_integration(hass, main_entry)
+    entity_id = "calendar.ennatuurlijk_disruptions_calendar"
+    cal = hass.data["entity_components"]["calendar"].get_entity(entity_id)
+
+    assert hass.states.get(entity_id).state == "on"
+    assert hass.states.get(entity_id).attributes["message"].startswith("#108227")
+
+    # Reading the state uses the pointer instead of querying the index
+    with patch.object(cal, "_get_index", side_effect=AssertionError):
+        assert cal.event.summary.startswith("#108227")
+
+    freezer.move_to("2025-11-01 00:00:00+01:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == "off"
+    assert hass.states.get(entity_id).attributes["message"].startswith("#108229")
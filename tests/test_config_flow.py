@@ -18,9 +18,19 @@ from custom_components.ennatuurlijk_disruptions.const import (
     CONF_CREATE_ALERT_SENSORS,
     CONF_DAYS_TO_KEEP_SOLVED,
     CONF_UPDATE_INTERVAL,
+    CONF_QUIET_HOURS,
+    CONF_PARSER_BACKEND,
+    CONF_MAX_LISTED_DISRUPTIONS,
+    CONF_PARSE_IN_PROCESS,
+    CONF_MAX_PAGE_SIZE,
     DEFAULT_CREATE_ALERT_SENSORS,
     DEFAULT_DAYS_TO_KEEP_SOLVED,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_QUIET_HOURS,
+    DEFAULT_PARSER_BACKEND,
+    DEFAULT_MAX_LISTED_DISRUPTIONS,
+    DEFAULT_PARSE_IN_PROCESS,
+    DEFAULT_MAX_PAGE_SIZE,
 )
 import pytest
 import itertools
@@ -270,6 +280,11 @@ async def test_options_flow_init_form(
         CONF_DAYS_TO_KEEP_SOLVED: days,
         CONF_CREATE_ALERT_SENSORS: alert,
         CONF_UPDATE_INTERVAL: interval,
+        CONF_QUIET_HOURS: DEFAULT_QUIET_HOURS,
+        CONF_PARSER_BACKEND: DEFAULT_PARSER_BACKEND,
+        CONF_MAX_LISTED_DISRUPTIONS: DEFAULT_MAX_LISTED_DISRUPTIONS,
+        CONF_PARSE_IN_PROCESS: DEFAULT_PARSE_IN_PROCESS,
+        CONF_MAX_PAGE_SIZE: DEFAULT_MAX_PAGE_SIZE,
     }
 
 
@@ -300,9 +315,35 @@ async def test_options_flow_update(
         CONF_DAYS_TO_KEEP_SOLVED: days,
         CONF_CREATE_ALERT_SENSORS: alert,
         CONF_UPDATE_INTERVAL: interval,
+        CONF_QUIET_HOURS: DEFAULT_QUIET_HOURS,
+        CONF_PARSER_BACKEND: DEFAULT_PARSER_BACKEND,
+        CONF_MAX_LISTED_DISRUPTIONS: DEFAULT_MAX_LISTED_DISRUPTIONS,
+        CONF_PARSE_IN_PROCESS: DEFAULT_PARSE_IN_PROCESS,
+        CONF_MAX_PAGE_SIZE: DEFAULT_MAX_PAGE_SIZE,
     }
 
 
+@pytest.mark.asyncio
+async def test_options_flow_quiet_hours(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+    mock_requests_get,
+    subentry,
+):
+    """Test that quiet hours are validated and stored."""
+    result = await run_options_flow(
+        hass, subentry, user_input={CONF_QUIET_HOURS: "23:00-7"}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {CONF_QUIET_HOURS: "invalid_quiet_hours"}
+
+    result = await run_options_flow(
+        hass, subentry, user_input={CONF_QUIET_HOURS: "23:00-07:00"}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_QUIET_HOURS] == "23:00-07:00"
+
+
 @pytest.mark.asyncio
 async def test_options_flow_uses_defaults(
     hass: HomeAssistant,
@@ -0,0 +1,76 @@
+"""Tests for the calendar event log."""
+
+from datetime import date, timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.ennatuurlijk_disruptions.calendar_index import CalendarSpan
+from custom_components.ennatuurlijk_disruptions.event_log import (
+    EventLog,
+    event_log_storage_key,
+)
+
+DAY = date(2025, 10, 30)
+
+
+def _span(disruption_id, status="planned", start=DAY):
+    return CalendarSpan(
+        disruption_id, status, "9840 - Tilburg", None, start, start + timedelta(days=1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_transitions_are_logged(hass, freezer):
+    """Test that unchanged spans add no lines and entries are capped."""
+    freezer.move_to("2025-10-30 12:00:00+00:00")
+    log = EventLog(hass, max_entries=2)
+
+    assert log.async_record([_span(1)]) == 1
+    assert log.async_record([_span(1)]) == 0
+    assert log.async_record([_span(1, "current")]) == 1
+    assert log.async_record([_span(1, "solved")]) == 1
+
+    assert len(log.entries(1)) == 2
+    assert log.entries(1)[0].startswith("Current: ")
+
+
+@pytest.mark.asyncio
+async def test_eviction_by_size_and_age(hass, freezer):
+    """Test that the least recently seen and expired disruptions are dropped."""
+    freezer.move_to("2025-10-30 12:00:00+00:00")
+    log = EventLog(hass, max_disruptions=2, ttl=timedelta(days=5))
+
+    log.async_record([_span(1), _span(2)])
+    log.async_record([_span(1), _span(3)])
+    assert len(log) == 2
+    assert not log.entries(2)
+
+    freezer.tick(timedelta(days=3))
+    log.async_record([_span(3)])
+    freezer.tick(timedelta(days=3))
+    log.async_record([])
+
+    assert not log.entries(1)
+    assert log.entries(3)
+
+
+@pytest.mark.asyncio
+async def test_log_is_persisted(hass, hass_storage, freezer):
+    """Test the delayed save and loading of the log."""
+    freezer.move_to("2025-10-30 12:00:00+00:00")
+    log = EventLog(hass, "entry-1")
+    log.async_record([_span(7, "current")])
+
+    freezer.tick(timedelta(seconds=15))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    stored = hass_storage[event_log_storage_key("entry-1")]["data"]
+    assert stored["disruptions"]["7"]["state"] == ["current", "2025-10-30", "2025-10-31"]
+
+    restored = EventLog(hass, "entry-1")
+    await restored.async_load()
+    assert restored.entries(7) == log.entries(7)
+    # Already logged before the restart, so no new line
+    assert restored.async_record([_span(7, "current")]) == 0
@@ -0,0 +1,460 @@
+"""Tests for the shared page fetch hub."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.ennatuurlijk_disruptions.coordinator import (
+    EnnatuurlijkCoordinator,
+)
+from custom_components.ennatuurlijk_disruptions.hub import (
+    EnnatuurlijkPageHub,
+    parse_max_age,
+    storage_key,
+)
+from custom_components.ennatuurlijk_disruptions.parser_backends import BACKEND_STREAM
+from custom_components.ennatuurlijk_disruptions.resilience import (
+    EnnatuurlijkFetchError,
+)
+
+from .conftest import MockResponse
+
+LOCATIONS = [
+    ("Tilburg", "5045AB"),
+    ("Breda", "4811AA"),
+    ("Maastricht", "6211AB"),
+]
+# (title, date) of the fixture's articles per location; nothing is current
+EXPECTED_PLANNED = {
+    "Tilburg": [
+        ("9835 - Tilburg", "31-10-2025"),
+        ("9836 - Tilburg", "03-11-2025"),
+        ("9839 - Tilburg", "07-11-2025"),
+        ("9844 - Tilburg", "11-11-2025"),
+        ("9845 - Tilburg", "12-11-2025"),
+        ("9846 - Tilburg", "13-11-2025"),
+    ],
+    "Breda": [
+        ("9837 - Breda", "04-11-2025"),
+        ("9838 - Breda", "05-11-2025"),
+    ],
+    "Maastricht": [
+        ("9841 - Maastricht", "05-11-2025"),
+        ("9843 - Maastricht", "06-11-2025"),
+    ],
+}
+
+
+def _subentry(town, postal_code):
+    return SimpleNamespace(data={"town": town, "postal_code": postal_code})
+
+
+def _titles(data, section):
+    return [(d.title, d.date_str) for d in data[section]["dates"]]
+
+
+def _expire(hub):
+    """Age the cached page past the reuse window."""
+    hub._page_monotonic -= 3600
+
+
+@pytest.mark.asyncio
+async def test_locations_share_one_fetch_and_parse(hass, mock_aiohttp_session):
+    """Test that many locations cost a single download and parse."""
+    hub = EnnatuurlijkPageHub(hass)
+    coordinators = [
+        EnnatuurlijkCoordinator(hass, _subentry(town, pc), hub=hub)
+        for town, pc in LOCATIONS
+    ]
+    for coordinator in coordinators:
+        await coordinator.async_refresh()
+
+    stats = hub.stats
+    assert stats["fetches"] == 1
+    assert stats["parses"] == 1
+    assert stats["deliveries"] == len(LOCATIONS)
+    assert stats["fetches_saved"] == 3 * len(LOCATIONS) - 1
+    assert mock_aiohttp_session.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_page_matches_locations(hass, mock_aiohttp_session):
+    """Test that filtering the shared page finds the articles of each location."""
+    hub = EnnatuurlijkPageHub(hass)
+    for town, postal_code in LOCATIONS:
+        coordinator = EnnatuurlijkCoordinator(
+            hass, _subentry(town, postal_code), hub=hub
+        )
+        await coordinator.async_refresh()
+        assert _titles(coordinator.data, "planned") == EXPECTED_PLANNED[town]
+        assert _titles(coordinator.data, "current") == []
+
+
+@pytest.mark.asyncio
+async def test_fresh_page_is_fanned_out(hass, mock_aiohttp_session):
+    """Test that a new page is pushed to coordinators that already have data."""
+    hub = EnnatuurlijkPageHub(hass)
+    first = EnnatuurlijkCoordinator(hass, _subentry(*LOCATIONS[0]), hub=hub)
+    second = EnnatuurlijkCoordinator(hass, _subentry(*LOCATIONS[1]), hub=hub)
+    await first.async_refresh()
+    await second.async_refresh()
+    second.data = {**second.data, "planned": {"state": False, "dates": []}}
+
+    # Expire the cached page so the next request downloads again
+    _expire(hub)
+    await first.async_refresh()
+
+    assert hub.stats["fetches"] == 2
+    assert second.data["planned"]["state"] is True
+
+
+@pytest.mark.parametrize(
+    ("cache_control", "expected"),
+    [
+        (None, 0),
+        ("max-age=300", 300),
+        ("public, max-age=60, must-revalidate", 60),
+        ("no-cache, max-age=60", 0),
+        ("s-maxage=60", 0),
+    ],
+)
+def test_parse_max_age(cache_control, expected):
+    """Test Cache-Control max-age parsing."""
+    assert parse_max_age(cache_control) == expected
+
+
+@pytest.mark.asyncio
+async def test_etag_revalidation_skips_parse(hass, mock_aiohttp_session):
+    """Test that a 304 response reuses the previously parsed page."""
+    session = mock_aiohttp_session.return_value
+    session.headers = {"ETag": '"abc"'}
+    hub = EnnatuurlijkPageHub(hass)
+    coordinator = EnnatuurlijkCoordinator(hass, _subentry(*LOCATIONS[0]), hub=hub)
+    await coordinator.async_refresh()
+    first_data = coordinator.data
+
+    _expire(hub)
+    await coordinator.async_refresh()
+
+    assert session.requests[-1]["If-None-Match"] == '"abc"'
+    assert hub.stats["fetches"] == 2
+    assert hub.stats["parses"] == 1
+    assert hub.stats["not_modified"] == 1
+    assert coordinator.data["planned"]["dates"] == first_data["planned"]["dates"]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_body_without_validators_skips_parse(
+    hass, mock_aiohttp_session
+):
+    """Test that an identical body is detected by hash and not parsed again."""
+    session = mock_aiohttp_session.return_value
+    hub = EnnatuurlijkPageHub(hass)
+    await hub.async_get_page()
+    _expire(hub)
+    await hub.async_get_page()
+
+    assert "If-None-Match" not in session.requests[-1]
+    assert hub.stats["fetches"] == 2
+    assert hub.stats["parses"] == 1
+    assert hub.stats["hash_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_control_max_age_is_honoured(hass, mock_aiohttp_session):
+    """Test that no request is made while the page is fresh per max-age."""
+    session = mock_aiohttp_session.return_value
+    session.headers = {"Cache-Control": "max-age=7200"}
+    hub = EnnatuurlijkPageHub(hass)
+    await hub.async_get_page()
+    hub._page_monotonic -= 3600
+    await hub.async_get_page()
+
+    assert len(session.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_max_age_is_capped_by_polling_interval(hass, mock_aiohttp_session):
+    """Test that a long max-age does not outlast the polling interval."""
+    session = mock_aiohttp_session.return_value
+    session.headers = {"Cache-Control": "max-age=86400"}
+    hub = EnnatuurlijkPageHub(hass)
+    coordinator = EnnatuurlijkCoordinator(hass, _subentry(*LOCATIONS[0]), hub=hub)
+    coordinator.update_interval = timedelta(minutes=30)
+    await hub.async_get_page()
+
+    hub._page_monotonic -= 1200
+    await hub.async_get_page()
+    assert len(session.requests) == 1
+
+    hub._page_monotonic -= 600
+    await hub.async_get_page()
+    assert len(session.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_parsed_page_is_persisted_and_restored(
+    hass, hass_storage, mock_aiohttp_session
+):
+    """Test that the last parsed page survives a restart via the store."""
+    session = mock_aiohttp_session.return_value
+    session.headers = {"ETag": '"abc"'}
+    hub = EnnatuurlijkPageHub(hass, "entry-1")
+    page = await hub.async_get_page()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+
+    stored = hass_storage[storage_key("entry-1")]
+    assert stored["version"] == 1
+    assert stored["data"]["etag"] == '"abc"'
+
+    restarted = EnnatuurlijkPageHub(hass, "entry-1")
+    restored = await restarted.async_load()
+    assert restored == page
+
+    # The first download after the restart is a cheap revalidation
+    await restarted.async_get_page()
+    assert session.requests[-1]["If-None-Match"] == '"abc"'
+    assert restarted.stats["parses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_invalid_cached_page_is_ignored(hass, hass_storage):
+    """Test that a corrupt store entry does not break loading."""
+    hass_storage[storage_key("entry-1")] = {
+        "version": 1,
+        "key": storage_key("entry-1"),
+        "data": {"articles": [["planned"]]},
+    }
+    hub = EnnatuurlijkPageHub(hass, "entry-1")
+    assert await hub.async_load() is None
+    assert hub.page is None
+
+
+@pytest.fixture
+def gated_session(load_fixture):
+    """Patch the client session with responses held until the gate opens."""
+    gate = asyncio.Event()
+
+    class GatedResponse(MockResponse):
+        async def __aenter__(self):
+            await gate.wait()
+            return self
+
+    session = MagicMock()
+    session.get.side_effect = lambda url, **kwargs: GatedResponse(
+        load_fixture("ennatuurlijk_storingen.html")
+    )
+    with patch(
+        "homeassistant.helpers.aiohttp_client.async_get_clientsession",
+        return_value=session,
+    ):
+        yield session, gate
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_request(hass, gated_session):
+    """Test that refreshes arriving during a fetch join it."""
+    session, gate = gated_session
+    hub = EnnatuurlijkPageHub(hass)
+    coordinators = [
+        EnnatuurlijkCoordinator(hass, _subentry(town, pc), hub=hub)
+        for town, pc in LOCATIONS
+    ]
+    refreshes = asyncio.gather(*(c.async_refresh() for c in coordinators))
+    await asyncio.sleep(0)
+    gate.set()
+    await refreshes
+
+    assert session.get.call_count == 1
+    assert hub.stats["issued"] == 1
+    assert hub.stats["coalesced"] == len(LOCATIONS) - 1
+    assert all(c.last_update_success for c in coordinators)
+
+    # A burst right after the fetch is absorbed by the result TTL
+    await coordinators[0].async_refresh()
+    assert session.get.call_count == 1
+    assert hub.stats["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_abort_shared_fetch(hass, gated_session):
+    """Test that cancelling the first caller leaves the fetch running for others."""
+    session, gate = gated_session
+    hub = EnnatuurlijkPageHub(hass)
+    first = asyncio.ensure_future(hub.async_get_page())
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(hub.async_get_page())
+    await asyncio.sleep(0)
+    first.cancel()
+    gate.set()
+
+    page = await second
+    assert page.articles
+    assert first.cancelled()
+    assert session.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_content_does_not_notify(hass, mock_aiohttp_session):
+    """Test that entities are only notified for sections whose content changed."""
+    hub = EnnatuurlijkPageHub(hass)
+    coordinator = EnnatuurlijkCoordinator(hass, _subentry(*LOCATIONS[0]), hub=hub)
+    calls = {"planned": 0, "current": 0}
+    unsubs = []
+    for section in calls:
+
+        def _listener(section=section):
+            calls[section] += 1
+
+        unsubs.append(coordinator.async_add_listener(_listener, section))
+
+    await coordinator.async_refresh()
+    assert calls == {"planned": 1, "current": 1}
+
+    # The reused page gives equal data, so there is no listener pass at all
+    await coordinator.async_refresh()
+    assert hub.stats["fetches"] == 1
+    assert coordinator.update_stats["skipped"] == 0
+
+    # Same content fetched again: nobody is notified
+    _expire(hub)
+    await coordinator.async_refresh()
+    assert calls == {"planned": 1, "current": 1}
+    assert hub.stats["fetches"] == 2
+
+    # Only the planned section changes
+    coordinator.async_set_updated_data(
+        {**coordinator.data, "planned": {"state": False, "dates": []}}
+    )
+    assert calls == {"planned": 2, "current": 1}
+    assert coordinator.update_stats == {
+        "notified": 2,
+        "skipped": 1,
+        "section_writes": 4,
+    }
+    assert hub.stats["updates_skipped"] == 1
+    for unsub in unsubs:
+        unsub()
+
+
+@pytest.mark.asyncio
+async def test_oversized_page_is_rejected(hass, mock_aiohttp_session):
+    """Test that a body beyond the size limit fails the fetch."""
+    hub = EnnatuurlijkPageHub(hass, max_page_size=32)
+    with pytest.raises(EnnatuurlijkFetchError):
+        await hub.async_get_page()
+    assert hub.stats["failed_fetches"] == 1
+    assert hub.page is None
+
+    # A declared Content-Length is rejected before reading
+    hub.async_set_max_page_size(1024)
+    mock_aiohttp_session.return_value.headers = {"Content-Length": str(2 << 20)}
+    with pytest.raises(EnnatuurlijkFetchError):
+        await hub.async_get_page()
+    assert hub.stats["failed_fetches"] == 2
+
+
+@pytest.mark.asyncio
+async def test_parse_follows_solved_retention(
+    hass, hass_storage, mock_aiohttp_session, freezer
+):
+    """Test that only the solved disruptions a location keeps are parsed."""
+    freezer.move_to("2025-10-31 12:00:00+00:00")
+    main_entry = SimpleNamespace(options={"days_to_keep_solved": 0})
+    hub = EnnatuurlijkPageHub(hass, "entry-1", parser_backend=BACKEND_STREAM)
+    coordinator = EnnatuurlijkCoordinator(
+        hass, _subentry(*LOCATIONS[0]), main_entry, hub
+    )
+    await coordinator.async_refresh()
+
+    assert "completed" not in {article[0] for article in hub.page.articles}
+    # Reading stopped once the planned section was closed
+    assert hub.stats["early_stops"] == 1
+
+    # A longer retention parses the unchanged page again
+    main_entry.options = {"days_to_keep_solved": 3}
+    assert hub.needs_reparse
+    await coordinator.async_refresh()
+
+    # Streamed pages are not prefiltered, so other locations' articles are kept
+    solved = [article for article in hub.page.articles if article[0] == "completed"]
+    assert len(solved) == 6
+    assert hub.stats["parses"] == 2
+    assert not hub.needs_reparse
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    restored = await EnnatuurlijkPageHub(hass, "entry-1").async_load()
+    assert restored.plan == hub.page.plan
+
+
+@pytest.mark.asyncio
+async def test_solved_alert_follows_location_retention(
+    hass, mock_aiohttp_session, freezer
+):
+    """Test that the solved alert only counts the solved dates a location keeps."""
+    freezer.move_to("2025-10-31 12:00:00+00:00")
+    hub = EnnatuurlijkPageHub(hass)
+    short, long = (
+        EnnatuurlijkCoordinator(
+            hass,
+            _subentry("Tilburg", postal_code),
+            SimpleNamespace(options={"days_to_keep_solved": days}),
+            hub,
+        )
+        for postal_code, days in (("5045AB", 1), ("5038AA", 3))
+    )
+    await short.async_refresh()
+    await long.async_refresh()
+
+    # The page was parsed for the longer retention of the other location
+    assert long.data["solved"]["dates"]
+    assert long.data["solved"]["state"] is True
+    assert short.data["solved"]["dates"] == []
+    assert short.data["solved"]["state"] is False
+
+
+@pytest.mark.asyncio
+async def test_page_is_prefiltered_for_locations(hass, mock_aiohttp_session):
+    """Test the prefilter stats and parsing the kept body for added locations."""
+    session = mock_aiohttp_session.return_value
+    session.headers = {"ETag": '"abc"'}
+    hub = EnnatuurlijkPageHub(hass)
+    tilburg = EnnatuurlijkCoordinator(hass, _subentry(*LOCATIONS[0]), hub=hub)
+    await tilburg.async_refresh()
+
+    stats = hub.stats
+    assert (stats["prefilter_hits"], stats["prefilter_misses"]) == (11, 21)
+    assert stats["prefilter_hit_ratio"] == 0.344
+
+    breda = EnnatuurlijkCoordinator(hass, _subentry(*LOCATIONS[1]), hub=hub)
+    assert hub.needs_reparse
+    await breda.async_refresh()
+
+    # The page is fresh, so the kept body was parsed again without a request
+    assert hub.stats["fetches"] == 1
+    assert hub.stats["parses"] == 2
+    assert not hub.needs_reparse
+    assert _titles(breda.data, "planned") == EXPECTED_PLANNED["Breda"]
+
+    # Also for a stale page, when asked to
+    _expire(hub)
+    EnnatuurlijkCoordinator(hass, _subentry(*LOCATIONS[2]), hub=hub)
+    await hub.async_reparse()
+    assert hub.stats["fetches"] == 1
+    assert hub.stats["parses"] == 3
+
+    # Otherwise a stale page is revalidated and the kept body parsed on a 304
+    EnnatuurlijkCoordinator(hass, _subentry("Eindhoven", "5611AA"), hub=hub)
+    await breda.async_refresh()
+    assert session.requests[-1]["If-None-Match"] == '"abc"'
+    assert hub.stats["not_modified"] == 1
+    assert hub.stats["parses"] == 4
+    assert not hub.needs_reparse
@@ -1,12 +1,24 @@
 """Integration-level tests following HA core patterns"""
 
+import asyncio
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import aiohttp
 import pytest
+from homeassistant.config_entries import ConfigSubentry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 from custom_components.ennatuurlijk_disruptions.const import DOMAIN
+from custom_components.ennatuurlijk_disruptions.hub import storage_key
 
-from .conftest import setup_integration
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from .conftest import MockResponse, setup_integration
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 
 @pytest.fixture
@@ -69,4 +81,312 @@ async def test_setup_creates_coordinator_and_sensors(
     
     # The integration should still set up platforms (sensor, binary_sensor, calendar)
     # but no entities will be created since there are no location subentries
-    # This tests that the basic integration setup works with v2 main entries
\ No newline at end of file
+    # This tests that the basic integration setup works with v2 main entries
+
+@pytest.mark.asyncio
+async def test_setup_warm_starts_from_cached_page(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+    hass_storage,
+    load_fixture,
+):
+    """Test that locations are seeded from the store without waiting for the site."""
+    main_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Ennatuurlijk Disruptions",
+        data={"name": "Ennatuurlijk Disruptions"},
+        options={"days_to_keep_solved": 7, "update_interval": 120},
+        unique_id="ennatuurlijk_global",
+        version=2,
+        subentries_data=[
+            {
+                "data": {"name": "Home", "town": "Tilburg", "postal_code": "5045AB"},
+                "subentry_type": "location",
+                "title": "Tilburg - 5045AB",
+                "unique_id": "5045AB",
+            }
+        ],
+    )
+    hass_storage[storage_key(main_entry.entry_id)] = {
+        "version": 1,
+        "key": storage_key(main_entry.entry_id),
+        "data": {
+            "fetched_at": "2025-10-30T08:00:00",
+            "etag": None,
+            "last_modified": None,
+            "body_hash": None,
+            "articles": [
+                [
+                    "current",
+                    "9835 - Tilburg",
+                    "30-10-2025",
+                    "https://ennatuurlijk.nl/storingen/108227",
+                ]
+            ],
+        },
+    }
+
+    release = asyncio.Event()
+
+    class SlowResponse(MockResponse):
+        async def __aenter__(self):
+            await release.wait()
+            return self
+
+    session = MagicMock()
+    session.get.return_value = SlowResponse(load_fixture("ennatuurlijk_storingen.html"))
+    with patch(
+        "homeassistant.helpers.aiohttp_client.async_get_clientsession",
+        return_value=session,
+    ):
+        # Setup completes while the site has not answered yet
+        await setup_integration(hass, main_entry)
+
+        assert main_entry.state.name == "LOADED"
+        coordinator = next(iter(main_entry.runtime_data.values()))
+        assert coordinator.last_update_success
+        assert coordinator.current["state"] is True
+        assert coordinator.current["dates"][0].title == "9835 - Tilburg"
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert session.get.call_count == 1
+    assert len(coordinator.planned["dates"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_midnight_rollover_updates_day_relative_attributes(
+    hass: HomeAssistant,
+    enable_custom_integrations,
+    mock_aiohttp_session,
+    freezer,
+):
+    """Test that local midnight recomputes day values without fetching."""
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+    freezer.move_to("2025-10-30 23:59:30+01:00")
+    main_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Ennatuurlijk Disruptions",
+        data={"name": "Ennatuurlijk Disruptions"},
+        options={"days_to_keep_solved": 7, "update_interval": 120},
+        unique_id="ennatuurlijk_global",
+        version=2,
+        subentries_data=[
+            {
+                "data": {"name": "Home", "town": "Tilburg", "postal_code": "5045AB"},
+                "subentry_type": "location",
+                "title": "Tilburg - 5045AB",
+                "unique_id": "5045AB",
+            }
+        ],
+    )
+    await setup_integration(hass, main_entry)
+    registry = er.async_get(hass)
+    planned = registry.async_get_entity_id("sensor", DOMAIN, f"{DOMAIN}_5045AB_planned")
+    alert = registry.async_get_entity_id(
+        "binary_sensor", DOMAIN, f"{DOMAIN}_5045AB_planned_alert"
+    )
+    session = mock_aiohttp_session.return_value
+    requests = len(session.requests)
+    alert_reported = hass.states.get(alert).last_reported
+
+    assert hass.states.get(planned).attributes["days_until_planned_date"] == 1
+    assert not hass.states.get(planned).attributes["is_planned_date_today"]
+
+    freezer.move_to("2025-10-31 00:00:00+01:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(planned).attributes["days_until_planned_date"] == 0
+    assert hass.states.get(planned).attributes["is_planned_date_today"]
+    # Nothing day relative about the alert, so it is not written again
+    assert hass.states.get(alert).last_reported == alert_reported
+    assert len(session.requests) == requests
+
+
+def _main_entry_with_locations(*locations):
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Ennatuurlijk Disruptions",
+        data={"name": "Ennatuurlijk Disruptions"},
+        options={"days_to_keep_solved": 7, "update_interval": 120},
+        unique_id="ennatuurlijk_global",
+        version=2,
+        subentries_data=[
+            {
+                "data": {"name": town, "town": town, "postal_code": postal_code},
+                "subentry_type": "location",
+                "title": f"{town} - {postal_code}",
+                "unique_id": postal_code,
+            }
+            for town, postal_code in locations
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_first_refresh_runs_locations_concurrently(
+    hass: HomeAssistant, enable_custom_integrations, load_fixture
+):
+    """Test that all locations wait on one fetch and setup is bounded in time."""
+    main_entry = _main_entry_with_locations(("Tilburg", "5045AB"), ("Breda", "4811AA"))
+    release = asyncio.Event()
+
+    class SlowResponse(MockResponse):
+        async def __aenter__(self):
+            await release.wait()
+            return self
+
+    session = MagicMock()
+    session.get.return_value = SlowResponse(load_fixture("ennatuurlijk_storingen.html"))
+    with (
+        patch(
+            "homeassistant.helpers.aiohttp_client.async_get_clientsession",
+            return_value=session,
+        ),
+        patch(
+            "custom_components.ennatuurlijk_disruptions.FIRST_REFRESH_DEADLINE_SECONDS",
+            0.05,
+        ),
+    ):
+        # The deadline passes while the site has not answered yet
+        await setup_integration(hass, main_entry)
+        assert main_entry.state.name == "LOADED"
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert session.get.call_count == 1
+    assert all(
+        coordinator.data is not None
+        for coordinator in main_entry.runtime_data.values()
+    )
+
+
+@pytest.mark.asyncio
+async def test_first_refresh_retries_setup_when_no_location_has_data(
+    hass: HomeAssistant, enable_custom_integrations
+):
+    """Test that setup is retried when the page cannot be fetched at all."""
+    main_entry = _main_entry_with_locations(("Tilburg", "5045AB"))
+    session = MagicMock()
+    session.get.return_value = MockResponse("", status=503)
+    with (
+        patch(
+            "homeassistant.helpers.aiohttp_client.async_get_clientsession",
+            return_value=session,
+        ),
+        patch(
+            "custom_components.ennatuurlijk_disruptions.hub.FETCH_ATTEMPTS", 1
+        ),
+    ):
+        await setup_integration(hass, main_entry)
+
+    assert main_entry.state.name == "SETUP_RETRY"
+
+
+@pytest.mark.asyncio
+async def test_locations_and_options_change_without_reload(
+    hass: HomeAssistant, enable_custom_integrations, mock_aiohttp_session
+):
+    """Test adding and removing a location and changing options in place."""
+    main_entry = _main_entry_with_locations(("Tilburg", "5045AB"))
+    await setup_integration(hass, main_entry)
+    registry = er.async_get(hass)
+    session = mock_aiohttp_session.return_value
+    requests = len(session.requests)
+    tilburg = next(iter(main_entry.runtime_data.values()))
+    calendar = hass.data["entity_components"]["calendar"].get_entity(
+        "calendar.ennatuurlijk_disruptions_calendar"
+    )
+
+    hass.config_entries.async_add_subentry(
+        main_entry,
+        ConfigSubentry(
+            data={"name": "Breda", "town": "Breda", "postal_code": "4811AA"},
+            subentry_type="location",
+            title="Breda - 4811AA",
+            unique_id="4811AA",
+        ),
+    )
+    await hass.async_block_till_done()
+
+    assert main_entry.state.name == "LOADED"
+    assert len(main_entry.runtime_data) == 2
+    assert next(iter(main_entry.runtime_data.values())) is tilburg
+    planned = registry.async_get_entity_id("sensor", DOMAIN, f"{DOMAIN}_4811AA_planned")
+    assert hass.states.get(planned) is not None
+    assert hass.data["entity_components"]["calendar"].get_entity(
+        "calendar.ennatuurlijk_disruptions_calendar"
+    ) is calendar
+    # The page was prefiltered for Tilburg, so the kept body is parsed again
+    assert len(session.requests) == requests
+    assert hass.data[DOMAIN][main_entry.entry_id].page.plan.locations == {
+        ("Tilburg", "5045AB"),
+        ("Breda", "4811AA"),
+    }
+
+    breda_id = next(
+        key for key, sub in main_entry.subentries.items() if sub.unique_id == "4811AA"
+    )
+    breda = main_entry.runtime_data[breda_id]
+    hass.config_entries.async_remove_subentry(main_entry, breda_id)
+    await hass.async_block_till_done()
+
+    assert list(main_entry.runtime_data.values()) == [tilburg]
+    assert breda not in hass.data[DOMAIN][main_entry.entry_id]._coordinators
+    assert hass.states.get(planned) is None
+
+    hass.config_entries.async_update_entry(
+        main_entry, options={**main_entry.options, "update_interval": 30}
+    )
+    await hass.async_block_till_done()
+
+    assert next(iter(main_entry.runtime_data.values())) is tilburg
+    assert tilburg.baseline_interval == timedelta(minutes=30)
+    assert len(session.requests) == requests
+
+
+@pytest.mark.asyncio
+async def test_added_location_recovers_from_failed_refresh(
+    hass: HomeAssistant, enable_custom_integrations, mock_aiohttp_session
+):
+    """Test that a location added while the site is down is kept and retried."""
+    main_entry = _main_entry_with_locations(("Tilburg", "5045AB"))
+    await setup_integration(hass, main_entry)
+    registry = er.async_get(hass)
+    session = mock_aiohttp_session.return_value
+    serve = session.get
+    # No body to parse again, as after a restart from the stored page
+    hass.data[DOMAIN][main_entry.entry_id]._body = None
+    session.get = MagicMock(side_effect=aiohttp.ClientResponseError(None, (), status=404))
+
+    hass.config_entries.async_add_subentry(
+        main_entry,
+        ConfigSubentry(
+            data={"name": "Breda", "town": "Breda", "postal_code": "4811AA"},
+            subentry_type="location",
+            title="Breda - 4811AA",
+            unique_id="4811AA",
+        ),
+    )
+    await hass.async_block_till_done()
+
+    assert main_entry.state.name == "LOADED"
+    assert len(main_entry.runtime_data) == 2
+    planned = registry.async_get_entity_id("sensor", DOMAIN, f"{DOMAIN}_4811AA_planned")
+    assert hass.states.get(planned).state == "unavailable"
+
+    # The failed location retries on the shared interval
+    breda = list(main_entry.runtime_data.values())[1]
+    tilburg = next(iter(main_entry.runtime_data.values()))
+    assert breda.update_interval == tilburg.update_interval
+    session.get = serve
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + breda.update_interval + timedelta(seconds=1)
+    )
+    # The shared page fetch runs as a background task
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert hass.states.get(planned).state != "unavailable"
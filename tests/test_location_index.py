@@ -0,0 +1,56 @@
+"""Tests for the location index."""
+
+import pytest
+
+from custom_components.ennatuurlijk_disruptions.location_index import (
+    LocationIndex,
+    town_key,
+)
+
+ARTICLES = (
+    ("current", "9840 - Tilburg", "30-10-2025", None),
+    ("planned", "Werkzaamheden 5045 AB Reeshof", "31-10-2025", None),
+    ("planned", "Storing 12345 Bredaseweg", "01-11-2025", None),
+    ("planned", "Onderhoud Bergen op Zoom", "02-11-2025", None),
+    ("completed", "Storing 's-Hertogenbosch 5211AB", "03-11-2025", None),
+    ("completed", "Spoedwerk Ærø Sûrsted", "04-11-2025", None),
+    ("planned", "Storing Sint Maarten aan de Dijk", "05-11-2025", None),
+    ("planned", "Storing Sint Maarten aan de Zee", "06-11-2025", None),
+)
+
+
+@pytest.mark.parametrize(
+    ("town", "postal_code", "expected"),
+    [
+        ("Tilburg", "9999ZZ", [0]),
+        ("TILBURG", "", [0]),
+        ("Nowhere", "9840ZZ", [0]),
+        # Spaced and unspaced full postal codes
+        ("Nowhere", "5045AB", [1]),
+        ("Nowhere", "5211 ab", [4]),
+        # Token boundaries: no match inside longer numbers or words
+        ("Breda", "1234AB", []),
+        ("Nowhere", "2345AB", []),
+        # Multi word, punctuated and accented town names
+        ("Bergen op Zoom", "0000AA", [3]),
+        ("'s-Hertogenbosch", "0000AA", [4]),
+        ("Sursted", "0000AA", [5]),
+        # Towns longer than an index key
+        ("Sint Maarten aan de Dijk", "0000AA", [6]),
+        ("Sint Maarten aan de", "0000AA", [6, 7]),
+        ("Sint Maarten aan Zee", "0000AA", []),
+        # Matches are in page order
+        ("Tilburg", "5045AB", [0, 1]),
+        ("Tilburg", "5211AB", [0, 4]),
+    ],
+)
+def test_lookup(town, postal_code, expected):
+    """Test resolving locations to article ids."""
+    assert LocationIndex(ARTICLES).lookup(town, postal_code) == expected
+
+
+def test_town_key():
+    """Test the normalisation of configured towns."""
+    assert town_key(" Den  Bosch ") == "den bosch"
+    assert town_key("'s-Hertogenbosch") == "s hertogenbosch"
+
@@ -0,0 +1,45 @@
+"""Tests for the typed disruption records."""
+
+from datetime import date, datetime
+
+from custom_components.ennatuurlijk_disruptions.hub import ParsedPage
+from custom_components.ennatuurlijk_disruptions.models import Disruption
+
+LINK = "https://ennatuurlijk.nl/storingen/108237"
+
+
+def test_from_article():
+    """Test that dates, ids and statuses are parsed once into the record."""
+    record = Disruption.from_article(("completed", "9840 - Tilburg", "03-11-2025", LINK))
+
+    assert record == Disruption(108237, "solved", "9840 - Tilburg", date(2025, 11, 3), LINK)
+    assert record.as_dict() == {
+        "description": "9840 - Tilburg",
+        "date": "03-11-2025",
+        "link": LINK,
+    }
+
+
+def test_from_article_without_id_or_valid_date():
+    """Test links without id and dates that do not exist."""
+    assert Disruption.from_article(("planned", "x", "01-11-2025", None)).id is None
+    assert Disruption.from_article(("planned", "x", "01-11-2025", "/over-ons")).id is None
+    assert Disruption.from_article(("planned", "x", "31-02-2025", LINK)) is None
+
+
+def test_parsed_page_select():
+    """Test that a page resolves locations to records in page order."""
+    page = ParsedPage(
+        articles=(
+            ("current", "9840 - Tilburg", "30-10-2025", LINK),
+            ("planned", "9841 - Breda", "31-10-2025", None),
+            ("planned", "9842 - Tilburg", "31-02-2025", None),
+            ("completed", "9843 - Tilburg", "29-10-2025", None),
+        ),
+        fetched_at=datetime(2025, 10, 30, 12, 0),
+    )
+
+    assert [(d.status, d.title) for d in page.select("Tilburg", "5045AB")] == [
+        ("current", "9840 - Tilburg"),
+        ("solved", "9843 - Tilburg"),
+    ]
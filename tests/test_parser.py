@@ -0,0 +1,299 @@
+"""Tests for the pluggable parser backends."""
+
+import codecs
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+from custom_components.ennatuurlijk_disruptions.hub import EnnatuurlijkPageHub
+from custom_components.ennatuurlijk_disruptions.parser import (
+    ParsePlan,
+    build_soup,
+    parse_page,
+)
+from custom_components.ennatuurlijk_disruptions.parser_backends import (
+    BACKEND_AUTO,
+    BACKEND_HTML_PARSER,
+    BACKEND_LXML,
+    BACKEND_SELECTOLAX,
+    BACKEND_STREAM,
+    LxmlBackend,
+    SelectolaxBackend,
+    detect_encoding,
+    get_backend,
+)
+from custom_components.ennatuurlijk_disruptions.streaming import (
+    DisruptionStreamParser,
+    parse_stream,
+)
+
+OPTIONAL_BACKENDS = {BACKEND_LXML: "lxml", BACKEND_SELECTOLAX: "selectolax"}
+
+
+@pytest.fixture
+def page_html(load_fixture):
+    """Return the storingen page fixture."""
+    return load_fixture("ennatuurlijk_storingen.html")
+
+
+@pytest.mark.parametrize(
+    "name", [BACKEND_HTML_PARSER, BACKEND_LXML, BACKEND_SELECTOLAX, BACKEND_STREAM]
+)
+def test_backends_match_reference_parser(page_html, name):
+    """Test that every backend yields exactly the BeautifulSoup articles."""
+    if name in OPTIONAL_BACKENDS:
+        pytest.importorskip(OPTIONAL_BACKENDS[name])
+    expected = parse_page(BeautifulSoup(page_html, "html.parser"))
+
+    backend = get_backend(name)
+
+    assert backend.name == name
+    assert backend.parse_page(page_html) == expected
+    assert backend.parse_bytes(page_html.encode(), None) == expected
+    assert {section for section, *_ in expected} == {
+        "current",
+        "planned",
+        "completed",
+    }
+
+
+def test_section_restricted_soup(page_html):
+    """Test that building only the sections keeps the articles and drops the rest."""
+    full = build_soup(page_html, restrict_sections=False)
+    restricted = build_soup(page_html)
+
+    assert parse_page(restricted) == parse_page(full)
+    assert full.find("footer") is not None
+    assert restricted.find("footer") is None
+    assert restricted.find("script") is None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_stream_chunk_boundaries(page_html, chunk_size):
+    """Test that feeding the page in arbitrary chunks gives the same articles."""
+    expected = parse_page(build_soup(page_html))
+
+    assert parse_stream(page_html, chunk_size) == expected
+
+
+@pytest.mark.parametrize("name", [BACKEND_LXML, BACKEND_SELECTOLAX, BACKEND_STREAM])
+def test_backend_handles_missing_parts(name):
+    """Test articles without link, title or date on the fast paths."""
+    if name in OPTIONAL_BACKENDS:
+        pytest.importorskip(OPTIONAL_BACKENDS[name])
+    html = """
+    <div id="planned">
+      <article class="node node--type-malfunction">
+        <h4 class="h3"> 1234 -  Tilburg </h4>
+        <div class="expectation">
+          <div class="label">Verwacht</div>
+          <div class="value"><!-- datum --> 3 november 2025 </div>
+        </div>
+      </article>
+      <article class="node node--type-malfunction">
+        <a href="/storingen/1">Lees meer</a>
+        <div class="expectation"><div class="value">Onbekend</div></div>
+      </article>
+    </div>
+    """
+    backend = get_backend(name)
+    expected = parse_page(BeautifulSoup(html, "html.parser"))
+
+    assert backend.parse_page(html) == expected
+    assert expected == (("planned", "1234 -  Tilburg", "03-11-2025", None),)
+
+
+@pytest.mark.parametrize(
+    ("raw", "charset", "expected"),
+    [
+        (b"<p>", None, "utf-8"),
+        (b"<p>", "ISO-8859-1", "iso8859-1"),
+        (b"<p>", "unknown-charset", "utf-8"),
+        (b'<meta content="text/html; charset=windows-1252">', None, "cp1252"),
+        (b'<meta charset="windows-1252">', "utf-8", "utf-8"),
+        (codecs.BOM_UTF8 + b'<meta charset="windows-1252">', "latin-1", "utf-8"),
+    ],
+)
+def test_detect_encoding(raw, charset, expected):
+    """Test the BOM, header and meta charset precedence."""
+    assert detect_encoding(raw, charset) == expected
+
+
+@pytest.mark.parametrize("charset", [None, "windows-1252"])
+@pytest.mark.parametrize(
+    "name", [BACKEND_HTML_PARSER, BACKEND_LXML, BACKEND_SELECTOLAX, BACKEND_STREAM]
+)
+def test_parse_bytes_decodes_legacy_charset(name, charset):
+    """Test that a non UTF-8 body is parsed in its declared encoding."""
+    if name in OPTIONAL_BACKENDS:
+        pytest.importorskip(OPTIONAL_BACKENDS[name])
+    raw = """<html><head><meta charset="windows-1252"></head><body>
+    <div id="current">
+      <article class="node node--type-malfunction">
+        <h4 class="h3">5038 - Café Tilburg</h4>
+        <div class="expectation"><div class="value">3 november 2025</div></div>
+      </article>
+    </div>
+    </body></html>""".encode("cp1252")
+
+    assert get_backend(name).parse_bytes(raw, charset) == (
+        ("current", "5038 - Café Tilburg", "03-11-2025", None),
+    )
+
+
+@pytest.mark.parametrize(
+    "name", [BACKEND_HTML_PARSER, BACKEND_LXML, BACKEND_SELECTOLAX, BACKEND_STREAM]
+)
+def test_backends_follow_parse_plan(page_html, name):
+    """Test skipping the solved section and solved articles outside the window."""
+    if name in OPTIONAL_BACKENDS:
+        pytest.importorskip(OPTIONAL_BACKENDS[name])
+    backend = get_backend(name)
+    full = parse_page(build_soup(page_html))
+
+    without_solved = ParsePlan.for_retention(0, date(2025, 10, 31))
+    assert backend.parse_page(page_html, without_solved) == tuple(
+        article for article in full if article[0] != "completed"
+    )
+
+    window = ParsePlan.for_retention(3, date(2025, 10, 31))
+    kept = {"28-10-2025", "29-10-2025", "30-10-2025"}
+    articles = backend.parse_page(page_html, window)
+    assert articles == tuple(
+        article for article in full if article[0] != "completed" or article[2] in kept
+    )
+    assert sum(article[0] == "completed" for article in articles) == 6
+
+
+def test_old_solved_articles_are_rejected_before_title():
+    """Test that no title is extracted for solved articles outside the window."""
+    pytest.importorskip("lxml")
+    html = """
+    <div id="completed">
+      <article class="node node--type-malfunction">
+        <h4 class="h3">5038 - Tilburg</h4>
+        <div class="expectation"><div class="value">1 oktober 2025</div></div>
+      </article>
+      <article class="node node--type-malfunction">
+        <h4 class="h3">5045 - Tilburg</h4>
+        <div class="expectation"><div class="value">30 oktober 2025</div></div>
+      </article>
+    </div>
+    """
+    plan = ParsePlan(solved_since=date(2025, 10, 24))
+    with patch.object(
+        LxmlBackend, "get_title", autospec=True, side_effect=LxmlBackend.get_title
+    ) as get_title:
+        articles = get_backend(BACKEND_LXML).parse_page(html, plan)
+
+    assert articles == (("completed", "5045 - Tilburg", "30-10-2025", None),)
+    assert get_title.call_count == 1
+
+
+def test_get_backend_falls_back():
+    """Test fallback to the built-in parsers when the libraries are missing."""
+    with (
+        patch.object(LxmlBackend, "available", return_value=False),
+        patch.object(SelectolaxBackend, "available", return_value=False),
+    ):
+        assert get_backend(BACKEND_AUTO).name == BACKEND_STREAM
+        assert get_backend(BACKEND_LXML).name == BACKEND_HTML_PARSER
+    assert get_backend("unknown").name == BACKEND_HTML_PARSER
+
+
+@pytest.mark.asyncio
+async def test_hub_uses_configured_backend(hass, mock_aiohttp_session):
+    """Test that the hub parses in one executor job and frees the tree."""
+    hub = EnnatuurlijkPageHub(hass, parser_backend=BACKEND_HTML_PARSER)
+    with (
+        patch.object(
+            hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+        ) as executor_job,
+        patch.object(
+            BeautifulSoup, "decompose", autospec=True, side_effect=BeautifulSoup.decompose
+        ) as decompose,
+    ):
+        page = await hub.async_get_page()
+
+    assert executor_job.call_count == 1
+    assert decompose.call_count == 1
+    assert hub.stats["parser_backend"] == BACKEND_HTML_PARSER
+    assert hub.stats["parse_run_ms"] is not None
+    assert len(page.articles) == 32
+    assert page.index is not None
+
+
+@pytest.mark.asyncio
+async def test_hub_streams_body_in_executor(hass, mock_aiohttp_session, page_html):
+    """Test that the stream backend is fed the body in an executor job as it arrives."""
+    hub = EnnatuurlijkPageHub(hass, parser_backend=BACKEND_STREAM)
+    with (
+        patch.object(
+            hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+        ) as executor_job,
+        patch.object(
+            DisruptionStreamParser,
+            "feed",
+            autospec=True,
+            side_effect=DisruptionStreamParser.feed,
+        ) as feed,
+    ):
+        page = await hub.async_get_page()
+        assert executor_job.call_count == 1
+        assert executor_job.call_args.args[0] == hub._stream_parse
+        assert feed.call_count > 1
+
+        # An unchanged body matches the kept one, so no parse is started
+        hub._page_monotonic = None
+        await hub.async_get_page()
+        assert executor_job.call_count == 1
+
+        # A changed body is streamed from the start once it differs
+        session = mock_aiohttp_session.return_value
+        session._load_fixture = lambda _: page_html.replace(
+            "9832 - Breda", "9832 - Oosterhout"
+        )
+        hub._page_monotonic = None
+        changed = await hub.async_get_page()
+        assert executor_job.call_count == 2
+
+    assert page.articles == parse_page(build_soup(page_html))
+    assert "9832 - Oosterhout" in {article[1] for article in changed.articles}
+    assert hub.stats["parses"] == 2
+    assert hub.stats["hash_hits"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", [BACKEND_HTML_PARSER, BACKEND_STREAM])
+async def test_hub_stops_reading_after_last_section(
+    hass, mock_aiohttp_session, page_html, name
+):
+    """Test that the download ends once the completed section is closed."""
+    hub = EnnatuurlijkPageHub(hass, parser_backend=name)
+    with patch(
+        "custom_components.ennatuurlijk_disruptions.hub.STREAM_CHUNK_SIZE", 4096
+    ):
+        page = await hub.async_get_page()
+
+    assert page.articles == parse_page(build_soup(page_html))
+    assert hub.stats["early_stops"] == 1
+    assert hub.stats["body_bytes"] < len(page_html.encode())
+
+
+@pytest.mark.asyncio
+async def test_body_hash_ignores_chunking(hass, mock_aiohttp_session):
+    """Test that an early stopped page hashes the same for any chunk size."""
+    hashes = set()
+    for chunk_size in (1000, 4096, 7000):
+        hub = EnnatuurlijkPageHub(hass)
+        with patch(
+            "custom_components.ennatuurlijk_disruptions.hub.STREAM_CHUNK_SIZE",
+            chunk_size,
+        ):
+            await hub.async_get_page()
+        assert hub.stats["early_stops"] == 1
+        hashes.add(hub._body_hash)
+
+    assert len(hashes) == 1
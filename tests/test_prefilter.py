@@ -0,0 +1,108 @@
+"""Tests for the raw text location prefilter."""
+
+from dataclasses import replace
+
+import pytest
+
+from custom_components.ennatuurlijk_disruptions.location_index import LocationIndex
+from custom_components.ennatuurlijk_disruptions.parser import (
+    FULL_PLAN,
+    build_soup,
+    parse_page,
+)
+from custom_components.ennatuurlijk_disruptions.parser_backends import (
+    BACKEND_HTML_PARSER,
+    BACKEND_LXML,
+    BACKEND_SELECTOLAX,
+    BACKEND_STREAM,
+    get_backend,
+)
+from custom_components.ennatuurlijk_disruptions.prefilter import (
+    LocationMatcher,
+    prefilter_body,
+)
+
+LOCATIONS = [
+    ("Tilburg", "5045AB"),
+    ("Breda", "4811AA"),
+    ("Maastricht", "6211AB"),
+]
+OPTIONAL_BACKENDS = {BACKEND_LXML: "lxml", BACKEND_SELECTOLAX: "selectolax"}
+
+
+@pytest.fixture
+def page_html(load_fixture):
+    """Return the storingen page fixture."""
+    return load_fixture("ennatuurlijk_storingen.html")
+
+
+def _matched(articles, town, postal_code):
+    index = LocationIndex(articles)
+    return [articles[i] for i in index.lookup(town, postal_code)]
+
+
+@pytest.mark.parametrize(
+    "name", [BACKEND_HTML_PARSER, BACKEND_LXML, BACKEND_SELECTOLAX, BACKEND_STREAM]
+)
+def test_prefiltered_page_keeps_location_articles(page_html, name):
+    """Test that every location finds the same articles in the reduced page."""
+    if name in OPTIONAL_BACKENDS:
+        pytest.importorskip(OPTIONAL_BACKENDS[name])
+    full = parse_page(build_soup(page_html))
+    plan = replace(FULL_PLAN, locations=frozenset(LOCATIONS))
+
+    result = prefilter_body(page_html.encode(), "utf-8", plan)
+    articles = get_backend(name).parse_bytes(result.body, result.encoding, plan)
+
+    assert result.hits + result.misses == len(full)
+    assert len(articles) == result.hits < len(full)
+    for town, postal_code in LOCATIONS:
+        assert _matched(articles, town, postal_code) == _matched(
+            full, town, postal_code
+        )
+
+
+def test_prefilter_counts_hits_per_section(page_html):
+    """Test the hit and miss counts and that only the planned sections are kept."""
+    plan = replace(
+        FULL_PLAN,
+        sections=("current", "planned"),
+        locations=frozenset({("Tilburg", "5045AB")}),
+    )
+
+    result = prefilter_body(page_html.encode(), None, plan)
+
+    assert (result.hits, result.misses) == (6, 10)
+    assert b'id="completed"' not in result.body
+
+
+@pytest.mark.parametrize(
+    ("locations", "charset"),
+    [
+        (None, "utf-8"),
+        (frozenset({("Ærøskøbing", "")}), "utf-8"),
+        (frozenset({("Tilburg", "5045AB")}), "utf-16"),
+    ],
+)
+def test_unfiltered_bodies(page_html, locations, charset):
+    """Test that bodies the prefilter cannot scan are parsed as they are."""
+    plan = replace(FULL_PLAN, locations=locations)
+    assert prefilter_body(page_html.encode(charset), charset, plan) is None
+
+
+@pytest.mark.parametrize(
+    ("fragment", "expected"),
+    [
+        (b"<h4>9840 - tilburg</h4>", True),
+        (b"<h4>werkzaamheden 5045 ab reeshof</h4>", True),
+        (b"<h4>storing 15045 bredaseweg</h4>", False),
+        (b"<h4>onderhoud breda</h4>", False),
+        # Possibly another spelling of a monitored town
+        (b"<h4>storing &#116;ilburg</h4>", True),
+        ("<h4>storing tílburg</h4>".encode(), True),
+    ],
+)
+def test_matcher_is_conservative(fragment, expected):
+    """Test token boundaries and the fragments that always hit."""
+    matcher = LocationMatcher.for_locations([("Tilburg", "5045AB")])
+    assert matcher.hits(fragment) is expected
@@ -0,0 +1,87 @@
+"""Tests for the parse worker process."""
+
+import os
+import signal
+import time
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.ennatuurlijk_disruptions.hub import EnnatuurlijkPageHub
+from custom_components.ennatuurlijk_disruptions.parser_backends import (
+    BACKEND_HTML_PARSER,
+    get_backend,
+)
+from custom_components.ennatuurlijk_disruptions.process_parser import (
+    ParseWorker,
+    ParseWorkerError,
+)
+
+
+def test_worker_parses_and_restarts_after_crash(load_fixture):
+    """Test parsing in the worker process and replacing a crashed one."""
+    raw = load_fixture("ennatuurlijk_storingen.html").encode()
+    expected = get_backend(BACKEND_HTML_PARSER).parse_bytes(raw, "utf-8")
+    worker = ParseWorker(timeout=60)
+    try:
+        worker.start(BACKEND_HTML_PARSER)
+        assert worker.parse(raw, "utf-8", BACKEND_HTML_PARSER) == expected
+
+        os.kill(worker._pid, signal.SIGKILL)
+        with pytest.raises(ParseWorkerError):
+            worker.parse(raw, "utf-8", BACKEND_HTML_PARSER)
+        assert worker.restarts == 1
+
+        assert worker.parse(raw, "utf-8", BACKEND_HTML_PARSER) == expected
+    finally:
+        worker.shutdown(wait=True)
+
+
+def test_worker_does_not_import_home_assistant():
+    """Test that the worker loads the parser without the integration's __init__."""
+    worker = ParseWorker(timeout=60)
+    try:
+        worker.start(BACKEND_HTML_PARSER)
+        imported = worker._run(
+            eval,
+            "sorted(m for m in __import__('sys').modules"
+            " if m.startswith(('homeassistant', 'custom_components')))",
+        )
+    finally:
+        worker.shutdown(wait=True)
+
+    assert "homeassistant" not in imported
+    assert "custom_components.ennatuurlijk_disruptions.parser" in imported
+
+
+def test_hung_worker_is_replaced():
+    """Test that a worker that does not answer in time is stopped and replaced."""
+    worker = ParseWorker(timeout=3)
+    try:
+        worker.start(BACKEND_HTML_PARSER)
+        hung_pid = worker._pid
+        with pytest.raises(ParseWorkerError):
+            worker._run(time.sleep, 30)
+        assert worker.restarts == 1
+
+        worker.start(BACKEND_HTML_PARSER)
+        assert worker._pid != hung_pid
+    finally:
+        worker.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_hub_falls_back_to_thread(hass, mock_aiohttp_session):
+    """Test that the hub parses in a thread when the worker fails."""
+    hub = EnnatuurlijkPageHub(
+        hass, parser_backend=BACKEND_HTML_PARSER, parse_in_process=True
+    )
+    with patch.object(
+        ParseWorker, "parse", side_effect=ParseWorkerError("Parse worker failed")
+    ):
+        page = await hub.async_get_page()
+    hub.async_shutdown()
+
+    assert len(page.articles) == 32
+    assert hub.stats["worker_fallbacks"] == 1
+    assert hub.stats["parse_worker"] == "thread"
@@ -0,0 +1,158 @@
+"""Tests for fetch retries and the circuit breaker."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+from custom_components.ennatuurlijk_disruptions.coordinator import (
+    EnnatuurlijkCoordinator,
+)
+from custom_components.ennatuurlijk_disruptions.hub import EnnatuurlijkPageHub
+from custom_components.ennatuurlijk_disruptions.resilience import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    EnnatuurlijkFetchError,
+)
+
+from .conftest import MockSession
+
+
+class FlakySession(MockSession):
+    """Mock session failing the first ``failures`` requests."""
+
+    def __init__(self, load_fixture, failures, error=None):
+        super().__init__(load_fixture)
+        self.failures = failures
+        self.error = error or aiohttp.ClientConnectionError("connection reset")
+
+    def get(self, url, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            self.requests.append(kwargs.get("headers") or {})
+            raise self.error
+        return super().get(url, **kwargs)
+
+
+@pytest.fixture
+def no_backoff():
+    """Retry without sleeping."""
+    with patch(
+        "custom_components.ennatuurlijk_disruptions.hub.backoff_delay",
+        return_value=0,
+    ):
+        yield
+
+
+@pytest.fixture
+def flaky_session(load_fixture):
+    """Patch the client session with a FlakySession factory."""
+    with patch(
+        "homeassistant.helpers.aiohttp_client.async_get_clientsession"
+    ) as mock_get_session:
+
+        def _install(failures, error=None):
+            session = FlakySession(load_fixture, failures, error)
+            mock_get_session.return_value = session
+            return session
+
+        yield _install
+
+
+def test_breaker_opens_and_half_opens():
+    """Test the closed -> open -> half-open -> closed cycle."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker._opened_at -= 61
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.before_request()
+
+    # A failed probe opens the breaker again immediately
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+
+    breaker._opened_at -= 61
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(hass, flaky_session, no_backoff):
+    """Test that a transient error is retried within the same fetch."""
+    session = flaky_session(failures=2)
+    hub = EnnatuurlijkPageHub(hass)
+
+    page = await hub.async_get_page()
+
+    assert page.articles
+    assert len(session.requests) == 3
+    assert hub.stats["retries"] == 2
+    assert hub.stats["breaker_state"] == STATE_CLOSED
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(hass, flaky_session, no_backoff):
+    """Test that a 404 fails immediately."""
+    error = aiohttp.ClientResponseError(None, (), status=404)
+    session = flaky_session(failures=5, error=error)
+    hub = EnnatuurlijkPageHub(hass)
+
+    with pytest.raises(EnnatuurlijkFetchError):
+        await hub.async_get_page()
+
+    assert len(session.requests) == 1
+    assert hub.stats["failed_fetches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_is_surfaced_and_data_kept(hass, flaky_session, no_backoff):
+    """Test that a failed refresh marks the coordinator failed without wiping data."""
+    flaky_session(failures=0)
+    hub = EnnatuurlijkPageHub(hass)
+    coordinator = EnnatuurlijkCoordinator(
+        hass, SimpleNamespace(data={"town": "Tilburg", "postal_code": "5045AB"}), hub=hub
+    )
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    planned = coordinator.planned
+
+    flaky_session(failures=10)
+    hub._page_monotonic = None
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.planned == planned
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_stops_requests(hass, flaky_session, no_backoff):
+    """Test that the breaker short-circuits fetches after repeated failures."""
+    session = flaky_session(failures=100)
+    hub = EnnatuurlijkPageHub(hass)
+    for _ in range(hub.breaker.failure_threshold):
+        with pytest.raises(EnnatuurlijkFetchError):
+            await hub.async_get_page()
+    requests = len(session.requests)
+    assert hub.stats["breaker_state"] == STATE_OPEN
+
+    with pytest.raises(CircuitOpenError):
+        await hub.async_get_page()
+    assert len(session.requests) == requests
+
+    # Half-open allows a single probe without retries
+    hub.breaker._opened_at -= hub.breaker.reset_seconds
+    with pytest.raises(EnnatuurlijkFetchError):
+        await hub.async_get_page()
+    assert len(session.requests) == requests + 1
+    assert hub.stats["breaker_state"] == STATE_OPEN
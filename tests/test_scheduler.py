@@ -0,0 +1,122 @@
+"""Tests for the adaptive polling interval."""
+
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+from freezegun import freeze_time
+
+from custom_components.ennatuurlijk_disruptions.const import (
+    CONF_QUIET_HOURS,
+    CONF_UPDATE_INTERVAL,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+)
+from custom_components.ennatuurlijk_disruptions.coordinator import (
+    EnnatuurlijkCoordinator,
+)
+from custom_components.ennatuurlijk_disruptions.models import Disruption
+from custom_components.ennatuurlijk_disruptions.scheduler import (
+    adaptive_interval,
+    has_activity,
+    in_quiet_hours,
+    parse_quiet_hours,
+)
+
+BASELINE = timedelta(minutes=120)
+NOON = datetime(2025, 10, 30, 12, 0)
+MIDNIGHT = datetime(2025, 10, 30, 0, 30)
+
+
+def test_parse_quiet_hours():
+    """Test parsing of quiet hours windows."""
+    assert parse_quiet_hours("") == ()
+    assert parse_quiet_hours("23:00-07:00, 12:00-13:30") == (
+        (time(23), time(7)),
+        (time(12), time(13, 30)),
+    )
+    with pytest.raises(ValueError):
+        parse_quiet_hours("23:00")
+    with pytest.raises(ValueError):
+        parse_quiet_hours("late-early")
+
+
+def test_in_quiet_hours_wraps_midnight():
+    """Test that windows crossing midnight are handled."""
+    windows = parse_quiet_hours("23:00-07:00")
+    assert in_quiet_hours(time(23, 30), windows)
+    assert in_quiet_hours(time(6, 59), windows)
+    assert not in_quiet_hours(time(7), windows)
+    assert not in_quiet_hours(time(12), windows)
+
+
+def test_has_activity():
+    """Test detection of current and today's planned disruptions."""
+    today = date(2025, 10, 30)
+
+    def _dates(status, day):
+        return {"dates": [Disruption(1, status, "1234 - Tilburg", day, None)]}
+
+    planned_today = _dates("planned", today)
+    planned_later = _dates("planned", date(2025, 10, 31))
+    empty = {"dates": []}
+    assert has_activity({"current": _dates("current", date(2025, 10, 29))}, today)
+    assert has_activity({"current": empty, "planned": planned_today}, today)
+    assert not has_activity({"current": empty, "planned": planned_later}, today)
+    assert not has_activity(None, today)
+
+
+@pytest.mark.parametrize(
+    ("active", "now", "quiet", "expected"),
+    [
+        (True, NOON, "", 30),
+        (False, NOON, "", 240),
+        (False, MIDNIGHT, "23:00-07:00", 480),
+        (True, MIDNIGHT, "23:00-07:00", 120),
+        (False, MIDNIGHT, "", 240),
+    ],
+)
+def test_adaptive_interval(active, now, quiet, expected):
+    """Test tightening, backing off and quiet hours."""
+    interval = adaptive_interval(BASELINE, active, now, parse_quiet_hours(quiet))
+    assert interval == timedelta(minutes=expected)
+
+
+def test_adaptive_interval_bounds():
+    """Test that the hard bounds are enforced."""
+    assert adaptive_interval(timedelta(minutes=8), True, NOON) == timedelta(
+        minutes=MIN_UPDATE_INTERVAL
+    )
+    assert adaptive_interval(timedelta(hours=20), False, NOON) == timedelta(
+        minutes=MAX_UPDATE_INTERVAL
+    )
+
+
+@pytest.mark.asyncio
+@freeze_time("2025-10-30 12:00:00")
+async def test_coordinators_share_adapted_interval(hass, mock_aiohttp_session):
+    """Test that an active location tightens the interval for every location."""
+    await hass.config.async_set_time_zone("UTC")
+    main_entry = SimpleNamespace(
+        options={CONF_UPDATE_INTERVAL: 120, CONF_QUIET_HOURS: ""}
+    )
+    # Heerlen has a current disruption in the fixture, Nowhere has none
+    quiet = EnnatuurlijkCoordinator(
+        hass,
+        SimpleNamespace(data={"town": "Nowhere", "postal_code": "0000ZZ"}),
+        main_entry,
+    )
+    active = EnnatuurlijkCoordinator(
+        hass,
+        SimpleNamespace(data={"town": "Heerlen", "postal_code": "6411AB"}),
+        main_entry,
+        hub=quiet.hub,
+    )
+
+    await quiet.async_refresh()
+    assert quiet.update_interval == timedelta(minutes=240)
+
+    await active.async_refresh()
+    assert active.update_interval == timedelta(minutes=30)
+    assert quiet.update_interval == timedelta(minutes=30)
+    assert active.baseline_interval == timedelta(minutes=120)
@@ -0,0 +1,126 @@
+"""Tests for the derived section views."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from freezegun import freeze_time
+
+from custom_components.ennatuurlijk_disruptions.binary_sensor_types import (
+    BINARY_SENSOR_TYPES,
+)
+from custom_components.ennatuurlijk_disruptions.coordinator import (
+    EnnatuurlijkCoordinator,
+)
+from custom_components.ennatuurlijk_disruptions.entity import (
+    EnnatuurlijkBinarySensor,
+    EnnatuurlijkSensor,
+)
+from custom_components.ennatuurlijk_disruptions.models import Disruption
+from custom_components.ennatuurlijk_disruptions.sensor_types import SENSOR_TYPES
+from custom_components.ennatuurlijk_disruptions.views import build_section_view
+
+TODAY = date(2025, 10, 30)
+
+
+def _section(*days):
+    return {
+        "state": True,
+        "dates": [
+            Disruption(i, "planned", f"98{i} - Tilburg", day, f"/storingen/{i}")
+            for i, day in enumerate(days)
+        ],
+        "last_update_date": "2025-10-30 12:00",
+    }
+
+
+def test_build_section_view():
+    """Test the derived values of a section."""
+    view = build_section_view(
+        _section(date(2025, 11, 4), date(2025, 10, 28), date(2025, 11, 1)), TODAY
+    )
+
+    assert view.sorted_dates == (date(2025, 10, 28), date(2025, 11, 1), date(2025, 11, 4))
+    assert view.next_date == date(2025, 11, 1)
+    # Two days either side: the first on the page wins
+    assert view.closest.title == "981 - Tilburg"
+    assert view.days_since == 2
+    assert view.days_until == -2
+    assert not view.is_today
+    assert view.count == 3
+    assert view.date_dicts[0] == {
+        "description": "980 - Tilburg",
+        "date": "04-11-2025",
+        "link": "/storingen/0",
+    }
+
+
+def test_empty_section_view():
+    """Test a section without disruptions."""
+    view = build_section_view({"state": False, "dates": []}, TODAY)
+
+    assert view.next_date is None
+    assert view.closest is None
+    assert view.days_until is None
+    assert not view.is_today
+
+
+def test_descriptors_read_the_view():
+    """Test sensor and binary sensor values computed from a view."""
+    view = build_section_view(_section(TODAY, date(2025, 11, 2)), TODAY)
+    planned = next(d for d in SENSOR_TYPES if d.key == "planned")
+    alert = next(d for d in BINARY_SENSOR_TYPES if d.key == "planned_alert")
+
+    attributes = planned.attributes_fn(view, "Planned")
+
+    assert planned.value_fn(view) == "2025-10-30"
+    assert attributes["days_until_planned_date"] == 0
+    assert attributes["is_planned_date_today"] is True
+    assert attributes["disruption_count"] == 2
+    assert attributes["dates"] is view.date_dicts
+    assert alert.is_on_fn(view) is True
+
+
+@pytest.mark.asyncio
+async def test_coordinator_rebuilds_views_on_new_data_or_day(hass):
+    """Test that views are cached until the data or the date changes."""
+    await hass.config.async_set_time_zone("UTC")
+    coordinator = EnnatuurlijkCoordinator(
+        hass, SimpleNamespace(data={"town": "Tilburg", "postal_code": "5045AB"})
+    )
+    coordinator.data = {"planned": _section(date(2025, 11, 1))}
+
+    with freeze_time("2025-10-30 12:00"):
+        view = coordinator.view("planned")
+        assert coordinator.view("planned") is view
+        assert view.days_until == 2
+
+    with freeze_time("2025-10-31 00:01"):
+        assert coordinator.view("planned").days_until == 1
+
+        coordinator.data = {"planned": _section(date(2025, 11, 5))}
+        assert coordinator.view("planned").days_until == 5
+
+
+def test_section_view_caps_listed_disruptions():
+    """Test that only max_listed disruptions get attribute dicts."""
+    view = build_section_view(
+        _section(date(2025, 11, 1), date(2025, 11, 2), date(2025, 11, 3)), TODAY, 2
+    )
+    alert = next(d for d in BINARY_SENSOR_TYPES if d.key == "planned_alert")
+
+    attributes = alert.attributes_fn(view)
+
+    assert len(view.date_dicts) == 2
+    assert view.truncated
+    assert view.summary == "#0 2025-11-01, #1 2025-11-02 (+1 more)"
+    assert attributes["disruption_count"] == 3
+    assert attributes["dates_truncated"] is True
+    assert not build_section_view(_section(date(2025, 11, 1)), TODAY, 2).truncated
+
+
+def test_dates_attribute_is_not_recorded():
+    """Test that the bulky dates list is excluded from the recorder."""
+    assert "dates" in EnnatuurlijkSensor._unrecorded_attributes
+    assert "dates" in EnnatuurlijkBinarySensor._unrecorded_attributes
+    assert "summary" not in EnnatuurlijkSensor._unrecorded_attributes